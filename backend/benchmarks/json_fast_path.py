@@ -0,0 +1,108 @@
+"""Compare the previous JSON paths against the fast paths used by the API and the integration clients.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.json_fast_path
+"""
+
+import json
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from src.enums import Environment
+from src.integrations.gitlab.schemas import GITLAB_MEMBERS, GitLabMember
+from src.integrations.sonarqube.schemas import QualityGateResponse, QualityGateStatus
+from src.schemas import ProjectOverview, StageStatus
+
+ITERATIONS: int = 2_000
+
+MEMBERS_PAYLOAD: bytes = json.dumps(
+    [
+        {
+            "id": index,
+            "username": f"user{index}",
+            "name": f"User {index}",
+            "state": "active",
+            "access_level": 30,
+            "web_url": f"https://gitlab.example.com/user{index}",
+            "avatar_url": f"https://gitlab.example.com/uploads/user{index}.png",
+            "created_at": "2026-01-01T00:00:00Z",
+        }
+        for index in range(50)
+    ]
+).encode()
+
+QUALITY_GATE_PAYLOAD: bytes = json.dumps(
+    {
+        "projectStatus": {
+            "status": "OK",
+            "conditions": [
+                {
+                    "status": "OK",
+                    "metricKey": f"metric_{index}",
+                    "comparator": "LT",
+                    "errorThreshold": "80",
+                    "actualValue": "92.1",
+                }
+                for index in range(8)
+            ],
+        }
+    }
+).encode()
+
+
+def _overview() -> ProjectOverview:
+    return ProjectOverview(
+        id=uuid4(),
+        name="Benchmark project",
+        url_repository="git@gitlab.example.com:group/benchmark-project.git",
+        created_at=datetime.now(UTC),
+        quality_gate=QualityGateResponse.model_validate_json(QUALITY_GATE_PAYLOAD).project_status,
+        members=GITLAB_MEMBERS.validate_json(MEMBERS_PAYLOAD),
+        stages=[StageStatus(stage=environment, is_ready=True) for environment in Environment],
+    )
+
+
+def _measure(operation: Callable[[], Any]) -> float:
+    """Best per-call time in microseconds."""
+    return min(timeit.repeat(operation, number=ITERATIONS, repeat=5)) / ITERATIONS * 1_000_000
+
+
+def _report(name: str, baseline: Callable[[], Any], fast_path: Callable[[], Any]) -> None:
+    before: float = _measure(baseline)
+    after: float = _measure(fast_path)
+    sys.stdout.write(
+        f"{name:<36} {before:>9.1f} us {after:>9.1f} us {before - after:>9.1f} us {before / after:>6.2f}x\n"
+    )
+
+
+def main() -> None:
+    overview: ProjectOverview = _overview()
+
+    sys.stdout.write(f"{'operation':<36} {'before':>12} {'after':>12} {'saved':>12} {'speedup':>7}\n")
+
+    _report(
+        "gitlab.list_project_members (50)",
+        lambda: [GitLabMember.model_validate(member) for member in json.loads(MEMBERS_PAYLOAD)],
+        lambda: GITLAB_MEMBERS.validate_json(MEMBERS_PAYLOAD),
+    )
+    _report(
+        "sonarqube.get_quality_gate_status",
+        lambda: QualityGateStatus.model_validate(json.loads(QUALITY_GATE_PAYLOAD)["projectStatus"]),
+        lambda: QualityGateResponse.model_validate_json(QUALITY_GATE_PAYLOAD).project_status,
+    )
+    _report(
+        "GET /projects/{id} (cached body)",
+        lambda: json.dumps(jsonable_encoder(overview), ensure_ascii=False, separators=(",", ":")).encode(),
+        lambda: overview.model_dump_json(by_alias=True).encode(),
+    )
+
+
+if __name__ == "__main__":
+    main()
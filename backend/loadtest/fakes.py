@@ -0,0 +1,347 @@
+"""Local stand-ins for GitLab, SonarQube, Logfire, Jira and Gemini.
+
+Only the endpoints called by ``src.integrations`` are implemented; each upstream lives under its own
+prefix so a single process can serve all of them::
+
+    uv run uvicorn loadtest.fakes:app --port 9000
+"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from itertools import count
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+
+from .settings import FakeSettings
+
+settings: FakeSettings = FakeSettings()
+app: FastAPI = FastAPI(title="Carli fake upstreams")
+
+_ids = count(1)
+_projects: dict[int, dict[str, Any]] = {}
+_members: dict[int, list[dict[str, Any]]] = {}
+_sonarqube_projects: dict[str, dict[str, Any]] = {}
+_logfire_projects: dict[str, dict[str, Any]] = {}
+_logfire_channels: dict[str, dict[str, Any]] = {}
+_users: dict[int, str] = {}
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+@app.middleware("http")
+async def inject_faults(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    upstream: str = request.url.path.strip("/").split("/", 1)[0]
+    latency_ms: float = settings.UPSTREAM_LATENCY_MS.get(upstream, settings.LATENCY_MS)
+    jitter_ms: float = random.uniform(-settings.JITTER_MS, settings.JITTER_MS)  # noqa: S311
+    await asyncio.sleep(max(latency_ms + jitter_ms, 0) / 1000)
+
+    roll: float = random.random()  # noqa: S311
+    if roll < settings.RATE_LIMIT_RATE:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"message": "rate limited"},
+            headers={"Retry-After": str(settings.RETRY_AFTER_SECONDS)},
+        )
+
+    if roll < settings.RATE_LIMIT_RATE + settings.ERROR_RATE:
+        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"message": "injected"})
+
+    return await call_next(request)
+
+
+# GitLab
+
+
+def _gitlab_member(user_name: str, access_level: int) -> dict[str, Any]:
+    return {"id": next(_ids), "username": user_name, "name": user_name, "state": "active", "access_level": access_level}
+
+
+def _protected_branch(name: str, push_access_level: int, merge_access_level: int) -> dict[str, Any]:
+    return {
+        "id": next(_ids),
+        "name": name,
+        "push_access_levels": [{"access_level": push_access_level}],
+        "merge_access_levels": [{"access_level": merge_access_level}],
+    }
+
+
+@app.post("/gitlab/api/v4/projects", status_code=status.HTTP_201_CREATED)
+async def gitlab_create_project(payload: dict[str, Any]) -> dict[str, Any]:
+    project_id: int = next(_ids)
+    path: str = payload["name"].lower().replace(" ", "-")
+    project: dict[str, Any] = {
+        "id": project_id,
+        "name": payload["name"],
+        "path": path,
+        "path_with_namespace": f"carli/{path}",
+        "namespace": {"id": payload["namespace_id"], "full_path": "carli"},
+        "ssh_url_to_repo": f"git@gitlab.local:carli/{path}.git",
+        "http_url_to_repo": f"http://gitlab.local/carli/{path}.git",
+        "web_url": f"http://gitlab.local/carli/{path}",
+        "default_branch": "main",
+        "visibility": payload.get("visibility", "private"),
+        "created_at": _now(),
+    }
+    _projects[project_id] = project
+    _members[project_id] = []
+    return project
+
+
+@app.delete("/gitlab/api/v4/projects/{project_id}", status_code=status.HTTP_202_ACCEPTED)
+async def gitlab_delete_project(project_id: int) -> dict[str, str]:
+    _projects.pop(project_id, None)
+    _members.pop(project_id, None)
+    return {"message": "202 Accepted"}
+
+
+@app.get("/gitlab/api/v4/groups/{group_id}/projects")
+async def gitlab_list_group_projects(
+    response: Response, group_id: int, page: int = 1, per_page: int = 20
+) -> list[dict[str, Any]]:
+    projects: list[dict[str, Any]] = sorted(_projects.values(), key=lambda project: project["id"])
+    total_pages: int = max(-(-len(projects) // per_page), 1)
+    response.headers["x-total-pages"] = str(total_pages)
+    response.headers["x-next-page"] = str(page + 1) if page < total_pages else ""
+    return projects[(page - 1) * per_page : page * per_page]
+
+
+@app.post("/gitlab/api/v4/projects/{project_id}/repository/branches", status_code=status.HTTP_201_CREATED)
+async def gitlab_create_branch(project_id: int, branch: str, ref: str) -> dict[str, Any]:
+    return {"name": branch, "merged": False, "protected": False, "web_url": f"http://gitlab.local/{project_id}/{ref}"}
+
+
+@app.patch("/gitlab/api/v4/projects/{project_id}/protected_branches/{branch_name:path}")
+async def gitlab_update_protected_branch(project_id: int, branch_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return _protected_branch(branch_name, payload["push_access_level"], payload["merge_access_level"])
+
+
+@app.post("/gitlab/api/v4/projects/{project_id}/protected_branches", status_code=status.HTTP_201_CREATED)
+async def gitlab_protect_branch(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    return _protected_branch(payload["name"], payload["push_access_level"], payload["merge_access_level"])
+
+
+@app.post("/gitlab/api/v4/projects/{project_id}/repository/commits", status_code=status.HTTP_201_CREATED)
+async def gitlab_create_commit(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    commit_id: str = uuid4().hex + uuid4().hex[:8]
+    return {
+        "id": commit_id,
+        "short_id": commit_id[:8],
+        "title": payload["commit_message"].splitlines()[0],
+        "message": payload["commit_message"],
+        "author_name": "carli",
+    }
+
+
+@app.head("/gitlab/api/v4/projects/{project_id}/repository/files/{file_path:path}")
+async def gitlab_file_metadata(project_id: int, file_path: str, ref: str) -> Response:
+    return Response(headers={"X-Gitlab-Blob-Id": uuid4().hex + uuid4().hex[:8], "X-Gitlab-Ref": ref})
+
+
+@app.get("/gitlab/api/v4/projects/{project_id}/repository/branches/{branch:path}")
+async def gitlab_get_branch(project_id: int, branch: str) -> Response:
+    return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+
+@app.get("/gitlab/api/v4/projects/{project_id}/merge_requests")
+async def gitlab_list_merge_requests(project_id: int) -> list[dict[str, Any]]:
+    return []
+
+
+@app.post("/gitlab/api/v4/projects/{project_id}/merge_requests", status_code=status.HTTP_201_CREATED)
+async def gitlab_create_merge_request(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    iid: int = next(_ids)
+    return {
+        "id": iid,
+        "iid": iid,
+        "title": payload["title"],
+        "source_branch": payload["source_branch"],
+        "target_branch": payload["target_branch"],
+        "web_url": f"https://gitlab.fake/projects/{project_id}/merge_requests/{iid}",
+    }
+
+
+@app.post("/gitlab/api/v4/projects/{project_id}/members", status_code=status.HTTP_201_CREATED)
+async def gitlab_add_member(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    member: dict[str, Any] = _gitlab_member(_users.get(payload["user_id"], "developer"), payload["access_level"])
+    _members.setdefault(project_id, []).append(member)
+    return member
+
+
+@app.get("/gitlab/api/v4/projects/{project_id}/members")
+async def gitlab_list_members(project_id: int) -> list[dict[str, Any]]:
+    return _members.get(project_id) or [_gitlab_member("maintainer", 40)]
+
+
+@app.get("/gitlab/api/v4/users")
+async def gitlab_list_users(search: str = "") -> list[dict[str, Any]]:
+    user_name: str = search or "developer"
+    user_id: int = next(_ids)
+    _users[user_id] = user_name
+    return [{"id": user_id, "username": user_name, "name": user_name, "state": "active"}]
+
+
+# SonarQube
+
+
+@app.post("/sonarqube/api/projects/create")
+async def sonarqube_create_project(name: str, project: str, visibility: str = "private") -> dict[str, Any]:
+    _sonarqube_projects[project] = {"key": project, "name": name, "qualifier": "TRK", "visibility": visibility}
+    return {"project": _sonarqube_projects[project]}
+
+
+@app.post("/sonarqube/api/projects/delete", status_code=status.HTTP_204_NO_CONTENT)
+async def sonarqube_delete_project(project: str) -> None:
+    _sonarqube_projects.pop(project, None)
+
+
+@app.get("/sonarqube/api/projects/search")
+async def sonarqube_search_projects(p: int = 1, ps: int = 100) -> dict[str, Any]:
+    components: list[dict[str, Any]] = list(_sonarqube_projects.values())
+    return {
+        "paging": {"pageIndex": p, "pageSize": ps, "total": len(components)},
+        "components": components[(p - 1) * ps : p * ps],
+    }
+
+
+@app.post("/sonarqube/api/user_tokens/generate")
+async def sonarqube_generate_token(name: str, projectKey: str, type: str) -> dict[str, Any]:  # noqa: N803
+    return {"name": name, "token": uuid4().hex, "type": type, "projectKey": projectKey}
+
+
+@app.post("/sonarqube/api/alm_settings/set_gitlab_binding", status_code=status.HTTP_204_NO_CONTENT)
+async def sonarqube_set_gitlab_binding(almSetting: str, project: str, repository: str) -> None:  # noqa: N803
+    return None
+
+
+@app.get("/sonarqube/api/measures/search")
+async def sonarqube_search_measures(projectKeys: str, metricKeys: str) -> dict[str, Any]:  # noqa: N803
+    values: dict[str, str] = {"alert_status": "OK", "coverage": "87.5"}
+    return {
+        "measures": [
+            {"component": key, "metric": metric, "value": values.get(metric, "0")}
+            for key in projectKeys.split(",")
+            for metric in metricKeys.split(",")
+        ]
+    }
+
+
+@app.get("/sonarqube/api/qualitygates/project_status")
+async def sonarqube_quality_gate(projectKey: str) -> dict[str, Any]:  # noqa: N803
+    return {
+        "projectStatus": {
+            "status": "OK",
+            "conditions": [
+                {
+                    "status": "OK",
+                    "metricKey": "new_coverage",
+                    "comparator": "LT",
+                    "errorThreshold": "80",
+                    "actualValue": "87.5",
+                },
+            ],
+        }
+    }
+
+
+# Logfire
+
+
+@app.post("/logfire/v1/projects/")
+async def logfire_create_project(payload: dict[str, Any]) -> dict[str, Any]:
+    project_id: str = str(uuid4())
+    _logfire_projects[project_id] = {
+        "id": project_id,
+        "project_name": payload["project_name"],
+        "created_at": _now(),
+        "description": payload.get("description"),
+        "organization_name": "carli",
+        "visibility": payload.get("visibility", "private"),
+    }
+    return _logfire_projects[project_id]
+
+
+@app.get("/logfire/v1/projects/")
+async def logfire_list_projects() -> list[dict[str, Any]]:
+    return list(_logfire_projects.values())
+
+
+@app.post("/logfire/v1/projects/{project_id}/write-tokens/")
+async def logfire_create_write_token(project_id: str) -> dict[str, Any]:
+    return {"id": str(uuid4()), "project_id": project_id, "created_at": _now(), "token": uuid4().hex}
+
+
+@app.get("/logfire/v1/channels/")
+async def logfire_list_channels() -> list[dict[str, Any]]:
+    return list(_logfire_channels.values())
+
+
+@app.post("/logfire/v1/channels/")
+async def logfire_create_channel(payload: dict[str, Any]) -> dict[str, Any]:
+    channel_id: str = str(uuid4())
+    _logfire_channels[channel_id] = {
+        "id": channel_id,
+        "organization_id": str(uuid4()),
+        "label": payload["label"],
+        "active": True,
+        "created_at": _now(),
+        "config": payload["config"],
+    }
+    return _logfire_channels[channel_id]
+
+
+@app.post("/logfire/v1/projects/{project_id}/alerts/")
+async def logfire_create_alert(project_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "organization_id": str(uuid4()),
+        "project_id": project_id,
+        "name": payload["name"],
+        "active": True,
+    }
+
+
+# Jira
+
+
+@app.post("/jira/rest/api/3/issue", status_code=status.HTTP_201_CREATED)
+async def jira_create_issue(payload: dict[str, Any]) -> dict[str, Any]:
+    issue_id: int = next(_ids)
+    key: str = f"{payload['fields']['project']['key']}-{issue_id}"
+    return {"id": str(issue_id), "key": key, "self": f"http://jira.local/rest/api/3/issue/{issue_id}"}
+
+
+# Gemini (generateContent answering with the pydantic-ai structured output tool call)
+
+
+@app.post("/gemini/{api_version}/models/{model}:generateContent")
+async def gemini_generate_content(api_version: str, model: str) -> dict[str, Any]:
+    return {
+        "candidates": [
+            {
+                "content": {
+                    "role": "model",
+                    "parts": [
+                        {
+                            "functionCall": {
+                                "name": "final_result",
+                                "args": {
+                                    "summary": "[Load test] Synthetic alert",
+                                    "description": "Generated by the fake Gemini upstream.",
+                                },
+                            }
+                        }
+                    ],
+                },
+                "finishReason": "STOP",
+            }
+        ],
+        "usageMetadata": {"promptTokenCount": 800, "candidatesTokenCount": 60, "totalTokenCount": 860},
+        "modelVersion": model,
+    }
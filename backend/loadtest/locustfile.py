@@ -0,0 +1,89 @@
+"""Load driver for the Carli API running against ``loadtest.fakes``.
+
+Reports p50/p95/p99 latency and throughput (req/s) per scenario in the console summary and in
+``<prefix>_stats.csv``::
+
+    uv run locust -f loadtest/locustfile.py --host http://localhost:8000 \
+        --headless --users 50 --spawn-rate 10 --run-time 2m --csv loadtest/results/run
+"""
+
+import os
+import random
+from typing import Any
+from uuid import uuid4
+
+from locust import FastHttpUser, between, task
+
+LOADTEST_EMAIL: str = os.getenv("LOADTEST_EMAIL", "loadtest@carli.local")
+LOADTEST_PASSWORD: str = os.getenv("LOADTEST_PASSWORD", "loadtest")
+
+ALERT_PAYLOAD: dict[str, Any] = {
+    "project_id": "load-test",
+    "trace_id": "0" * 32,
+    "message": "Unhandled exception",
+    "request": {"path": "/items/1", "method": "GET"},
+    "exception_message": "ZeroDivisionError: division by zero",
+    "stack_trace": 'Traceback (most recent call last):\n  File "src/main.py", line 10, in handler\nZeroDivisionError',
+}
+
+
+class ProjectUser(FastHttpUser):
+    wait_time = between(0.5, 2)
+
+    def on_start(self) -> None:
+        self.project_ids: list[str] = []
+        self.login()
+        self.list_projects()
+        if not self.project_ids:
+            self.create_project()
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    @task(1)
+    def login(self) -> None:
+        response = self.client.post(
+            "/auth/login",
+            data={"username": LOADTEST_EMAIL, "password": LOADTEST_PASSWORD},
+            name="login",
+        )
+        self.access_token: str = response.json()["access_token"]
+
+    @task(6)
+    def list_projects(self) -> None:
+        response = self.client.get("/projects/", headers=self._headers(), name="list projects")
+        self.project_ids = [project["id"] for project in response.json()]
+
+    @task(4)
+    def project_overview(self) -> None:
+        if self.project_ids:
+            self.client.get(
+                f"/projects/{random.choice(self.project_ids)}",  # noqa: S311
+                headers=self._headers(),
+                name="project overview",
+            )
+
+    @task(1)
+    def create_project(self) -> None:
+        response = self.client.post(
+            "/projects/",
+            json={
+                "name": f"load-test-{uuid4().hex[:12]}",
+                "description": "Created by the load test",
+                "project_type": "backend",
+                "members": [{"gitlab_user_name": "developer", "role": "developer"}],
+            },
+            headers=self._headers(),
+            name="create project",
+        )
+        if response.status_code == 201:
+            self.project_ids.append(response.json()["project_id"])
+
+
+class LogfireAlertSender(FastHttpUser):
+    wait_time = between(1, 5)
+    weight = 1
+
+    @task
+    def ingest_alert(self) -> None:
+        self.client.post("/webhooks/logfire/alerts", json=ALERT_PAYLOAD, name="alert ingestion")
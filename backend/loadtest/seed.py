@@ -0,0 +1,42 @@
+"""Create the administrator account used by the load driver (idempotent).
+
+Run with ``uv run python -m loadtest.seed``.
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import select
+
+from src.database import database
+from src.database.models import Role, User
+from src.utils import hash_password
+
+LOADTEST_EMAIL: str = os.getenv("LOADTEST_EMAIL", "loadtest@carli.local")
+LOADTEST_PASSWORD: str = os.getenv("LOADTEST_PASSWORD", "loadtest")
+
+
+async def seed() -> None:
+    async with database.session_scope() as session:
+        if await session.scalar(select(User.id).where(User.email == LOADTEST_EMAIL)):
+            return
+
+        role_id: int | None = await session.scalar(select(Role.id).where(Role.name == "administrator"))
+        if role_id is None:
+            raise RuntimeError("Run the migrations first: the administrator role is missing")
+
+        session.add(
+            User(
+                name="Load",
+                lastname="Test",
+                email=LOADTEST_EMAIL,
+                password=hash_password(LOADTEST_PASSWORD),
+                id_role=role_id,
+            )
+        )
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(seed())
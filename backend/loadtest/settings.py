@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class FakeSettings(BaseSettings):
+    """Fault injection for the fake upstreams, read from ``FAKE_*`` environment variables."""
+
+    model_config = SettingsConfigDict(env_prefix="FAKE_", extra="ignore")
+
+    LATENCY_MS: float = 50.0
+    JITTER_MS: float = 20.0
+    ERROR_RATE: float = 0.0
+    RATE_LIMIT_RATE: float = 0.0
+    RETRY_AFTER_SECONDS: int = 1
+    UPSTREAM_LATENCY_MS: dict[str, float] = {}
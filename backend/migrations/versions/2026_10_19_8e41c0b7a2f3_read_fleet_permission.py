@@ -0,0 +1,42 @@
+"""Read fleet permission
+
+Revision ID: 8e41c0b7a2f3
+Revises: 5cbaddbc2d5d
+Create Date: 2026-10-19 14:03:27.561920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e41c0b7a2f3"
+down_revision: Union[str, Sequence[str], None] = "5cbaddbc2d5d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        INSERT INTO permission (name, is_active)
+        VALUES ('read_fleet', TRUE)
+        """)
+    op.execute("""
+        INSERT INTO role_x_permission (id_role, id_permission, is_active)
+        SELECT r.id, p.id, TRUE
+        FROM role r
+        JOIN permission p ON p.name = 'read_fleet'
+        WHERE r.name = 'administrator'
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        DELETE FROM role_x_permission
+        WHERE id_permission IN (SELECT id FROM permission WHERE name = 'read_fleet')
+        """)
+    op.execute("DELETE FROM permission WHERE name = 'read_fleet'")
@@ -0,0 +1,50 @@
+"""Project slug
+
+Revision ID: 9b3d5f7a1c24
+Revises: e4a7b2c9d1f0
+Create Date: 2026-10-19 18:02:41.518230
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.utils import slugify
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3d5f7a1c24"
+down_revision: Union[str, Sequence[str], None] = "e4a7b2c9d1f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "project",
+        sa.Column(
+            "slug",
+            sa.String(length=150),
+            nullable=True,
+            comment="slugify(name): SonarQube key and provisioning lock key",
+        ),
+    )
+
+    # slugify strips accents through Unicode normalisation, which Postgres cannot do without unaccent
+    connection = op.get_bind()
+    for project_id, name in connection.execute(sa.text("SELECT id, name FROM project")).all():
+        connection.execute(
+            sa.text("UPDATE project SET slug = :slug WHERE id = :id"), {"slug": slugify(name), "id": project_id}
+        )
+
+    op.alter_column("project", "slug", nullable=False)
+    op.create_index(op.f("ix_project_slug"), "project", ["slug"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_project_slug"), table_name="project")
+    op.drop_column("project", "slug")
@@ -1,4 +1,6 @@
+from .frontend_builder import FrontendBuilder
+from .registry import BuilderRegistry
 from .template_file_builder import BackendBuilder
 from .template_interface_builder import TemplateInterfaceBuilder
 
-__all__: list[str] = ["BackendBuilder", "TemplateInterfaceBuilder"]
+__all__: list[str] = ["BackendBuilder", "BuilderRegistry", "FrontendBuilder", "TemplateInterfaceBuilder"]
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+
+from src.schemas import BuilderProjectData
+
+from .template_interface_builder import TemplateInterfaceBuilder
+
+
+@dataclass
+class FrontendBuilder(TemplateInterfaceBuilder):
+    """Scaffold for a frontend project; ``framework`` is the template prefix, e.g. ``frontend_next``."""
+
+    framework: str = "frontend_next"
+
+    def build(
+        self,
+        data: BuilderProjectData,
+    ) -> dict[str, str]:
+        files: dict[str, str] = {}
+
+        files.update(self.build_root_files(data))
+        files.update(self.build_docker_files(data))
+        files.update(self.build_ci_files(data))
+        files.update(self.build_package_files(data))
+
+        return files
+
+    def template_prefixes(self) -> tuple[str, ...]:
+        return (f"{self.framework}.",)
+
+    def build_root_files(self, data: BuilderProjectData) -> dict[str, str]:
+        files: dict[str, str] = {}
+
+        root_templates: dict[str, str] = {
+            "README.md": f"readme/{self.framework}.README.md.j2",
+            ".gitignore": f"git/{self.framework}.gitignore.j2",
+            "AGENT.md": f"agent/{self.framework}.AGENT.md.j2",
+            ".pre-commit-config.yaml": f"pre-commit/{self.framework}.pre-commit.yaml.j2",
+            ".vscode/launch.json": f"debug/{self.framework}.launch.json.j2",
+        }
+
+        for file_path, template in root_templates.items():
+            files[file_path] = self._render(template_path=template, data=data)
+
+        if data.codeowners:
+            files["CODEOWNERS"] = self._generate_codeowners(members=data.codeowners)
+
+        return files
+
+    def build_docker_files(self, data: BuilderProjectData) -> dict[str, str]:
+        return {"Dockerfile": self._render(f"docker/{self.framework}.Dockerfile.j2", data)}
+
+    def build_ci_files(self, data: BuilderProjectData) -> dict[str, str]:
+        return {}
+
+    def build_package_files(self, data: BuilderProjectData) -> dict[str, str]:
+        return {"package.json": self._render(f"packages/{self.framework}.package.json.j2", data)}
+
+    def build_source_files(self, data: BuilderProjectData) -> dict[str, str]:
+        return {}
+
+    def build_alembic_files(self) -> dict[str, str]:
+        return {}
+
+    def build_init_files(self) -> dict[str, str]:
+        return {}
+
+    def build_test_files(self) -> dict[str, str]:
+        return {}
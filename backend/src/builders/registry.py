@@ -0,0 +1,32 @@
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+from src.enums import Project
+from src.errors import UnsupportedProjectTypeError
+from src.schemas import BuilderProjectData
+
+from .template_interface_builder import TemplateInterfaceBuilder
+
+
+@dataclass
+class BuilderRegistry:
+    """Template builders keyed by project type; rendering runs on ``executor`` to keep the event loop free."""
+
+    builders: dict[Project, TemplateInterfaceBuilder]
+    executor: Executor | None = None
+
+    def get(self, project_type: Project) -> TemplateInterfaceBuilder:
+        try:
+            return self.builders[project_type]
+
+        except KeyError as e:
+            raise UnsupportedProjectTypeError(f"No template builder for project type {project_type}") from e
+
+    def precompile(self) -> int:
+        unique: dict[int, TemplateInterfaceBuilder] = {id(builder): builder for builder in self.builders.values()}
+        return sum(builder.precompile() for builder in unique.values())
+
+    async def render(self, project_type: Project, data: BuilderProjectData) -> dict[str, str]:
+        builder: TemplateInterfaceBuilder = self.get(project_type)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, builder.build, data)
@@ -27,6 +27,9 @@ class BackendBuilder(TemplateInterfaceBuilder):
 
         return files
 
+    def template_prefixes(self) -> tuple[str, ...]:
+        return ("backend.",)
+
     def build_root_files(self, data: BuilderProjectData) -> dict[str, str]:
         files: dict[str, str] = {}
 
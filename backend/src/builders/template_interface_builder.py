@@ -18,6 +18,9 @@ class TemplateInterfaceBuilder(ABC):
         data: BuilderProjectData,
     ) -> dict[str, str]: ...
 
+    @abstractmethod
+    def template_prefixes(self) -> tuple[str, ...]: ...
+
     @abstractmethod
     def build_root_files(self, data: BuilderProjectData) -> dict[str, str]: ...
 
@@ -42,6 +45,9 @@ class TemplateInterfaceBuilder(ABC):
     @abstractmethod
     def build_test_files(self) -> dict[str, str]: ...
 
+    def precompile(self) -> int:
+        return self.template_generator.precompile(prefixes=self.template_prefixes())
+
     def _render(self, template_path: str, data: BaseModel | None = None) -> str:
         return self.template_generator.generate(
             template_path=Path(template_path),
@@ -15,24 +15,71 @@ class Configuration(BaseSettings):
     ENVIRONMENT: Environment = Environment.DEVELOPMENT
     CORS_ORIGIN: list[str] = ["http://localhost:3000"]
     DATABASE_URL: PostgresDsn
+    DATABASE_REPLICA_URLS: list[PostgresDsn] = []
+    DATABASE_REPLICA_MAX_LAG: float = 5.0
+    DATABASE_REPLICA_CHECK_INTERVAL: float = 10.0
+    RESPONSE_CACHE_TTL: float = 15.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    FLEET_CACHE_TTL: float = 60.0
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_WAIT_SECONDS: float = 60.0
+    IDEMPOTENCY_LEASE_SECONDS: float = 60.0
+    CACHE_CONTROL: dict[str, str] = {
+        "list_projects": "private, no-cache",
+        "get_project": "private, max-age=15",
+    }
     SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRES: int = 30
+    HTTP_TIMEOUT: int = 30
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    EXECUTOR_MAX_WORKERS: int = 4
+    EVENT_LOOP_MONITOR_INTERVAL: float = 0.05
+    EVENT_LOOP_SLOW_CALLBACK_SECONDS: float = 0.1
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL: float = 0.001
+    PROFILING_MAX_STORED: int = 200
+    METRICS_TOKEN: str | None = None
+    SERVER_HOST: str = "0.0.0.0"  # noqa: S104
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 1
+    SHUTDOWN_DRAIN_SECONDS: float = 25.0
+    PROVISIONING_STALE_SECONDS: int = 3600
+    BATCH_PROVISIONING_MAX_PROJECTS: int = 50
+    GITLAB_CONCURRENCY: int = 8
+    SONARQUBE_CONCURRENCY: int = 4
+    LOGFIRE_CONCURRENCY: int = 4
+    PROVISIONING_CONCURRENCY: int = 5
     LOGFIRE_TOKEN: str
     LOGFIRE_API_URL: HttpUrl
     GITLAB_API_URL: HttpUrl
     GITLAB_PRIVATE_TOKEN: str
     GITLAB_NAMESPACE_ID: int
+    GITLAB_COMMIT_BATCH_BYTES: int = 1024 * 1024
+    GITLAB_COMMIT_MAX_ATTEMPTS: int = 3
+    GITLAB_COMPRESS_REQUESTS: bool = False
+    GITLAB_USER_CACHE_TTL: float = 3600.0
     SONARQUBE_API_URL: HttpUrl
     SONARQUBE_TOKEN: str
     SONARQUBE_ALM_SETTING: str | None = None
+    SONARQUBE_WEBHOOK_SECRET: str | None = None
+    QUALITY_TREND_MAX_DAYS: int = 365
     JIRA_API_URL: HttpUrl
     JIRA_TOKEN: str
     JIRA_USER_EMAIL: str
     JIRA_PROJECT_KEY: str
     GEMINI_API_KEY: str
     GEMINI_MODEL: str
+    GEMINI_BASE_URL: HttpUrl | None = None
+    GEMINI_PROMPT_TOKEN_BUDGET: int = 8000
+    GEMINI_REQUEST_FIELD_MAX_CHARS: int = 1024
     WEBHOOK_BASE_URL: HttpUrl
+    RECONCILIATION_INTERVAL_SECONDS: int = 0
+    RECONCILIATION_CONCURRENCY: int = 8
+    RECONCILIATION_DELETE_ORPHANS: bool = False
+    RECONCILIATION_GRACE_SECONDS: int = 900
+    TEMPLATE_UPGRADE_CONCURRENCY: int = 8
 
 
 configuration = Configuration()  # type:ignore
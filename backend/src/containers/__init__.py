@@ -0,0 +1,3 @@
+from .container import Container
+
+__all__: list[str] = ["Container"]
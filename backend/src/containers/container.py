@@ -0,0 +1,121 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from httpx import AsyncClient, Limits
+
+from src.builders import BackendBuilder, BuilderRegistry, FrontendBuilder
+from src.configurations import configuration
+from src.enums import Project
+from src.integrations import GitLabClient, JiraClient, LogfireClient, SonarQubeClient, TicketAgent
+from src.services import LogfireChannelRegistry
+from src.utils import TTLCache, UpstreamLimits
+from src.utils.template_generator import TemplateGenerator
+
+TEMPLATES_DIRECTORY: Path = Path(__file__).parent.parent / "templates"
+
+
+@dataclass
+class Container:
+    """Application-scoped objects, created once in the lifespan and shared by every request."""
+
+    http_client: AsyncClient
+    executor: ThreadPoolExecutor
+    gitlab: GitLabClient
+    sonarqube: SonarQubeClient
+    logfire: LogfireClient
+    jira: JiraClient
+    ticket_agent: TicketAgent
+    builders: BuilderRegistry
+    quality_measures_cache: TTLCache[str, dict[str, str]]
+    logfire_channels: LogfireChannelRegistry
+    upstream_limits: UpstreamLimits
+    gitlab_user_ids: TTLCache[str, int]
+
+    @classmethod
+    def create(cls) -> "Container":
+        http_client = AsyncClient(
+            timeout=configuration.HTTP_TIMEOUT,
+            limits=Limits(
+                max_connections=configuration.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=configuration.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=configuration.EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="carli-worker",
+        )
+
+        template_generator = TemplateGenerator(templates_directory=TEMPLATES_DIRECTORY)
+        next_builder = FrontendBuilder(template_generator=template_generator, framework=Project.FRONTEND_NEXT)
+        builders = BuilderRegistry(
+            builders={
+                Project.BACKEND: BackendBuilder(template_generator=template_generator),
+                Project.FRONTEND: next_builder,
+                Project.FRONTEND_NEXT: next_builder,
+                Project.FRONTEND_QUASAR: FrontendBuilder(
+                    template_generator=template_generator, framework=Project.FRONTEND_QUASAR
+                ),
+            },
+            executor=executor,
+        )
+        builders.precompile()
+
+        logfire_client = LogfireClient(
+            base_url=f"{configuration.LOGFIRE_API_URL}",
+            token=configuration.LOGFIRE_TOKEN,
+            timeout=configuration.HTTP_TIMEOUT,
+            http_client=http_client,
+        )
+
+        return cls(
+            http_client=http_client,
+            executor=executor,
+            gitlab=GitLabClient(
+                base_url=f"{configuration.GITLAB_API_URL}api/v4/",
+                private_token=configuration.GITLAB_PRIVATE_TOKEN,
+                gitlab_namespace_id=configuration.GITLAB_NAMESPACE_ID,
+                timeout=configuration.HTTP_TIMEOUT,
+                commit_batch_bytes=configuration.GITLAB_COMMIT_BATCH_BYTES,
+                commit_max_attempts=configuration.GITLAB_COMMIT_MAX_ATTEMPTS,
+                compress_requests=configuration.GITLAB_COMPRESS_REQUESTS,
+                http_client=http_client,
+            ),
+            sonarqube=SonarQubeClient(
+                base_url=f"{configuration.SONARQUBE_API_URL}",
+                token=configuration.SONARQUBE_TOKEN,
+                timeout=configuration.HTTP_TIMEOUT,
+                http_client=http_client,
+            ),
+            logfire=logfire_client,
+            jira=JiraClient(
+                base_url=f"{configuration.JIRA_API_URL}",
+                user_email=configuration.JIRA_USER_EMAIL,
+                token=configuration.JIRA_TOKEN,
+                timeout=configuration.HTTP_TIMEOUT,
+                http_client=http_client,
+            ),
+            ticket_agent=TicketAgent(
+                api_key=configuration.GEMINI_API_KEY,
+                model_name=configuration.GEMINI_MODEL,
+                base_url=str(configuration.GEMINI_BASE_URL) if configuration.GEMINI_BASE_URL else None,
+                prompt_token_budget=configuration.GEMINI_PROMPT_TOKEN_BUDGET,
+                request_field_max_chars=configuration.GEMINI_REQUEST_FIELD_MAX_CHARS,
+            ),
+            builders=builders,
+            quality_measures_cache=TTLCache(ttl_seconds=configuration.FLEET_CACHE_TTL),
+            logfire_channels=LogfireChannelRegistry(logfire=logfire_client),
+            upstream_limits=UpstreamLimits.create(
+                gitlab=configuration.GITLAB_CONCURRENCY,
+                sonarqube=configuration.SONARQUBE_CONCURRENCY,
+                logfire=configuration.LOGFIRE_CONCURRENCY,
+                provisioning=configuration.PROVISIONING_CONCURRENCY,
+            ),
+            gitlab_user_ids=TTLCache(ttl_seconds=configuration.GITLAB_USER_CACHE_TTL),
+        )
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+        await asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=True)
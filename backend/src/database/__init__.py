@@ -1,3 +1,4 @@
 from .connection import Database, database
+from .replica import Replica
 
-__all__: list[str] = ["Database", "database"]
+__all__: list[str] = ["Database", "Replica", "database"]
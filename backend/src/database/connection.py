@@ -1,28 +1,55 @@
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from hashlib import blake2b
 
+from sqlalchemy import Connection, event, func, select
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session, SessionTransaction
 
 from src.configurations import configuration
-from src.enums import Environment
+from src.enums import Environment, SessionMode
+
+from .replica import Replica
 
 
 class Database:
     def __init__(self) -> None:
-        self.engine: AsyncEngine = create_async_engine(
-            url=configuration.DATABASE_URL.encoded_string(),
-            echo=configuration.ENVIRONMENT == Environment.DEVELOPMENT,
-            pool_size=10,
-        )
+        self.engine: AsyncEngine = self._create_engine(url=configuration.DATABASE_URL.encoded_string())
         self.session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine, expire_on_commit=False
         )
+        self.replicas: list[Replica] = [
+            Replica(
+                engine=self._create_engine(url=replica_url.encoded_string()),
+                max_lag_seconds=configuration.DATABASE_REPLICA_MAX_LAG,
+                check_interval_seconds=configuration.DATABASE_REPLICA_CHECK_INTERVAL,
+            )
+            for replica_url in configuration.DATABASE_REPLICA_URLS
+        ]
+        self._next_replica: int = 0
+
+    @staticmethod
+    def _create_engine(url: str) -> AsyncEngine:
+        return create_async_engine(
+            url=url,
+            echo=configuration.ENVIRONMENT == Environment.DEVELOPMENT,
+            pool_size=10,
+        )
+
+    @asynccontextmanager
+    async def session_scope(self, mode: SessionMode = SessionMode.READ_WRITE) -> AsyncIterator[AsyncSession]:
+        if mode == SessionMode.READ_ONLY:
+            async with self.read_session_scope() as session:
+                yield session
+            return
 
-    async def get_async_session(self) -> AsyncGenerator[AsyncSession]:
         async with self.session_maker() as session:
             try:
                 yield session
@@ -32,8 +59,73 @@ class Database:
                 await session.rollback()
                 raise
 
+    @asynccontextmanager
+    async def advisory_lock(self, name: str) -> AsyncIterator[bool]:
+        """Try a session-level ``pg_try_advisory_lock`` on the primary, held on a dedicated connection.
+
+        Yields whether the lock was acquired; it is released when the block exits. Requires session
+        pooling if a connection pooler sits in front of Postgres.
+        """
+        key: int = int.from_bytes(blake2b(name.encode(), digest_size=8).digest(), byteorder="big", signed=True)
+
+        connection: AsyncConnection
+        async with self.engine.connect() as connection:
+            acquired: bool = bool(await connection.scalar(select(func.pg_try_advisory_lock(key))))
+            await connection.commit()
+
+            try:
+                yield acquired
+
             finally:
-                await session.close()
+                if acquired:
+                    await asyncio.shield(connection.scalar(select(func.pg_advisory_unlock(key))))
+
+    @asynccontextmanager
+    async def read_session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Open a ``READ ONLY`` transaction; it is never committed, closing the session releases it.
+
+        The transaction is marked read-only lazily, so a session that never queries costs no round trip.
+        """
+        session_maker: async_sessionmaker[AsyncSession] = await self._select_read_session_maker()
+
+        async with session_maker() as session:
+            event.listen(session.sync_session, "after_begin", _set_transaction_read_only)
+            yield session
+
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession]:
+        async with self.session_scope(mode=SessionMode.READ_WRITE) as session:
+            yield session
+
+    async def get_async_read_session(self) -> AsyncGenerator[AsyncSession]:
+        async with self.session_scope(mode=SessionMode.READ_ONLY) as session:
+            yield session
+
+    async def _select_read_session_maker(self) -> async_sessionmaker[AsyncSession]:
+        """Round-robin over replicas, skipping lagging or unreachable ones; fall back to the primary."""
+        for _ in range(len(self.replicas)):
+            replica: Replica = self.replicas[self._next_replica % len(self.replicas)]
+            self._next_replica = (self._next_replica + 1) % len(self.replicas)
+
+            await replica.refresh()
+            if replica.is_healthy:
+                return replica.session_maker
+
+        return self.session_maker
+
+    @property
+    def engines(self) -> dict[str, AsyncEngine]:
+        return {"primary": self.engine} | {
+            f"replica_{index}": replica.engine for index, replica in enumerate(self.replicas)
+        }
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+def _set_transaction_read_only(_: Session, __: SessionTransaction, connection: Connection) -> None:
+    connection.exec_driver_sql("SET TRANSACTION READ ONLY")
 
 
 database: Database = Database()
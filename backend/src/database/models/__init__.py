@@ -1,14 +1,27 @@
-from .base import Base
+from .base import Base, LeanBase
+from .idempotency_key import IdempotencyKey
+from .logfire_channel import LogfireChannel
 from .permission import Permission
 from .project import Project
+from .project_drift import ProjectDrift
+from .provisioning_job import ProvisioningJob
+from .quality_gate_snapshot import QualityGateSnapshot
+from .request_profile import RequestProfile
 from .role import Role
 from .role_permission import RolePermission
 from .user import User
 
 __all__: list[str] = [
     "Base",
+    "IdempotencyKey",
+    "LeanBase",
+    "LogfireChannel",
     "Permission",
     "Project",
+    "ProjectDrift",
+    "ProvisioningJob",
+    "QualityGateSnapshot",
+    "RequestProfile",
     "Role",
     "RolePermission",
     "User",
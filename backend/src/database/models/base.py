@@ -12,9 +12,15 @@ convention: dict[str, str] = {
 }
 
 
-class Base(DeclarativeBase):
+class LeanBase(DeclarativeBase):
+    """Base without the audit columns, for compact append-only tables."""
+
     metadata = MetaData(naming_convention=convention)
 
+
+class Base(LeanBase):
+    __abstract__ = True
+
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=func.now(),
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import LargeBinary, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__: str = "idempotency_key"
+    __table_args__ = (
+        UniqueConstraint("scope", "key"),
+        {"comment": "Idempotency-Key records with the response replayed to retried requests"},
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        SQLUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    scope: Mapped[str] = mapped_column(String(255), comment="Route and caller the key belongs to")
+    key: Mapped[str] = mapped_column(String(255), comment="Client-supplied Idempotency-Key")
+    request_hash: Mapped[str] = mapped_column(String(64), comment="SHA-256 of the canonical request body")
+    status: Mapped[str] = mapped_column(String(20), comment="IdempotencyStatus value")
+    response_status: Mapped[int | None] = mapped_column(nullable=True, comment="Stored response status code")
+    response_body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, comment="Stored response body")
+    media_type: Mapped[str | None] = mapped_column(String(100), nullable=True, comment="Stored response media type")
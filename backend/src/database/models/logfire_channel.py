@@ -0,0 +1,20 @@
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class LogfireChannel(Base):
+    __tablename__: str = "logfire_channel"
+    __table_args__ = {"comment": "Logfire alert channels shared by every project, one per webhook URL"}
+
+    id: Mapped[UUID] = mapped_column(
+        SQLUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    webhook_url: Mapped[str] = mapped_column(String(500), unique=True, comment="Webhook the channel delivers to")
+    id_channel_logfire: Mapped[str] = mapped_column(String(36), comment="Logfire channel UUID")
@@ -17,6 +17,9 @@ class Project(Base):
         server_default=func.gen_random_uuid(),
     )
     name: Mapped[str] = mapped_column(String(150), comment="Project display name")
+    slug: Mapped[str] = mapped_column(
+        String(150), index=True, comment="slugify(name): SonarQube key and provisioning lock key"
+    )
     id_user: Mapped[UUID] = mapped_column(
         SQLUUID(as_uuid=True),
         ForeignKey("user.id"),
@@ -28,4 +31,7 @@ class Project(Base):
     )
     url_repository: Mapped[str] = mapped_column(String(500), comment="SSH clone URL from GitLab")
     id_project_logfire: Mapped[str | None] = mapped_column(String(36), nullable=True, comment="Logfire project UUID")
+    project_type: Mapped[str] = mapped_column(
+        String(30), server_default="backend", comment="Template set the project was scaffolded from"
+    )
     web_domain: Mapped[str | None] = mapped_column(String(), nullable=True, comment="Web domain for the server.")
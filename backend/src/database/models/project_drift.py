@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ProjectDrift(Base):
+    __tablename__: str = "project_drift"
+    __table_args__ = {"comment": "Drift found between the project table and GitLab, SonarQube and Logfire"}
+
+    id: Mapped[UUID] = mapped_column(
+        SQLUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    id_project: Mapped[UUID | None] = mapped_column(
+        SQLUUID(as_uuid=True),
+        ForeignKey("project.id"),
+        nullable=True,
+        comment="Affected project, null for orphans that exist only upstream",
+    )
+    kind: Mapped[str] = mapped_column(String(50), index=True, comment="DriftKind value")
+    external_id: Mapped[str] = mapped_column(
+        String(255), comment="GitLab project ID, SonarQube key or Logfire project UUID"
+    )
+    repaired: Mapped[bool] = mapped_column(
+        server_default="false", default=False, comment="Whether the reconciliation repaired it"
+    )
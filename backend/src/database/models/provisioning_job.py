@@ -0,0 +1,33 @@
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ProvisioningJob(Base):
+    __tablename__: str = "provisioning_job"
+    __table_args__ = {"comment": "Progress of project provisioning chains, used to recover interrupted ones"}
+
+    id: Mapped[UUID] = mapped_column(
+        SQLUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    name: Mapped[str] = mapped_column(String(150), comment="Requested project name")
+    id_user: Mapped[UUID] = mapped_column(
+        SQLUUID(as_uuid=True),
+        ForeignKey("user.id"),
+        comment="User who requested the project",
+    )
+    status: Mapped[str] = mapped_column(String(20), index=True, comment="ProvisioningJobStatus value")
+    id_project_gitlab: Mapped[int | None] = mapped_column(nullable=True, comment="GitLab project ID once created")
+    sonarqube_project_key: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="SonarQube project key once created"
+    )
+    id_project_logfire: Mapped[str | None] = mapped_column(
+        String(36), nullable=True, comment="Logfire project UUID once created"
+    )
+    error: Mapped[str | None] = mapped_column(String(500), nullable=True, comment="Failure reason")
@@ -0,0 +1,33 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import TIMESTAMP, BigInteger, ForeignKey, Identity, Index, String, UniqueConstraint
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import LeanBase
+
+
+class QualityGateSnapshot(LeanBase):
+    __tablename__: str = "quality_gate_snapshot"
+    __table_args__ = (
+        UniqueConstraint("id_project", "analysed_at"),
+        # Analyses are mostly delivered in analysed_at order; a retried delivery landing late only widens
+        # one block range, so a BRIN index still keeps fleet-wide range scans cheap at a few pages.
+        Index("ix_quality_gate_snapshot_analysed_at", "analysed_at", postgresql_using="brin"),
+        {"comment": "Append-only history of quality gate results, one row per analysis or refresh"},
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    id_project: Mapped[UUID] = mapped_column(
+        SQLUUID(as_uuid=True),
+        ForeignKey("project.id"),
+        comment="Project the analysis belongs to",
+    )
+    analysed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), comment="When SonarQube analysed the project, or when it was refreshed"
+    )
+    status: Mapped[str] = mapped_column(String(10), comment="Quality gate status: OK, WARN, ERROR or NONE")
+    conditions: Mapped[dict[str, str]] = mapped_column(JSONB, comment="Actual value per gate condition metric")
+    failed_metrics: Mapped[list[str]] = mapped_column(ARRAY(String(100)), comment="Metrics whose gate condition failed")
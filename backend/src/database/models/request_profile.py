@@ -0,0 +1,25 @@
+from uuid import UUID
+
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import ForeignKey, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class RequestProfile(Base):
+    __tablename__: str = "request_profile"
+    __table_args__ = {"comment": "Statistical profiles of sampled or explicitly profiled requests"}
+
+    id: Mapped[UUID] = mapped_column(SQLUUID(as_uuid=True), primary_key=True)
+    method: Mapped[str] = mapped_column(String(10), comment="HTTP method")
+    route: Mapped[str] = mapped_column(String(255), index=True, comment="Route template of the request")
+    status_code: Mapped[int] = mapped_column(comment="Response status code")
+    duration_ms: Mapped[float] = mapped_column(comment="Wall-clock duration of the profiled request")
+    id_user: Mapped[UUID | None] = mapped_column(
+        SQLUUID(as_uuid=True),
+        ForeignKey("user.id"),
+        nullable=True,
+        comment="Administrator who requested the profile, null when sampled",
+    )
+    content: Mapped[bytes] = mapped_column(LargeBinary, comment="speedscope JSON flame graph")
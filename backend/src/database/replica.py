@@ -0,0 +1,45 @@
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+REPLICATION_LAG_QUERY: str = (
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    max_lag_seconds: float
+    check_interval_seconds: float
+    session_maker: async_sessionmaker[AsyncSession] = field(init=False, repr=False)
+    lag_seconds: float = field(default=0.0, init=False)
+    is_reachable: bool = field(default=True, init=False)
+    _checked_at: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.session_maker = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.is_reachable and self.lag_seconds <= self.max_lag_seconds
+
+    async def refresh(self) -> None:
+        if time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return
+
+        self._checked_at = time.monotonic()
+
+        try:
+            async with self.engine.connect() as connection:
+                lag: float | None = (await connection.execute(text(REPLICATION_LAG_QUERY))).scalar()
+            self.lag_seconds = float(lag or 0)
+            self.is_reachable = True
+
+        except Exception:
+            self.is_reachable = False
@@ -1,6 +1,27 @@
+from .drift import DriftKind
 from .environment import Environment
+from .idempotency_status import IdempotencyStatus
 from .integrations import Integrations
+from .overview_section import OverviewSection
 from .permission import Permission
 from .project import Project
+from .provisioning_job_status import ProvisioningJobStatus
+from .provisioning_result_status import ProvisioningResultStatus
+from .session_mode import SessionMode
+from .template_upgrade_status import TemplateUpgradeStatus
+from .trend_bucket import TrendBucket
 
-__all__: list[str] = ["Environment", "Project", "Integrations", "Permission"]
+__all__: list[str] = [
+    "DriftKind",
+    "Environment",
+    "Project",
+    "IdempotencyStatus",
+    "Integrations",
+    "OverviewSection",
+    "Permission",
+    "ProvisioningJobStatus",
+    "ProvisioningResultStatus",
+    "SessionMode",
+    "TemplateUpgradeStatus",
+    "TrendBucket",
+]
@@ -0,0 +1,10 @@
+from enum import StrEnum, auto
+
+
+class DriftKind(StrEnum):
+    MISSING_IN_GITLAB = auto()
+    ORPHANED_IN_GITLAB = auto()
+    MISSING_IN_SONARQUBE = auto()
+    ORPHANED_IN_SONARQUBE = auto()
+    MISSING_IN_LOGFIRE = auto()
+    ORPHANED_IN_LOGFIRE = auto()
@@ -0,0 +1,6 @@
+from enum import StrEnum, auto
+
+
+class IdempotencyStatus(StrEnum):
+    IN_PROGRESS = auto()
+    COMPLETED = auto()
@@ -0,0 +1,8 @@
+from enum import StrEnum, auto
+
+
+class OverviewSection(StrEnum):
+    METADATA = auto()
+    QUALITY_GATE = auto()
+    MEMBERS = auto()
+    STAGES = auto()
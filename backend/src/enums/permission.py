@@ -5,3 +5,5 @@ class Permission(StrEnum):
     CREATE_PROJECT = auto()
     READ_PROJECT = auto()
     READ_PROJECTS = auto()
+    READ_FLEET = auto()
+    PROFILE_REQUESTS = auto()
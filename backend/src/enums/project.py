@@ -4,3 +4,5 @@ from enum import StrEnum, auto
 class Project(StrEnum):
     BACKEND = auto()
     FRONTEND = auto()
+    FRONTEND_NEXT = auto()
+    FRONTEND_QUASAR = auto()
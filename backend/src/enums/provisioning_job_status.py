@@ -0,0 +1,9 @@
+from enum import StrEnum, auto
+
+
+class ProvisioningJobStatus(StrEnum):
+    RUNNING = auto()
+    COMPLETED = auto()
+    FAILED = auto()
+    INTERRUPTED = auto()
+    ROLLED_BACK = auto()
@@ -0,0 +1,7 @@
+from enum import StrEnum, auto
+
+
+class ProvisioningResultStatus(StrEnum):
+    CREATED = auto()
+    CONFLICT = auto()
+    FAILED = auto()
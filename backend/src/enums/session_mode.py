@@ -0,0 +1,6 @@
+from enum import StrEnum, auto
+
+
+class SessionMode(StrEnum):
+    READ_ONLY = auto()
+    READ_WRITE = auto()
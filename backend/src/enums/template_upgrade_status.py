@@ -0,0 +1,8 @@
+from enum import StrEnum, auto
+
+
+class TemplateUpgradeStatus(StrEnum):
+    UP_TO_DATE = auto()
+    MERGE_REQUEST_OPENED = auto()
+    MERGE_REQUEST_PENDING = auto()
+    FAILED = auto()
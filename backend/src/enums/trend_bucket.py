@@ -0,0 +1,7 @@
+from enum import StrEnum, auto
+
+
+class TrendBucket(StrEnum):
+    DAY = auto()
+    WEEK = auto()
+    MONTH = auto()
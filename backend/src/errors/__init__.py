@@ -6,13 +6,16 @@ from .gitlab import (
     GitLabError,
     GitLabNotFoundError,
 )
+from .idempotency import IdempotencyError, IdempotencyInProgressError, IdempotencyKeyMismatchError
 from .jira import JiraAPIError, JiraAuthenticationError, JiraError
 from .logfire import (
     LogfireAPIError,
     LogfireAuthenticationError,
     LogfireError,
+    LogfireRejectedError,
 )
-from .project import ProjectNotFoundError
+from .project import ProjectConflictError, ProjectNotFoundError, UnsupportedProjectTypeError
+from .server import DrainingError, ProfileNotFoundError, ServerError
 from .sonarqube import (
     SonarQubeAPIError,
     SonarQubeAuthenticationError,
@@ -23,21 +26,30 @@ from .sonarqube import (
 __all__: list[str] = [
     "AuthenticationError",
     "AuthorizationError",
+    "DrainingError",
     "GeminiAPIError",
     "GeminiError",
     "GitLabAPIError",
     "GitLabAuthenticationError",
     "GitLabError",
     "GitLabNotFoundError",
+    "IdempotencyError",
+    "IdempotencyInProgressError",
+    "IdempotencyKeyMismatchError",
     "JiraAPIError",
     "JiraAuthenticationError",
     "JiraError",
     "LogfireAPIError",
     "LogfireAuthenticationError",
     "LogfireError",
+    "LogfireRejectedError",
+    "ServerError",
     "SonarQubeAPIError",
     "SonarQubeAuthenticationError",
     "SonarQubeError",
     "SonarQubeNotFoundError",
+    "ProfileNotFoundError",
+    "ProjectConflictError",
     "ProjectNotFoundError",
+    "UnsupportedProjectTypeError",
 ]
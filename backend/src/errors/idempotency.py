@@ -0,0 +1,13 @@
+class IdempotencyError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class IdempotencyKeyMismatchError(IdempotencyError):
+    def __init__(self, message: str = "Idempotency-Key was already used with a different request") -> None:
+        super().__init__(message)
+
+
+class IdempotencyInProgressError(IdempotencyError):
+    def __init__(self, message: str = "A request with this Idempotency-Key is still being processed") -> None:
+        super().__init__(message)
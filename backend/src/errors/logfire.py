@@ -11,3 +11,8 @@ class LogfireAPIError(LogfireError):
 class LogfireAuthenticationError(LogfireError):
     def __init__(self, message: str = "Invalid or expired Logfire token") -> None:
         super().__init__(message)
+
+
+class LogfireRejectedError(LogfireError):
+    def __init__(self, message: str = "Logfire rejected the request") -> None:
+        super().__init__(message)
@@ -6,3 +6,13 @@ class ProjectError(Exception):
 class ProjectNotFoundError(ProjectError):
     def __init__(self, message: str = "") -> None:
         super().__init__(message)
+
+
+class UnsupportedProjectTypeError(ProjectError):
+    def __init__(self, message: str = "") -> None:
+        super().__init__(message)
+
+
+class ProjectConflictError(ProjectError):
+    def __init__(self, message: str = "A project with this name already exists or is being created") -> None:
+        super().__init__(message)
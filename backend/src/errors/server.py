@@ -0,0 +1,13 @@
+class ServerError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class DrainingError(ServerError):
+    def __init__(self, message: str = "Server is shutting down and not accepting new work") -> None:
+        super().__init__(message)
+
+
+class ProfileNotFoundError(ServerError):
+    def __init__(self, message: str = "Request profile not found") -> None:
+        super().__init__(message)
@@ -0,0 +1,269 @@
+import json
+import math
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from src.schemas.webhook import LogfireAlert
+
+CHARS_PER_TOKEN: int = 4
+MIN_FIELD_CHARS: int = 32
+MAX_REQUEST_ITEMS: int = 20
+MAX_RECURSION_PERIOD: int = 4
+MIN_COLLAPSED_LIBRARY_FRAMES: int = 2
+
+_FRAME_PATTERN: re.Pattern[str] = re.compile(r'^\s*File "(?P<path>[^"]+)", line (?P<line>\d+), in (?P<function>.+)$')
+_PACKAGE_PATTERN: re.Pattern[str] = re.compile(r"[/\\](?:site|dist)-packages[/\\](?P<package>[^/\\]+)")
+_STDLIB_PATTERN: re.Pattern[str] = re.compile(r"^<frozen |[/\\]lib[/\\]python\d+(?:\.\d+)?[/\\]")
+_REPEATED_PATTERN: re.Pattern[str] = re.compile(r"^\s*\[Previous line repeated (?P<count>\d+) more times?\]$")
+
+
+@dataclass(frozen=True)
+class Frame:
+    path: str
+    line: int
+    function: str
+    lines: tuple[str, ...]
+    repeats: int = 1
+
+    @property
+    def key(self) -> tuple[str, int, str]:
+        return self.path, self.line, self.function
+
+    @property
+    def library(self) -> str | None:
+        """Package the frame belongs to, ``stdlib`` for the standard library, ``None`` for application code."""
+        if match := _PACKAGE_PATTERN.search(self.path):
+            return match.group("package").split(".")[0]
+
+        if _STDLIB_PATTERN.search(self.path):
+            return "stdlib"
+
+        return None
+
+
+@dataclass(frozen=True)
+class CompactedAlert:
+    prompt: str
+    original_tokens: int
+    tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(self.original_tokens - self.tokens, 0)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count; exact counting would cost a round trip to the model API."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _parse_stack_trace(stack_trace: str) -> list[Frame | str]:
+    segments: list[Frame | str] = []
+    frame_lines: list[str] = []
+    frame_match: re.Match[str] | None = None
+    frame_repeats: int = 1
+
+    def flush() -> None:
+        if frame_match is not None:
+            segments.append(
+                Frame(
+                    path=frame_match.group("path"),
+                    line=int(frame_match.group("line")),
+                    function=frame_match.group("function"),
+                    lines=tuple(frame_lines),
+                    repeats=frame_repeats,
+                )
+            )
+
+    for line in stack_trace.splitlines():
+        if match := _FRAME_PATTERN.match(line):
+            flush()
+            frame_match, frame_lines, frame_repeats = match, [line], 1
+        elif (repeated := _REPEATED_PATTERN.match(line)) and frame_match is not None:
+            # Python prints the first calls of a recursion and elides the rest; fold them into the frame
+            frame_repeats += int(repeated.group("count"))
+        elif frame_match is not None and line.startswith(" "):
+            frame_lines.append(line)
+        else:
+            flush()
+            frame_match, frame_lines = None, []
+            segments.append(line)
+
+    flush()
+    return segments
+
+
+def _repeats(frames: list[Frame], start: int, period: int) -> int:
+    cycle: list[tuple[str, int, str]] = [frame.key for frame in frames[start : start + period]]
+    count: int = 1
+
+    while [frame.key for frame in frames[start + count * period : start + (count + 1) * period]] == cycle:
+        count += 1
+
+    return count
+
+
+def _deduplicate_recursion(frames: list[Frame]) -> list[Frame | str]:
+    """Keep one cycle of consecutive repeated frames, e.g. ``a -> a -> a`` or ``a -> b -> a -> b``."""
+    compacted: list[Frame | str] = []
+    index: int = 0
+
+    while index < len(frames):
+        run: int = 1
+        while index + run < len(frames) and frames[index + run].key == frames[index].key:
+            run += 1
+
+        calls: int = sum(frame.repeats for frame in frames[index : index + run])
+        if calls > 1:
+            compacted.append(frames[index])
+            compacted.append(f"  [Previous frame repeated {calls - 1} more times]")
+            index += run
+            continue
+
+        for period in range(2, MAX_RECURSION_PERIOD + 1):
+            count: int = _repeats(frames, start=index, period=period)
+            if count > 1:
+                compacted.extend(frames[index : index + period])
+                compacted.append(f"  [Previous {period} frames repeated {count - 1} more times]")
+                index += period * count
+                break
+        else:
+            compacted.append(frames[index])
+            index += 1
+
+    return compacted
+
+
+def _collapse_libraries(segments: list[Frame | str]) -> list[str]:
+    """Fold runs of library frames into one line; the innermost frame is kept as it raised the error."""
+    lines: list[str] = []
+    run: list[Frame] = []
+
+    def flush() -> None:
+        if len(run) >= MIN_COLLAPSED_LIBRARY_FRAMES:
+            packages: str = ", ".join(dict.fromkeys(frame.library or "" for frame in run))
+            lines.append(f"  [... {len(run)} library frames: {packages} ...]")
+        else:
+            lines.extend(line for frame in run for line in frame.lines)
+        run.clear()
+
+    for position, segment in enumerate(segments):
+        innermost: bool = position + 1 == len(segments) or not isinstance(segments[position + 1], Frame)
+        if isinstance(segment, Frame) and segment.library is not None and not innermost:
+            run.append(segment)
+            continue
+
+        flush()
+        lines.extend(segment.lines if isinstance(segment, Frame) else (segment,))
+
+    flush()
+    return lines
+
+
+def compact_stack_trace(stack_trace: str) -> str:
+    """Collapse library frames and deduplicate recursive frames of a Python traceback.
+
+    Lines that are not part of a frame (headers, exception messages, chained-exception separators)
+    are kept verbatim, so text that is not a traceback passes through unchanged.
+    """
+    segments: list[Frame | str] = []
+    frames: list[Frame] = []
+
+    for segment in _parse_stack_trace(stack_trace):
+        if isinstance(segment, Frame):
+            frames.append(segment)
+            continue
+
+        segments.extend(_deduplicate_recursion(frames))
+        frames = []
+        segments.append(segment)
+
+    segments.extend(_deduplicate_recursion(frames))
+    return "\n".join(_collapse_libraries(segments))
+
+
+def truncate_fields(value: Any, max_chars: int) -> Any:
+    """Cut strings over ``max_chars`` and lists over ``MAX_REQUEST_ITEMS``, noting how much was dropped."""
+    if isinstance(value, str) and len(value) > max_chars:
+        return f"{value[:max_chars]}…[+{len(value) - max_chars} chars]"
+
+    if isinstance(value, dict):
+        return {key: truncate_fields(item, max_chars) for key, item in value.items()}
+
+    if isinstance(value, list | tuple):
+        items: list[Any] = [truncate_fields(item, max_chars) for item in value[:MAX_REQUEST_ITEMS]]
+        if len(value) > MAX_REQUEST_ITEMS:
+            items.append(f"…[+{len(value) - MAX_REQUEST_ITEMS} items]")
+        return items
+
+    return value
+
+
+def _truncate_head(text: str, max_chars: int) -> str:
+    """Keep the end of ``text``; the innermost frames and the exception are at the bottom of a traceback."""
+    if len(text) <= max_chars:
+        return text
+
+    return f"[…{len(text) - max_chars} chars truncated]\n{text[len(text) - max_chars :]}"
+
+
+def _truncate_tail(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+
+    return f"{text[:max_chars]}…[{len(text) - max_chars} chars truncated]"
+
+
+def render_prompt(alert: LogfireAlert, stack_trace: str, request: str) -> str:
+    return (
+        f"Exception Message: {alert.exception_message}\n\n"
+        f"Log Message: {alert.message}\n\n"
+        f"Stack Trace:\n{stack_trace}\n\n"
+        f"Request Context:\n{request}"
+    )
+
+
+def compact_alert(alert: LogfireAlert, token_budget: int, field_max_chars: int) -> CompactedAlert:
+    """Build the analysis prompt for ``alert`` within ``token_budget`` estimated tokens.
+
+    The stack trace is compacted and the request minified first; request fields are then halved until
+    the prompt fits, and as a last resort the stack trace loses its outermost frames and the request
+    its tail.
+    """
+    original: str = render_prompt(
+        alert=alert,
+        stack_trace=alert.stack_trace,
+        request=json.dumps(alert.request, indent=2, default=str),
+    )
+
+    stack_trace: str = compact_stack_trace(alert.stack_trace)
+    max_chars: int = field_max_chars
+
+    def render(stack: str, limit: int) -> tuple[str, str]:
+        request: str = json.dumps(
+            truncate_fields(alert.request, max_chars=limit),
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return render_prompt(alert=alert, stack_trace=stack, request=request), request
+
+    prompt, request = render(stack_trace, max_chars)
+    while estimate_tokens(prompt) > token_budget and max_chars > MIN_FIELD_CHARS:
+        max_chars = max(max_chars // 2, MIN_FIELD_CHARS)
+        prompt, request = render(stack_trace, max_chars)
+
+    budget_chars: int = token_budget * CHARS_PER_TOKEN
+    if len(prompt) > budget_chars:
+        available: int = max(budget_chars - (len(prompt) - len(stack_trace) - len(request)), 0)
+        stack_chars: int = min(len(stack_trace), available // 2)
+        request_chars: int = min(len(request), available - stack_chars)
+        stack_chars = available - request_chars
+        prompt = render_prompt(
+            alert=alert,
+            stack_trace=_truncate_head(stack_trace, max_chars=stack_chars),
+            request=_truncate_tail(request, max_chars=request_chars),
+        )
+
+    return CompactedAlert(prompt=prompt, original_tokens=estimate_tokens(original), tokens=estimate_tokens(prompt))
@@ -1,45 +1,88 @@
-import json
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pydantic_ai import Agent, AgentRunResult
-from pydantic_ai.models.google import GoogleModel
-from pydantic_ai.providers.google import GoogleProvider
+import logfire
 
 from src.errors.gemini import GeminiAPIError
+from src.metrics import ALERT_PROMPT_TOKENS_SAVED, instrument_integration
 from src.schemas.webhook import LogfireAlert
 
+from .compaction import CompactedAlert, compact_alert
 from .schemas import JiraTicketContent
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent, AgentRunResult
+
 _PROMPT_FILE: Path = Path(__file__).parent / "SYSTEM_PROMPT.md"
-SYSTEM_PROMPT: str = _PROMPT_FILE.read_text()
+
+
+@cache
+def load_system_prompt() -> str:
+    return _PROMPT_FILE.read_text()
 
 
 @dataclass
 class TicketAgent:
+    """Gemini-backed ticket writer.
+
+    ``pydantic_ai`` is imported and the model built on the first analysis, so workers that never
+    receive a webhook never pay for it. The agent, and the HTTP client held by its provider, are
+    then reused for the life of the instance. Alerts are compacted to ``prompt_token_budget`` estimated
+    tokens before they are sent.
+    """
+
     api_key: str
     model_name: str
-    _agent: Agent[None, JiraTicketContent] = field(init=False, repr=False)
-
-    def __post_init__(self) -> None:
-        provider = GoogleProvider(api_key=self.api_key)
-        model = GoogleModel(self.model_name, provider=provider)
-        self._agent = Agent(
-            model=model,
-            output_type=JiraTicketContent,
-            system_prompt=SYSTEM_PROMPT,
-        )
+    base_url: str | None = None
+    prompt_token_budget: int = 8000
+    request_field_max_chars: int = 1024
+    _agent: "Agent[None, JiraTicketContent] | None" = field(default=None, init=False, repr=False)
 
+    def _get_agent(self) -> "Agent[None, JiraTicketContent]":
+        if self._agent is None:
+            from pydantic_ai import Agent
+            from pydantic_ai.models.google import GoogleModel
+            from pydantic_ai.providers.google import GoogleProvider
+
+            if self.base_url:
+                from google.genai import Client
+                from google.genai.types import HttpOptions
+
+                provider = GoogleProvider(
+                    client=Client(api_key=self.api_key, http_options=HttpOptions(base_url=self.base_url))
+                )
+            else:
+                provider = GoogleProvider(api_key=self.api_key)
+
+            model = GoogleModel(self.model_name, provider=provider)
+            self._agent = Agent(
+                model=model,
+                output_type=JiraTicketContent,
+                system_prompt=load_system_prompt(),
+            )
+
+        return self._agent
+
+    @instrument_integration(integration="gemini")
     async def analyze_alert(self, alert: LogfireAlert) -> JiraTicketContent:
-        prompt = (
-            f"Exception Message: {alert.exception_message}\n\n"
-            f"Log Message: {alert.message}\n\n"
-            f"Stack Trace:\n{alert.stack_trace}\n\n"
-            f"Request Context:\n{json.dumps(alert.request, indent=2)}"
+        compacted: CompactedAlert = compact_alert(
+            alert=alert,
+            token_budget=self.prompt_token_budget,
+            field_max_chars=self.request_field_max_chars,
+        )
+        ALERT_PROMPT_TOKENS_SAVED.observe(compacted.tokens_saved)
+        logfire.info(
+            "Compacted alert prompt from {original_tokens} to {tokens} tokens",
+            original_tokens=compacted.original_tokens,
+            tokens=compacted.tokens,
+            tokens_saved=compacted.tokens_saved,
+            trace_id=alert.trace_id,
         )
 
         try:
-            result: AgentRunResult[JiraTicketContent] = await self._agent.run(prompt)
+            result: AgentRunResult[JiraTicketContent] = await self._get_agent().run(compacted.prompt)
             return result.output
         except Exception as e:
             raise GeminiAPIError(f"Agent failed to analyze alert: {e!s}") from e
@@ -1,5 +1,14 @@
+from .commits import git_blob_sha
 from .domain import AccessLevel
 from .gitlab import GitLabClient
-from .schemas import GitLabMember, GitLabProject
+from .schemas import GitLabMember, GitLabMergeRequest, GitLabProject, GitLabUser
 
-__all__: list[str] = ["AccessLevel", "GitLabClient", "GitLabMember", "GitLabProject"]
+__all__: list[str] = [
+    "AccessLevel",
+    "GitLabClient",
+    "GitLabMember",
+    "GitLabMergeRequest",
+    "GitLabProject",
+    "GitLabUser",
+    "git_blob_sha",
+]
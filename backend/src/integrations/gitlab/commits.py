@@ -0,0 +1,59 @@
+from base64 import b64encode
+from collections.abc import Iterator, Mapping
+from hashlib import sha1
+
+INLINE_TEXT_LIMIT: int = 64 * 1024
+ACTION_OVERHEAD_BYTES: int = 96
+
+
+def git_blob_sha(content: str | bytes) -> str:
+    """The object id git (and GitLab's ``X-Gitlab-Blob-Id``) assigns to ``content``."""
+    raw: bytes = content.encode() if isinstance(content, str) else content
+    return sha1(b"blob %d\x00" % len(raw) + raw, usedforsecurity=False).hexdigest()
+
+
+def build_commit_actions(
+    files: Mapping[str, str | bytes],
+    inline_text_limit: int = INLINE_TEXT_LIMIT,
+    existing_paths: frozenset[str] = frozenset(),
+) -> list[dict[str, str]]:
+    """``create`` actions, or ``update`` for ``existing_paths``.
+
+    Binary content and text too large to send escaped inline are base64-encoded.
+    """
+    actions: list[dict[str, str]] = []
+
+    for file_path, content in files.items():
+        raw: bytes = content.encode() if isinstance(content, str) else content
+        action: str = "update" if file_path in existing_paths else "create"
+
+        if isinstance(content, str) and "\x00" not in content and len(raw) <= inline_text_limit:
+            actions.append({"action": action, "file_path": file_path, "content": content})
+        else:
+            actions.append(
+                {"action": action, "file_path": file_path, "content": b64encode(raw).decode(), "encoding": "base64"}
+            )
+
+    return actions
+
+
+def batch_commit_actions(actions: list[dict[str, str]], max_batch_bytes: int) -> Iterator[list[dict[str, str]]]:
+    """Group actions greedily so each commit payload stays under ``max_batch_bytes``.
+
+    A single action larger than the limit still gets a batch of its own.
+    """
+    batch: list[dict[str, str]] = []
+    batch_bytes: int = 0
+
+    for action in actions:
+        size: int = len(action["file_path"]) + len(action["content"].encode()) + ACTION_OVERHEAD_BYTES
+
+        if batch and batch_bytes + size > max_batch_bytes:
+            yield batch
+            batch, batch_bytes = [], 0
+
+        batch.append(action)
+        batch_bytes += size
+
+    if batch:
+        yield batch
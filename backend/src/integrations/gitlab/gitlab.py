@@ -1,7 +1,23 @@
-from dataclasses import dataclass
-from urllib.parse import urljoin
-
-from httpx import AsyncClient, HTTPStatusError, RequestError, Response
+import asyncio
+import gzip
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, urljoin
+
+import logfire
+import orjson
+from httpx import (
+    AsyncClient,
+    ConnectError,
+    ConnectTimeout,
+    HTTPStatusError,
+    PoolTimeout,
+    RequestError,
+    Response,
+)
 
 from src.errors import (
     GitLabAPIError,
@@ -9,17 +25,31 @@ from src.errors import (
     GitLabError,
     GitLabNotFoundError,
 )
+from src.integrations.http import http_session
+from src.metrics import instrument_integration
 
+from .commits import batch_commit_actions, build_commit_actions
 from .domain import AccessLevel
 from .schemas import (
+    GITLAB_MEMBERS,
+    GITLAB_MERGE_REQUESTS,
+    GITLAB_PROJECT_REFERENCES,
+    GITLAB_USERS,
     GitLabBranch,
     GitLabCommit,
     GitLabMember,
+    GitLabMergeRequest,
     GitLabProject,
+    GitLabProjectsPage,
     GitLabProtectedBranch,
     GitLabUser,
 )
 
+# Commits are not idempotent: only retry failures where GitLab cannot have applied the request
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 503})
+RETRYABLE_REQUEST_ERRORS: tuple[type[RequestError], ...] = (ConnectError, ConnectTimeout, PoolTimeout)
+MAX_RETRY_AFTER_SECONDS: float = 30.0
+
 
 @dataclass
 class GitLabClient:
@@ -27,7 +57,12 @@ class GitLabClient:
     private_token: str
     gitlab_namespace_id: int
     timeout: int = 30
+    commit_batch_bytes: int = 1024 * 1024
+    commit_max_attempts: int = 3
+    compress_requests: bool = False
+    http_client: AsyncClient | None = field(default=None, repr=False)
 
+    @instrument_integration(integration="gitlab")
     async def create_project(
         self,
         name: str,
@@ -37,7 +72,7 @@ class GitLabClient:
         url: str = urljoin(base=self.base_url, url="projects")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     json={
@@ -51,7 +86,7 @@ class GitLabClient:
 
                 response.raise_for_status()
 
-                return GitLabProject.model_validate(response.json())
+                return GitLabProject.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -59,11 +94,12 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
     async def delete_project(self, project_id: int) -> None:
         url: str = urljoin(base=self.base_url, url=f"projects/{project_id}")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.delete(url=url, headers=self._headers())
                 response.raise_for_status()
 
@@ -73,11 +109,12 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
     async def create_branch(self, project_id: int, branch_name: str, from_branch: str) -> GitLabBranch:
         url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/repository/branches")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url,
                     params={"branch": branch_name, "ref": from_branch},
@@ -86,7 +123,7 @@ class GitLabClient:
 
                 response.raise_for_status()
 
-                return GitLabBranch.model_validate(response.json())
+                return GitLabBranch.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -94,6 +131,30 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
+    async def branch_exists(self, project_id: int, branch_name: str) -> bool:
+        url: str = urljoin(
+            base=self.base_url, url=f"projects/{project_id}/repository/branches/{quote(branch_name, safe='')}"
+        )
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(url, headers=self._headers())
+
+                if response.status_code == 404:
+                    return False
+
+                response.raise_for_status()
+
+                return True
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise GitLabAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="gitlab")
     async def update_branch_protection(
         self,
         project_id: int,
@@ -105,7 +166,7 @@ class GitLabClient:
         url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/protected_branches/{branch_name}")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.patch(
                     url,
                     json={
@@ -118,7 +179,7 @@ class GitLabClient:
 
                 response.raise_for_status()
 
-                return GitLabProtectedBranch.model_validate(response.json())
+                return GitLabProtectedBranch.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -126,6 +187,7 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
     async def protect_branch(
         self,
         project_id: int,
@@ -137,7 +199,7 @@ class GitLabClient:
         url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/protected_branches")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url,
                     json={
@@ -151,7 +213,7 @@ class GitLabClient:
 
                 response.raise_for_status()
 
-                return GitLabProtectedBranch.model_validate(response.json())
+                return GitLabProtectedBranch.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -159,59 +221,221 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
     async def initialize_repository(
         self,
         project_id: int,
-        files: dict[str, str],
+        files: Mapping[str, str | bytes],
         commit_message: str,
     ) -> GitLabCommit:
+        """Commit ``files`` to ``main`` in size-bounded batches, returning the last commit."""
         url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/repository/commits")
 
-        actions: list[dict[str, str]] = [
-            {
-                "action": "create",
-                "file_path": file_path,
-                "content": content,
-            }
-            for file_path, content in files.items()
-        ]
+        batches: list[list[dict[str, str]]] = list(
+            batch_commit_actions(actions=build_commit_actions(files), max_batch_bytes=self.commit_batch_bytes)
+        )
+
+        commit: GitLabCommit | None = None
+        for index, actions in enumerate(batches, start=1):
+            message: str = commit_message if len(batches) == 1 else f"{commit_message} ({index}/{len(batches)})"
+
+            with logfire.span(
+                "GitLab commit batch {index}/{total}",
+                index=index,
+                total=len(batches),
+                project_id=project_id,
+                files=len(actions),
+            ):
+                commit = await self._create_commit(
+                    url=url,
+                    payload={"branch": "main", "commit_message": message, "actions": actions},
+                )
+
+        if commit is None:
+            raise GitLabAPIError("No files to commit")
+
+        return commit
+
+    @instrument_integration(integration="gitlab")
+    async def commit_files(
+        self,
+        project_id: int,
+        branch: str,
+        files: Mapping[str, str | bytes],
+        commit_message: str,
+        existing_paths: frozenset[str] = frozenset(),
+        start_branch: str | None = None,
+    ) -> GitLabCommit:
+        """One commit on ``branch``, created from ``start_branch`` when it does not exist yet."""
+        url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/repository/commits")
+
+        payload: dict[str, object] = {
+            "branch": branch,
+            "commit_message": commit_message,
+            "actions": build_commit_actions(files, existing_paths=existing_paths),
+        }
+        if start_branch:
+            payload["start_branch"] = start_branch
+
+        return await self._create_commit(url=url, payload=payload)
+
+    async def _create_commit(self, url: str, payload: dict[str, object]) -> GitLabCommit:
+        body: bytes = orjson.dumps(payload)
+        headers: dict[str, str] = {**self._headers(), "Content-Type": "application/json"}
+
+        if self.compress_requests:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        for attempt in range(1, self.commit_max_attempts + 1):
+            try:
+                async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                    response: Response = await client.post(url, content=body, headers=headers)
+
+                    response.raise_for_status()
+
+                    return GitLabCommit.model_validate_json(response.content)
+
+            except HTTPStatusError as e:
+                if e.response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.commit_max_attempts:
+                    raise self._handle_http_error(e) from e
+
+                await asyncio.sleep(self._retry_delay(response=e.response, attempt=attempt))
+
+            except RequestError as e:
+                if not isinstance(e, RETRYABLE_REQUEST_ERRORS) or attempt == self.commit_max_attempts:
+                    raise GitLabAPIError(f"Request failed: {e!s}") from e
+
+                await asyncio.sleep(self._retry_delay(response=None, attempt=attempt))
+
+        raise GitLabAPIError("Commit retries exhausted")
+
+    @staticmethod
+    def _retry_delay(response: Response | None, attempt: int) -> float:
+        """Honour ``Retry-After`` (seconds or HTTP date) when present, else back off exponentially."""
+        retry_after: str | None = response.headers.get("retry-after") if response is not None else None
+        delay: float = 0.5 * 2 ** (attempt - 1)
+
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        elif retry_after is not None:
+            with suppress(TypeError, ValueError):
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds()
+
+        return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+    @instrument_integration(integration="gitlab")
+    async def get_file_blob_id(self, project_id: int, file_path: str, ref: str) -> str | None:
+        """Blob SHA of ``file_path`` at ``ref`` from the response headers only, or ``None`` if absent."""
+        url: str = urljoin(
+            base=self.base_url, url=f"projects/{project_id}/repository/files/{quote(file_path, safe='')}"
+        )
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.head(url, params={"ref": ref}, headers=self._headers())
+
+                if response.status_code == 404:
+                    return None
+
+                response.raise_for_status()
+
+                return response.headers.get("x-gitlab-blob-id")
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise GitLabAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="gitlab")
+    async def create_merge_request(
+        self,
+        project_id: int,
+        source_branch: str,
+        target_branch: str,
+        title: str,
+        description: str = "",
+    ) -> GitLabMergeRequest:
+        url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/merge_requests")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url,
                     json={
-                        "branch": "main",
-                        "commit_message": commit_message,
-                        "actions": actions,
+                        "source_branch": source_branch,
+                        "target_branch": target_branch,
+                        "title": title,
+                        "description": description,
+                        "remove_source_branch": True,
                     },
                     headers=self._headers(),
                 )
 
                 response.raise_for_status()
 
-                return GitLabCommit.model_validate(response.json())
+                return GitLabMergeRequest.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
 
         except RequestError as e:
-            raise GitLabAPIError(f"Request failed: {str(e)}") from e
+            raise GitLabAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="gitlab")
+    async def list_open_merge_requests(self, project_id: int, target_branch: str) -> list[GitLabMergeRequest]:
+        url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/merge_requests")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(
+                    url,
+                    params={"state": "opened", "target_branch": target_branch, "per_page": 100},
+                    headers=self._headers(),
+                )
+
+                response.raise_for_status()
+
+                return GITLAB_MERGE_REQUESTS.validate_json(response.content)
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise GitLabAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="gitlab")
+    async def close_merge_request(self, project_id: int, merge_request_iid: int) -> None:
+        url: str = urljoin(base=self.base_url, url=f"projects/{project_id}/merge_requests/{merge_request_iid}")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.put(url, json={"state_event": "close"}, headers=self._headers())
+
+                response.raise_for_status()
 
-    async def add_member_to_project(self, project_id: int, user_name: str, access_level: AccessLevel) -> GitLabMember:
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise GitLabAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="gitlab")
+    async def add_member_to_project(self, project_id: int, user_id: int, access_level: AccessLevel) -> GitLabMember:
         url: str = urljoin(self.base_url, f"projects/{project_id}/members")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url,
-                    json={"user_name": user_name, "access_level": access_level.value},
+                    json={"user_id": user_id, "access_level": access_level.value},
                     headers=self._headers(),
                 )
 
                 response.raise_for_status()
 
-                return GitLabMember.model_validate(response.json())
+                return GitLabMember.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -219,16 +443,17 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
     async def list_project_members(self, project_id: int) -> list[GitLabMember]:
         url: str = urljoin(self.base_url, f"projects/{project_id}/members")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.get(url, headers=self._headers())
 
                 response.raise_for_status()
 
-                return [GitLabMember.model_validate(m) for m in response.json()]
+                return GITLAB_MEMBERS.validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -236,11 +461,12 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {e!s}") from e
 
+    @instrument_integration(integration="gitlab")
     async def search_users(self, search: str) -> list[GitLabUser]:
         url: str = urljoin(self.base_url, "users")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.get(
                     url,
                     params={"search": search},
@@ -249,7 +475,7 @@ class GitLabClient:
 
                 response.raise_for_status()
 
-                return [GitLabUser.model_validate(u) for u in response.json()]
+                return GITLAB_USERS.validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -257,16 +483,17 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
     async def list_all_users(self) -> list[GitLabUser]:
         url: str = urljoin(self.base_url, "users")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.get(url, headers=self._headers())
 
                 response.raise_for_status()
 
-                return [GitLabUser.model_validate(u) for u in response.json()]
+                return GITLAB_USERS.validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -274,9 +501,52 @@ class GitLabClient:
         except RequestError as e:
             raise GitLabAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="gitlab")
+    async def list_namespace_projects(self, page: int = 1, per_page: int = 100) -> GitLabProjectsPage:
+        """Projects living in the namespace itself; shared-in and subgroup projects belong to other teams."""
+        url: str = urljoin(self.base_url, f"groups/{self.gitlab_namespace_id}/projects")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(
+                    url,
+                    params={
+                        "page": page,
+                        "per_page": per_page,
+                        "order_by": "id",
+                        "sort": "asc",
+                        "simple": "true",
+                        "with_shared": "false",
+                    },
+                    headers=self._headers(),
+                )
+
+                response.raise_for_status()
+
+                return GitLabProjectsPage(
+                    projects=[
+                        project
+                        for project in GITLAB_PROJECT_REFERENCES.validate_json(response.content)
+                        if project.namespace is not None and project.namespace.id == self.gitlab_namespace_id
+                    ],
+                    next_page=self._int_header(response, "x-next-page"),
+                    total_pages=self._int_header(response, "x-total-pages"),
+                )
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise GitLabAPIError(f"Request failed: {e!s}") from e
+
     def _headers(self) -> dict[str, str]:
         return {"PRIVATE-TOKEN": self.private_token}
 
+    @staticmethod
+    def _int_header(response: Response, name: str) -> int | None:
+        value: str = response.headers.get(name, "")
+        return int(value) if value.isdigit() else None
+
     @staticmethod
     def _handle_http_error(error: HTTPStatusError) -> GitLabError:
         if error.response.status_code == 401:
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class _GitLabBase(BaseModel):
@@ -17,6 +19,35 @@ class GitLabProject(_GitLabBase):
     visibility: str
 
 
+class GitLabMergeRequest(_GitLabBase):
+    id: int
+    iid: int
+    title: str
+    source_branch: str
+    target_branch: str
+    web_url: str
+
+
+class GitLabNamespaceReference(_GitLabBase):
+    id: int
+    full_path: str | None = None
+
+
+class GitLabProjectReference(_GitLabBase):
+    id: int
+    name: str
+    path: str
+    path_with_namespace: str
+    namespace: GitLabNamespaceReference | None = None
+    created_at: datetime | None = None
+
+
+class GitLabProjectsPage(_GitLabBase):
+    projects: list[GitLabProjectReference]
+    next_page: int | None = None
+    total_pages: int | None = None
+
+
 class GitLabBranch(_GitLabBase):
     name: str
     merged: bool = False
@@ -71,3 +102,9 @@ class GitLabUser(_GitLabBase):
     state: str
     avatar_url: str | None = None
     web_url: str | None = None
+
+
+GITLAB_PROJECT_REFERENCES: TypeAdapter[list[GitLabProjectReference]] = TypeAdapter(list[GitLabProjectReference])
+GITLAB_MEMBERS: TypeAdapter[list[GitLabMember]] = TypeAdapter(list[GitLabMember])
+GITLAB_MERGE_REQUESTS: TypeAdapter[list[GitLabMergeRequest]] = TypeAdapter(list[GitLabMergeRequest])
+GITLAB_USERS: TypeAdapter[list[GitLabUser]] = TypeAdapter(list[GitLabUser])
@@ -0,0 +1,15 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from httpx import AsyncClient
+
+
+@asynccontextmanager
+async def http_session(shared_client: AsyncClient | None, timeout: int) -> AsyncIterator[AsyncClient]:  # noqa: ASYNC109
+    """Yield the application-scoped client when one is injected, else a short-lived one for this call."""
+    if shared_client is not None:
+        yield shared_client
+        return
+
+    async with AsyncClient(timeout=timeout) as client:
+        yield client
@@ -1,11 +1,13 @@
 from base64 import b64encode
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urljoin
 
 from httpx import AsyncClient, HTTPStatusError, RequestError, Response
 
 from src.errors.jira import JiraAPIError, JiraAuthenticationError, JiraError
+from src.integrations.http import http_session
+from src.metrics import instrument_integration
 
 from .schemas import JiraIssue
 
@@ -16,7 +18,9 @@ class JiraClient:
     user_email: str
     token: str
     timeout: int = 30
+    http_client: AsyncClient | None = field(default=None, repr=False)
 
+    @instrument_integration(integration="jira")
     async def create_issue(
         self,
         project_key: str,
@@ -47,7 +51,7 @@ class JiraClient:
         }
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     json=payload,
@@ -56,7 +60,7 @@ class JiraClient:
 
                 response.raise_for_status()
 
-                return JiraIssue.model_validate(response.json())
+                return JiraIssue.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
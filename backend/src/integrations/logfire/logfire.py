@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import urljoin
 
 from httpx import AsyncClient, HTTPStatusError, RequestError, Response
@@ -7,9 +7,19 @@ from src.errors.logfire import (
     LogfireAPIError,
     LogfireAuthenticationError,
     LogfireError,
+    LogfireRejectedError,
+)
+from src.integrations.http import http_session
+from src.metrics import instrument_integration
+
+from .schemas import (
+    LOGFIRE_CHANNELS,
+    LOGFIRE_PROJECTS,
+    LogfireAlertConfiguration,
+    LogfireChannel,
+    LogfireProject,
+    LogfireWriteToken,
 )
-
-from .schemas import LogfireAlertConfiguration, LogfireChannel, LogfireProject, LogfireWriteToken
 
 ERROR_ALERT_QUERY: str = (
     "SELECT project_id, "
@@ -27,7 +37,9 @@ class LogfireClient:
     base_url: str
     token: str
     timeout: int = 30
+    http_client: AsyncClient | None = field(default=None, repr=False)
 
+    @instrument_integration(integration="logfire")
     async def create_project(
         self,
         project_name: str,
@@ -37,7 +49,7 @@ class LogfireClient:
         url: str = urljoin(base=self.base_url, url="v1/projects/")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     json={
@@ -50,7 +62,25 @@ class LogfireClient:
 
                 response.raise_for_status()
 
-                return LogfireProject.model_validate(response.json())
+                return LogfireProject.model_validate_json(response.content)
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise LogfireAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="logfire")
+    async def list_projects(self) -> list[LogfireProject]:
+        url: str = urljoin(base=self.base_url, url="v1/projects/")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(url=url, headers=self._headers())
+
+                response.raise_for_status()
+
+                return LOGFIRE_PROJECTS.validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -58,6 +88,7 @@ class LogfireClient:
         except RequestError as e:
             raise LogfireAPIError(f"Request failed: {e!s}") from e
 
+    @instrument_integration(integration="logfire")
     async def create_write_token(self, project_id: str) -> LogfireWriteToken:
         url: str = urljoin(
             base=self.base_url,
@@ -65,7 +96,7 @@ class LogfireClient:
         )
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     headers=self._headers(),
@@ -73,7 +104,7 @@ class LogfireClient:
 
                 response.raise_for_status()
 
-                return LogfireWriteToken.model_validate(response.json())
+                return LogfireWriteToken.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -81,6 +112,7 @@ class LogfireClient:
         except RequestError as e:
             raise LogfireAPIError(f"Request failed: {e!s}") from e
 
+    @instrument_integration(integration="logfire")
     async def create_channel(
         self,
         label: str,
@@ -89,7 +121,7 @@ class LogfireClient:
         url: str = urljoin(base=self.base_url, url="v1/channels/")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     json={"label": label, "config": {"type": "webhook", "format": "raw-data", "url": webhook_url}},
@@ -98,7 +130,7 @@ class LogfireClient:
 
                 response.raise_for_status()
 
-                return LogfireChannel.model_validate(response.json())
+                return LogfireChannel.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -106,6 +138,25 @@ class LogfireClient:
         except RequestError as e:
             raise LogfireAPIError(f"Request failed: {e!s}") from e
 
+    @instrument_integration(integration="logfire")
+    async def list_channels(self) -> list[LogfireChannel]:
+        url: str = urljoin(base=self.base_url, url="v1/channels/")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(url=url, headers=self._headers())
+
+                response.raise_for_status()
+
+                return LOGFIRE_CHANNELS.validate_json(response.content)
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise LogfireAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="logfire")
     async def create_alert(
         self,
         project_id: str,
@@ -123,7 +174,7 @@ class LogfireClient:
         )
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     json={
@@ -141,7 +192,7 @@ class LogfireClient:
 
                 response.raise_for_status()
 
-                return LogfireAlertConfiguration.model_validate(response.json())
+                return LogfireAlertConfiguration.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -157,4 +208,7 @@ class LogfireClient:
         if error.response.status_code == 401:
             return LogfireAuthenticationError()
 
+        if error.response.is_client_error:
+            return LogfireRejectedError(f"Logfire rejected the request ({error.response.status_code})")
+
         return LogfireAPIError()
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class _LogfireBase(BaseModel):
@@ -25,12 +25,18 @@ class LogfireWriteToken(_LogfireBase):
     token: str
 
 
+class LogfireChannelConfig(_LogfireBase):
+    type: str
+    url: str | None = None
+
+
 class LogfireChannel(_LogfireBase):
     id: UUID
     organization_id: UUID
     label: str
     active: bool
     created_at: datetime
+    config: LogfireChannelConfig | None = None
 
 
 class LogfireAlertConfiguration(_LogfireBase):
@@ -39,3 +45,7 @@ class LogfireAlertConfiguration(_LogfireBase):
     project_id: UUID
     name: str
     active: bool
+
+
+LOGFIRE_PROJECTS: TypeAdapter[list[LogfireProject]] = TypeAdapter(list[LogfireProject])
+LOGFIRE_CHANNELS: TypeAdapter[list[LogfireChannel]] = TypeAdapter(list[LogfireChannel])
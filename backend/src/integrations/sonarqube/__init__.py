@@ -1,3 +1,3 @@
-from .sonarqube import SonarQubeClient
+from .sonarqube import MEASURES_SEARCH_MAX_PROJECTS, SonarQubeClient
 
-__all__: list[str] = ["SonarQubeClient"]
+__all__: list[str] = ["MEASURES_SEARCH_MAX_PROJECTS", "SonarQubeClient"]
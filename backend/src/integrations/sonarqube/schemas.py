@@ -11,6 +11,21 @@ class SonarQubeProject(_SonarQubeBase):
     qualifier: str
 
 
+class SonarQubePaging(_SonarQubeBase):
+    page_index: int = Field(alias="pageIndex")
+    page_size: int = Field(alias="pageSize")
+    total: int
+
+
+class SonarQubeProjectsPage(_SonarQubeBase):
+    paging: SonarQubePaging
+    components: list[SonarQubeProject]
+
+
+class SonarQubeProjectCreated(_SonarQubeBase):
+    project: SonarQubeProject
+
+
 class SonarQubeToken(_SonarQubeBase):
     name: str
     token: str
@@ -28,3 +43,17 @@ class QualityGateCondition(_SonarQubeBase):
 class QualityGateStatus(_SonarQubeBase):
     status: str
     conditions: list[QualityGateCondition]
+
+
+class QualityGateResponse(_SonarQubeBase):
+    project_status: QualityGateStatus = Field(alias="projectStatus")
+
+
+class SonarQubeMeasure(_SonarQubeBase):
+    component: str
+    metric: str
+    value: str | None = None
+
+
+class SonarQubeMeasuresSearch(_SonarQubeBase):
+    measures: list[SonarQubeMeasure]
@@ -1,5 +1,5 @@
 from base64 import b64encode
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import urljoin
 
 from httpx import AsyncClient, HTTPStatusError, RequestError, Response
@@ -10,8 +10,21 @@ from src.errors.sonarqube import (
     SonarQubeError,
     SonarQubeNotFoundError,
 )
+from src.integrations.http import http_session
+from src.metrics import instrument_integration
+
+from .schemas import (
+    QualityGateResponse,
+    QualityGateStatus,
+    SonarQubeMeasure,
+    SonarQubeMeasuresSearch,
+    SonarQubeProject,
+    SonarQubeProjectCreated,
+    SonarQubeProjectsPage,
+    SonarQubeToken,
+)
 
-from .schemas import QualityGateStatus, SonarQubeProject, SonarQubeToken
+MEASURES_SEARCH_MAX_PROJECTS: int = 100
 
 
 @dataclass
@@ -19,7 +32,9 @@ class SonarQubeClient:
     base_url: str
     token: str
     timeout: int = 30
+    http_client: AsyncClient | None = field(default=None, repr=False)
 
+    @instrument_integration(integration="sonarqube")
     async def create_project(
         self,
         project_name: str,
@@ -29,7 +44,7 @@ class SonarQubeClient:
         url: str = urljoin(base=self.base_url, url="api/projects/create")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     params={
@@ -42,7 +57,7 @@ class SonarQubeClient:
 
                 response.raise_for_status()
 
-                return SonarQubeProject.model_validate(response.json()["project"])
+                return SonarQubeProjectCreated.model_validate_json(response.content).project
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -50,11 +65,12 @@ class SonarQubeClient:
         except RequestError as e:
             raise SonarQubeAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="sonarqube")
     async def delete_project(self, project_key: str) -> None:
         url: str = urljoin(base=self.base_url, url="api/projects/delete")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     params={"project": project_key},
@@ -68,6 +84,7 @@ class SonarQubeClient:
         except RequestError as e:
             raise SonarQubeAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="sonarqube")
     async def generate_project_token(
         self,
         project_key: str,
@@ -76,7 +93,7 @@ class SonarQubeClient:
         url: str = urljoin(base=self.base_url, url="api/user_tokens/generate")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     params={
@@ -89,7 +106,7 @@ class SonarQubeClient:
 
                 response.raise_for_status()
 
-                return SonarQubeToken.model_validate(response.json())
+                return SonarQubeToken.model_validate_json(response.content)
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -97,6 +114,7 @@ class SonarQubeClient:
         except RequestError as e:
             raise SonarQubeAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="sonarqube")
     async def set_gitlab_binding(
         self,
         project_key: str,
@@ -106,7 +124,7 @@ class SonarQubeClient:
         url: str = urljoin(base=self.base_url, url="api/alm_settings/set_gitlab_binding")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.post(
                     url=url,
                     params={
@@ -124,11 +142,12 @@ class SonarQubeClient:
         except RequestError as e:
             raise SonarQubeAPIError(f"Request failed: {str(e)}") from e
 
+    @instrument_integration(integration="sonarqube")
     async def get_quality_gate_status(self, project_key: str) -> QualityGateStatus:
         url: str = urljoin(base=self.base_url, url="api/qualitygates/project_status")
 
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
                 response: Response = await client.get(
                     url=url,
                     params={"projectKey": project_key},
@@ -137,7 +156,52 @@ class SonarQubeClient:
 
                 response.raise_for_status()
 
-                return QualityGateStatus.model_validate(response.json()["projectStatus"])
+                return QualityGateResponse.model_validate_json(response.content).project_status
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise SonarQubeAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="sonarqube")
+    async def search_projects(self, page: int = 1, page_size: int = 500) -> SonarQubeProjectsPage:
+        url: str = urljoin(base=self.base_url, url="api/projects/search")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(
+                    url=url,
+                    params={"p": page, "ps": page_size, "qualifiers": "TRK"},
+                    headers=self._headers(),
+                )
+
+                response.raise_for_status()
+
+                return SonarQubeProjectsPage.model_validate_json(response.content)
+
+        except HTTPStatusError as e:
+            raise self._handle_http_error(e) from e
+
+        except RequestError as e:
+            raise SonarQubeAPIError(f"Request failed: {e!s}") from e
+
+    @instrument_integration(integration="sonarqube")
+    async def search_measures(self, project_keys: list[str], metric_keys: list[str]) -> list[SonarQubeMeasure]:
+        """Measures for up to ``MEASURES_SEARCH_MAX_PROJECTS`` projects in one request."""
+        url: str = urljoin(base=self.base_url, url="api/measures/search")
+
+        try:
+            async with http_session(shared_client=self.http_client, timeout=self.timeout) as client:
+                response: Response = await client.get(
+                    url=url,
+                    params={"projectKeys": ",".join(project_keys), "metricKeys": ",".join(metric_keys)},
+                    headers=self._headers(),
+                )
+
+                response.raise_for_status()
+
+                return SonarQubeMeasuresSearch.model_validate_json(response.content).measures
 
         except HTTPStatusError as e:
             raise self._handle_http_error(e) from e
@@ -1,16 +1,65 @@
+import asyncio
+import hmac
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 import logfire
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from scalar_fastapi import get_scalar_api_reference  # type: ignore
 
 from src.configurations import configuration
+from src.containers import Container
+from src.database import database
 from src.enums import Environment
-from src.routes import auth_router, project_router, webhook_router
+from src.metrics import EventLoopMonitor, database_pool_collector, registry
+from src.middlewares import MetricsMiddleware, ProfilingMiddleware, ServerTimingMiddleware
+from src.routes import auth_router, profile_router, project_router, webhook_router
+from src.utils import provisioning_drain
+from src.workers import provisioning_recovery, reconciliation_loop
 
 logfire.configure()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container: Container = Container.create()
+    app.state.container = container
+    provisioning_drain.close_on(signal.SIGINT, signal.SIGTERM)
+
+    background_tasks: list[asyncio.Task[None]] = [asyncio.create_task(provisioning_recovery(container=container))]
+    if configuration.EVENT_LOOP_MONITOR_INTERVAL > 0:
+        monitor = EventLoopMonitor(
+            interval_seconds=configuration.EVENT_LOOP_MONITOR_INTERVAL,
+            slow_callback_seconds=configuration.EVENT_LOOP_SLOW_CALLBACK_SECONDS,
+        )
+        background_tasks.append(asyncio.create_task(monitor.run()))
+    if configuration.RECONCILIATION_INTERVAL_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                reconciliation_loop(container=container, interval_seconds=configuration.RECONCILIATION_INTERVAL_SECONDS)
+            )
+        )
+
+    try:
+        yield
+
+    finally:
+        cancelled: int = await provisioning_drain.drain(deadline_seconds=configuration.SHUTDOWN_DRAIN_SECONDS)
+        if cancelled:
+            logfire.warn("Interrupted {count} provisioning jobs at shutdown", count=cancelled)
+
+        for task in background_tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        await container.aclose()
+        await database.dispose()
+
+
 app = FastAPI(
     title=configuration.APP_NAME,
     description="API for backend",
@@ -18,6 +67,7 @@ app = FastAPI(
     docs_url="/swagger" if configuration.ENVIRONMENT == Environment.DEVELOPMENT else None,
     redoc_url="/redoc" if configuration.ENVIRONMENT == Environment.DEVELOPMENT else None,
     openapi_url="/openapi.json" if configuration.ENVIRONMENT == Environment.DEVELOPMENT else None,
+    lifespan=lifespan,
 )
 
 logfire.instrument_fastapi(app)
@@ -28,8 +78,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Profile-Id"],
 )
 
+app.add_middleware(ServerTimingMiddleware)
+
+app.add_middleware(
+    ProfilingMiddleware,
+    sample_rate=configuration.PROFILING_SAMPLE_RATE,
+    interval=configuration.PROFILING_INTERVAL,
+    keep=configuration.PROFILING_MAX_STORED,
+)
+
+app.add_middleware(MetricsMiddleware)
+
+registry.register_collector(database_pool_collector(engines=database.engines))
+
 
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict[str, str]:
@@ -37,13 +101,31 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "environment": configuration.ENVIRONMENT}
 
 
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: str | None = Header(default=None)) -> PlainTextResponse:
+    """Prometheus text exposition of in-process metrics, for scrapers holding ``METRICS_TOKEN``."""
+    if configuration.METRICS_TOKEN is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if authorization is None or not hmac.compare_digest(
+        authorization.encode(), f"Bearer {configuration.METRICS_TOKEN}".encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return PlainTextResponse(content=registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/", tags=["Root"])
 async def root() -> dict[str, str]:
     """Root endpoint."""
     return {"message": f"Welcome to {configuration.APP_NAME}"}
 
 
-for route in [auth_router, project_router, webhook_router]:
+for route in [auth_router, profile_router, project_router, webhook_router]:
     app.include_router(route)
 
 
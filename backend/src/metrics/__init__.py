@@ -0,0 +1,33 @@
+from .collectors import database_pool_collector
+from .loop_monitor import EventLoopMonitor
+from .metrics import (
+    ALERT_PROMPT_TOKENS_SAVED,
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_SLOW_CALLBACKS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    INTEGRATION_REQUEST_DURATION,
+    INTEGRATION_REQUESTS,
+    instrument_integration,
+    registry,
+)
+from .registry import Counter, Histogram, MetricFamily, MetricsRegistry, Sample
+
+__all__: list[str] = [
+    "ALERT_PROMPT_TOKENS_SAVED",
+    "EVENT_LOOP_LAG",
+    "EVENT_LOOP_SLOW_CALLBACKS",
+    "HTTP_REQUESTS",
+    "HTTP_REQUEST_DURATION",
+    "INTEGRATION_REQUESTS",
+    "INTEGRATION_REQUEST_DURATION",
+    "Counter",
+    "EventLoopMonitor",
+    "Histogram",
+    "MetricFamily",
+    "MetricsRegistry",
+    "Sample",
+    "database_pool_collector",
+    "instrument_integration",
+    "registry",
+]
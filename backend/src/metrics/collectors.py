@@ -0,0 +1,35 @@
+from collections.abc import Iterable
+
+from sqlalchemy import QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .registry import Collector, MetricFamily, Sample
+
+_POOL_SIZE = MetricFamily(name="db_pool_size", documentation="Configured connection pool size.", type="gauge")
+_POOL_CHECKED_OUT = MetricFamily(
+    name="db_pool_checked_out", documentation="Connections currently in use.", type="gauge"
+)
+_POOL_OVERFLOW = MetricFamily(
+    name="db_pool_overflow", documentation="Connections opened beyond the pool size.", type="gauge"
+)
+
+
+def database_pool_collector(engines: dict[str, AsyncEngine]) -> Collector:
+    def collect() -> Iterable[tuple[MetricFamily, Iterable[Sample]]]:
+        size: list[Sample] = []
+        checked_out: list[Sample] = []
+        overflow: list[Sample] = []
+
+        for name, engine in engines.items():
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+
+            labels: dict[str, str] = {"engine": name}
+            size.append((_POOL_SIZE.name, labels, pool.size()))
+            checked_out.append((_POOL_CHECKED_OUT.name, labels, pool.checkedout()))
+            overflow.append((_POOL_OVERFLOW.name, labels, max(pool.overflow(), 0)))
+
+        return [(_POOL_SIZE, size), (_POOL_CHECKED_OUT, checked_out), (_POOL_OVERFLOW, overflow)]
+
+    return collect
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import logfire
+
+from .metrics import EVENT_LOOP_LAG, EVENT_LOOP_SLOW_CALLBACKS
+
+SOURCE_ROOT: Path = Path(__file__).resolve().parent.parent
+
+UNKNOWN_SITE: str = "unknown"
+
+
+def _blocking_site(frames: traceback.StackSummary) -> str:
+    """Innermost application frame of the captured stack, falling back to the innermost frame at all."""
+    for frame in reversed(frames):
+        path: Path = Path(frame.filename)
+        if path.is_relative_to(SOURCE_ROOT):
+            return f"{path.relative_to(SOURCE_ROOT.parent)}:{frame.name}"
+
+    if frames:
+        return f"{Path(frames[-1].filename).name}:{frames[-1].name}"
+
+    return UNKNOWN_SITE
+
+
+@dataclass
+class EventLoopMonitor:
+    """Samples event-loop lag and captures the stack of whatever blocks the loop past ``slow_callback_seconds``.
+
+    The sampler sleeps ``interval_seconds`` and measures how late it wakes up. A watchdog thread
+    snapshots the loop thread's stack while it is still blocked, and the sampler reports it once the
+    loop is back, as metrics and a Logfire warning.
+    """
+
+    interval_seconds: float
+    slow_callback_seconds: float
+    _expected_wakeup: float = field(default=0.0, init=False, repr=False)
+    _stall: tuple[float, traceback.StackSummary] | None = field(default=None, init=False, repr=False)
+    _stopped: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+
+    async def run(self) -> None:
+        self._stopped.clear()
+        self._expected_wakeup = time.monotonic() + self.interval_seconds
+        threading.Thread(
+            target=self._watch, args=(threading.get_ident(),), name="event-loop-watchdog", daemon=True
+        ).start()
+
+        try:
+            while True:
+                self._expected_wakeup = time.monotonic() + self.interval_seconds
+                await asyncio.sleep(self.interval_seconds)
+                self._record(expected_wakeup=self._expected_wakeup, lag=time.monotonic() - self._expected_wakeup)
+
+        finally:
+            self._stopped.set()
+
+    def _watch(self, loop_thread_id: int) -> None:
+        while not self._stopped.wait(self.slow_callback_seconds / 4):
+            expected_wakeup: float = self._expected_wakeup
+            if time.monotonic() - expected_wakeup < self.slow_callback_seconds:
+                continue
+
+            if self._stall is not None and self._stall[0] == expected_wakeup:
+                continue
+
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is not None:
+                self._stall = (expected_wakeup, traceback.extract_stack(frame))
+
+    def _record(self, expected_wakeup: float, lag: float) -> None:
+        lag = max(lag, 0.0)
+        EVENT_LOOP_LAG.observe(lag)
+        if lag < self.slow_callback_seconds:
+            return
+
+        stall, self._stall = self._stall, None
+        frames: traceback.StackSummary = (
+            stall[1] if stall is not None and stall[0] == expected_wakeup else traceback.StackSummary()
+        )
+        site: str = _blocking_site(frames)
+
+        EVENT_LOOP_SLOW_CALLBACKS.inc(site=site)
+        logfire.warn(
+            "Event loop blocked for {lag_seconds:.3f}s in {site}",
+            lag_seconds=lag,
+            site=site,
+            stack="".join(frames.format()),
+        )
@@ -0,0 +1,83 @@
+import time
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from .registry import Counter, Histogram, MetricsRegistry
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+registry: MetricsRegistry = MetricsRegistry()
+
+INTEGRATION_REQUEST_DURATION: Histogram = registry.histogram(
+    name="integration_request_duration_seconds",
+    documentation="Latency of outbound integration calls.",
+    label_names=("integration", "operation", "status"),
+)
+INTEGRATION_REQUESTS: Counter = registry.counter(
+    name="integration_requests",
+    documentation="Outbound integration calls by outcome.",
+    label_names=("integration", "operation", "status"),
+)
+HTTP_REQUEST_DURATION: Histogram = registry.histogram(
+    name="http_request_duration_seconds",
+    documentation="Latency of inbound HTTP requests by route template.",
+    label_names=("method", "route", "status_code"),
+)
+HTTP_REQUESTS: Counter = registry.counter(
+    name="http_requests",
+    documentation="Inbound HTTP requests by route template and status code.",
+    label_names=("method", "route", "status_code"),
+)
+
+
+EVENT_LOOP_LAG: Histogram = registry.histogram(
+    name="event_loop_lag_seconds",
+    documentation="How late the event-loop lag sampler woke up.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_SLOW_CALLBACKS: Counter = registry.counter(
+    name="event_loop_slow_callbacks",
+    documentation="Event-loop stalls over the slow-callback threshold, by innermost application frame.",
+    label_names=("site",),
+)
+ALERT_PROMPT_TOKENS_SAVED: Histogram = registry.histogram(
+    name="alert_prompt_tokens_saved",
+    documentation="Estimated tokens removed from each alert prompt before LLM analysis.",
+    buckets=(0, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000),
+)
+
+
+def instrument_integration(
+    integration: str,
+) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """Time an integration client method; the operation label is the method name, the status the error class."""
+
+    def decorator(function: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        operation: str = function.__name__
+
+        @wraps(function)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            status: str = "ok"
+            started: float = time.perf_counter()
+
+            try:
+                return await function(*args, **kwargs)
+
+            except Exception as e:
+                status = type(e).__name__
+                raise
+
+            finally:
+                INTEGRATION_REQUEST_DURATION.observe(
+                    time.perf_counter() - started,
+                    integration=integration,
+                    operation=operation,
+                    status=status,
+                )
+                INTEGRATION_REQUESTS.inc(integration=integration, operation=operation, status=status)
+
+        return wrapper
+
+    return decorator
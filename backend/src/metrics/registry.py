@@ -0,0 +1,147 @@
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Sample = tuple[str, dict[str, str], float]
+Collector = Callable[[], Iterable[tuple["MetricFamily", Iterable[Sample]]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+@dataclass(frozen=True)
+class MetricFamily:
+    name: str
+    documentation: str
+    type: str
+
+    def header(self) -> str:
+        return f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.type}\n"
+
+
+@dataclass
+class Counter:
+    name: str
+    documentation: str
+    label_names: tuple[str, ...]
+    _values: dict[tuple[str, ...], float] = field(default_factory=dict, init=False, repr=False)
+
+    def inc(self, amount: float = 1.0, /, **labels: str) -> None:
+        key: tuple[str, ...] = tuple(labels[name] for name in self.label_names)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def collect(self) -> tuple[MetricFamily, list[Sample]]:
+        family = MetricFamily(name=self.name, documentation=self.documentation, type="counter")
+        samples: list[Sample] = [
+            (f"{self.name}_total", dict(zip(self.label_names, key, strict=True)), value)
+            for key, value in self._values.items()
+        ]
+        return family, samples
+
+
+@dataclass
+class _HistogramState:
+    bucket_counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class Histogram:
+    name: str
+    documentation: str
+    label_names: tuple[str, ...]
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    _states: dict[tuple[str, ...], _HistogramState] = field(default_factory=dict, init=False, repr=False)
+
+    def observe(self, value: float, /, **labels: str) -> None:
+        key: tuple[str, ...] = tuple(labels[name] for name in self.label_names)
+        state: _HistogramState | None = self._states.get(key)
+
+        if state is None:
+            state = _HistogramState(bucket_counts=[0] * len(self.buckets))
+            self._states[key] = state
+
+        for index, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                state.bucket_counts[index] += 1
+                break
+
+        state.total += value
+        state.count += 1
+
+    def collect(self) -> tuple[MetricFamily, list[Sample]]:
+        family = MetricFamily(name=self.name, documentation=self.documentation, type="histogram")
+        samples: list[Sample] = []
+
+        for key, state in self._states.items():
+            labels: dict[str, str] = dict(zip(self.label_names, key, strict=True))
+            cumulative: int = 0
+
+            for upper_bound, bucket_count in zip(self.buckets, state.bucket_counts, strict=True):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(upper_bound)}, cumulative))
+
+            samples.append((f"{self.name}_bucket", {**labels, "le": "+Inf"}, state.count))
+            samples.append((f"{self.name}_sum", labels, state.total))
+            samples.append((f"{self.name}_count", labels, state.count))
+
+        return family, samples
+
+
+@dataclass
+class MetricsRegistry:
+    _metrics: list[Counter | Histogram] = field(default_factory=list, init=False)
+    _collectors: list[Collector] = field(default_factory=list, init=False)
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        counter = Counter(name=name, documentation=documentation, label_names=label_names)
+        self._metrics.append(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name=name, documentation=documentation, label_names=label_names, buckets=buckets)
+        self._metrics.append(histogram)
+        return histogram
+
+    def register_collector(self, collector: Collector) -> None:
+        """Register a callback evaluated at scrape time, for values owned by other objects (e.g. pools)."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        families: list[tuple[MetricFamily, Iterable[Sample]]] = [metric.collect() for metric in self._metrics]
+        for collector in self._collectors:
+            families.extend(collector())
+
+        lines: list[str] = []
+        for family, samples in families:
+            lines.append(family.header())
+            lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}\n" for name, labels, value in samples)
+
+        return "".join(lines)
@@ -0,0 +1,5 @@
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .server_timing import ServerTimingMiddleware
+
+__all__: list[str] = ["MetricsMiddleware", "ProfilingMiddleware", "ServerTimingMiddleware"]
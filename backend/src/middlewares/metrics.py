@@ -0,0 +1,43 @@
+import time
+from dataclasses import dataclass
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+UNMATCHED_ROUTE: str = "unmatched"
+
+
+@dataclass
+class MetricsMiddleware:
+    """Record latency per route template (not raw path) to keep label cardinality bounded."""
+
+    app: ASGIApp
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int = 500
+        started: float = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+
+        finally:
+            route: BaseRoute | None = scope.get("route")
+            labels: dict[str, str] = {
+                "method": scope["method"],
+                "route": getattr(route, "path", UNMATCHED_ROUTE),
+                "status_code": str(status_code),
+            }
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, **labels)
+            HTTP_REQUESTS.inc(**labels)
@@ -0,0 +1,140 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import logfire
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.database import database
+from src.database.models import RequestProfile, User
+from src.enums import Permission, SessionMode
+from src.errors import AuthenticationError, AuthorizationError
+from src.repositories import AuthRepository, RequestProfileRepository
+from src.services import AuthService
+
+from .metrics import UNMATCHED_ROUTE
+
+PROFILE_HEADER: bytes = b"x-profile"
+PROFILE_ID_HEADER: bytes = b"x-profile-id"
+
+
+def _header(scope: Scope, name: bytes) -> bytes | None:
+    return next((value for key, value in scope["headers"] if key == name), None)
+
+
+@dataclass
+class ProfilingMiddleware:
+    """Statistical profiling of requests sent with ``X-Profile: 1`` by a ``profile_requests`` holder, or sampled.
+
+    Requests that are neither cost one header lookup. One request per process is profiled at a time;
+    its speedscope flame graph is stored in ``request_profile`` and listed under ``/profiles``.
+    """
+
+    app: ASGIApp
+    sample_rate: float = 0.0
+    interval: float = 0.001
+    keep: int = 200
+    _busy: bool = field(default=False, init=False, repr=False)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+
+        requested: bool = _header(scope, PROFILE_HEADER) in (b"1", b"true")
+        sampled: bool = self.sample_rate > 0 and random.random() < self.sample_rate  # noqa: S311
+        if not requested and not sampled:
+            await self.app(scope, receive, send)
+            return
+
+        user_id: UUID | None = await self._profiling_user(scope) if requested else None
+        if (user_id is None and not sampled) or self._busy:
+            await self.app(scope, receive, send)
+            return
+
+        await self._profile(scope, receive, send, user_id=user_id)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send, user_id: UUID | None) -> None:
+        profile_id: UUID = uuid4()
+        status_code: int = 500
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if user_id is not None:
+                    message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER, str(profile_id).encode())]
+            await send(message)
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        self._busy = True
+        started: float = time.perf_counter()
+        profiler.start()
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+
+        finally:
+            # Failing requests are the ones most worth a flame graph, so the profile is kept either way
+            profiler.stop()
+            self._busy = False
+            await self._store(
+                scope,
+                profiler=profiler,
+                profile_id=profile_id,
+                status_code=status_code,
+                duration_ms=(time.perf_counter() - started) * 1000,
+                user_id=user_id,
+            )
+
+    async def _store(
+        self,
+        scope: Scope,
+        profiler: Profiler,
+        profile_id: UUID,
+        status_code: int,
+        duration_ms: float,
+        user_id: UUID | None,
+    ) -> None:
+        route: BaseRoute | None = scope.get("route")
+        content: str = await asyncio.to_thread(profiler.output, renderer=SpeedscopeRenderer())
+
+        try:
+            async with database.session_scope() as session:
+                await RequestProfileRepository(session=session).create(
+                    profile=RequestProfile(
+                        id=profile_id,
+                        method=scope["method"],
+                        route=getattr(route, "path", UNMATCHED_ROUTE),
+                        status_code=status_code,
+                        duration_ms=duration_ms,
+                        id_user=user_id,
+                        content=content.encode(),
+                    ),
+                    keep=self.keep,
+                )
+
+        except SQLAlchemyError:
+            logfire.exception("Failed to store request profile {id}", id=str(profile_id))
+
+    async def _profiling_user(self, scope: Scope) -> UUID | None:
+        authorization: str = (_header(scope, b"authorization") or b"").decode("latin-1")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+
+        async with database.session_scope(mode=SessionMode.READ_ONLY) as session:
+            try:
+                user: User = await AuthService(repository=AuthRepository(session=session)).get_current_user(
+                    access_token=token, required_scopes={Permission.PROFILE_REQUESTS}
+                )
+            except (AuthenticationError, AuthorizationError):
+                return None
+
+            return user.id
@@ -0,0 +1,39 @@
+import time
+from dataclasses import dataclass
+
+from opentelemetry import trace
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils import ServerTimings, current_server_timings
+
+TOTAL_TIMING: str = "total"
+
+
+@dataclass
+class ServerTimingMiddleware:
+    """Report the steps timed with ``server_timing`` in the ``Server-Timing`` header and on the request span."""
+
+    app: ASGIApp
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = ServerTimings()
+        started: float = time.perf_counter()
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start" and timings.durations:
+                timings.record(TOTAL_TIMING, (time.perf_counter() - started) * 1000)
+                MutableHeaders(scope=message).append("Server-Timing", timings.header())
+                trace.get_current_span().set_attributes(timings.attributes())
+            await send(message)
+
+        token = current_server_timings.set(timings)
+        try:
+            await self.app(scope, receive, send_with_timings)
+
+        finally:
+            current_server_timings.reset(token)
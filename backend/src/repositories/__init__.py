@@ -1,4 +1,19 @@
 from .auth_repository import AuthRepository
+from .drift_repository import DriftRepository
+from .idempotency_repository import IdempotencyRepository
+from .logfire_channel_repository import LogfireChannelRepository
 from .project_repository import ProjectRepository
+from .provisioning_job_repository import ProvisioningJobRepository
+from .quality_gate_snapshot_repository import QualityGateSnapshotRepository
+from .request_profile_repository import RequestProfileRepository
 
-__all__: list[str] = ["AuthRepository", "ProjectRepository"]
+__all__: list[str] = [
+    "AuthRepository",
+    "DriftRepository",
+    "IdempotencyRepository",
+    "LogfireChannelRepository",
+    "ProjectRepository",
+    "ProvisioningJobRepository",
+    "QualityGateSnapshotRepository",
+    "RequestProfileRepository",
+]
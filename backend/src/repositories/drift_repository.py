@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import ProjectDrift
+
+
+@dataclass
+class DriftRepository:
+    session: AsyncSession
+
+    async def record(self, drifts: list[ProjectDrift]) -> None:
+        self.session.add_all(drifts)
+        await self.session.flush()
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Result, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import IdempotencyKey
+from src.enums import IdempotencyStatus
+
+
+@dataclass
+class IdempotencyRepository:
+    session: AsyncSession
+
+    async def claim(
+        self, scope: str, key: str, request_hash: str, expired_before: datetime, abandoned_before: datetime
+    ) -> bool:
+        """Insert an in-progress record, replacing an expired or abandoned one; ``False`` if another holds the key.
+
+        An in-progress record is abandoned once its lease, renewed through ``renew``, is older than
+        ``abandoned_before``: its holder died before completing or releasing it.
+        """
+        await self.session.execute(
+            statement=delete(IdempotencyKey).where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                or_(
+                    IdempotencyKey.created_at < expired_before,
+                    (IdempotencyKey.status == IdempotencyStatus.IN_PROGRESS)
+                    & (IdempotencyKey.updated_at < abandoned_before),
+                ),
+            )
+        )
+        result: Result[tuple[object]] = await self.session.execute(
+            statement=insert(IdempotencyKey)
+            .values(scope=scope, key=key, request_hash=request_hash, status=IdempotencyStatus.IN_PROGRESS)
+            .on_conflict_do_nothing(index_elements=[IdempotencyKey.scope, IdempotencyKey.key])
+            .returning(IdempotencyKey.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def get(self, scope: str, key: str) -> IdempotencyKey | None:
+        result: Result[tuple[IdempotencyKey]] = await self.session.execute(
+            statement=select(IdempotencyKey).where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+        )
+        return result.scalar_one_or_none()
+
+    async def renew(self, scope: str, key: str) -> None:
+        await self.session.execute(
+            statement=update(IdempotencyKey)
+            .where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status == IdempotencyStatus.IN_PROGRESS,
+            )
+            .values(updated_at=func.now())
+        )
+
+    async def complete(self, scope: str, key: str, status_code: int, body: bytes, media_type: str | None) -> None:
+        await self.session.execute(
+            statement=update(IdempotencyKey)
+            .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            .values(
+                status=IdempotencyStatus.COMPLETED,
+                response_status=status_code,
+                response_body=body,
+                media_type=media_type,
+            )
+        )
+
+    async def release(self, scope: str, key: str) -> None:
+        await self.session.execute(
+            statement=delete(IdempotencyKey).where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status == IdempotencyStatus.IN_PROGRESS,
+            )
+        )
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from sqlalchemy import Result, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import LogfireChannel
+
+
+@dataclass
+class LogfireChannelRepository:
+    session: AsyncSession
+
+    async def get_channel_id(self, webhook_url: str) -> str | None:
+        result: Result[tuple[str]] = await self.session.execute(
+            statement=select(LogfireChannel.id_channel_logfire).where(
+                LogfireChannel.webhook_url == webhook_url, LogfireChannel.is_active.is_(True)
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def deactivate(self, webhook_url: str, id_channel_logfire: str) -> None:
+        """Retire the stored channel, unless another replica already replaced it with a new one."""
+        await self.session.execute(
+            statement=update(LogfireChannel)
+            .where(
+                LogfireChannel.webhook_url == webhook_url,
+                LogfireChannel.id_channel_logfire == id_channel_logfire,
+            )
+            .values(is_active=False)
+        )
+
+    async def save(self, webhook_url: str, id_channel_logfire: str) -> None:
+        await self.session.execute(
+            statement=insert(LogfireChannel)
+            .values(webhook_url=webhook_url, id_channel_logfire=id_channel_logfire)
+            .on_conflict_do_update(
+                index_elements=[LogfireChannel.webhook_url],
+                set_={"id_channel_logfire": id_channel_logfire, "is_active": True},
+            )
+        )
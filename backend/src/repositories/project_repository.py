@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import Result, select
+from sqlalchemy import Result, event, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from src.database.models.project import Project
+from src.utils import response_cache, slugify
 
 
 @dataclass
@@ -19,9 +21,12 @@ class ProjectRepository:
         url_repository: str,
         description: str | None = None,
         id_project_logfire: str | None = None,
+        project_type: str = "backend",
     ) -> Project:
         project = Project(
             name=name,
+            slug=slugify(name),
+            project_type=project_type,
             description=description,
             id_user=id_user,
             id_project_gitlab=id_project_gitlab,
@@ -30,20 +35,88 @@ class ProjectRepository:
         )
         self.session.add(project)
         await self.session.flush()
+
+        def invalidate_cached_responses(_: Session) -> None:
+            response_cache.invalidate_user(user_id=id_user)
+
+        event.listen(self.session.sync_session, "after_commit", invalidate_cached_responses, once=True)
+
         return project
 
     async def get_by_id(self, project_id: UUID) -> Project | None:
         result: Result[tuple[Project]] = await self.session.execute(
-            statement=select(Project).where(Project.id == project_id)
+            statement=select(Project).where(Project.id == project_id, Project.is_active.is_(True))
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_name(self, name: str) -> Project | None:
+        result: Result[tuple[Project]] = await self.session.execute(
+            statement=select(Project).where(func.lower(Project.name) == name.lower(), Project.is_active.is_(True))
         )
         return result.scalar_one_or_none()
 
+    async def exists_by_name(self, name: str) -> bool:
+        """Whether an active project has the same slug, i.e. would collide on the SonarQube key."""
+        result: Result[tuple[bool]] = await self.session.execute(
+            statement=select(
+                select(Project.id).where(Project.slug == slugify(name), Project.is_active.is_(True)).exists()
+            )
+        )
+        return bool(result.scalar())
+
+    async def exists_by_gitlab_id(self, gitlab_project_id: int) -> bool:
+        result: Result[tuple[bool]] = await self.session.execute(
+            statement=select(
+                select(Project.id)
+                .where(Project.id_project_gitlab == gitlab_project_id, Project.is_active.is_(True))
+                .exists()
+            )
+        )
+        return bool(result.scalar())
+
     async def list_by_user(self, user_id: UUID) -> list[Project]:
         result: Result[tuple[Project]] = await self.session.execute(
-            statement=select(Project).where(Project.id_user == user_id)
+            statement=select(Project).where(Project.id_user == user_id, Project.is_active.is_(True))
         )
         return list(result.scalars().all())
 
     async def list_all_repositories(self) -> list[Project]:
         result: Result[tuple[Project]] = await self.session.execute(statement=select(Project))
         return list(result.scalars().all())
+
+    async def list_active(self) -> list[Project]:
+        result: Result[tuple[Project]] = await self.session.execute(
+            statement=select(Project).where(Project.is_active.is_(True))
+        )
+        return list(result.scalars().all())
+
+    async def page_active(self, offset: int, limit: int) -> tuple[list[Project], int]:
+        total: int | None = await self.session.scalar(
+            statement=select(func.count()).select_from(Project).where(Project.is_active.is_(True))
+        )
+        result: Result[tuple[Project]] = await self.session.execute(
+            statement=select(Project)
+            .where(Project.is_active.is_(True))
+            .order_by(Project.name, Project.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return list(result.scalars().all()), total or 0
+
+    async def deactivate(self, project_ids: list[UUID]) -> None:
+        if not project_ids:
+            return
+
+        result: Result[tuple[UUID]] = await self.session.execute(
+            statement=update(Project)
+            .where(Project.id.in_(project_ids))
+            .values(is_active=False)
+            .returning(Project.id_user)
+        )
+        user_ids: set[UUID] = set(result.scalars().all())
+
+        def invalidate_cached_responses(_: Session) -> None:
+            for user_id in user_ids:
+                response_cache.invalidate_user(user_id=user_id)
+
+        event.listen(self.session.sync_session, "after_commit", invalidate_cached_responses, once=True)
@@ -0,0 +1,74 @@
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Result, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import ProvisioningJob
+from src.enums import ProvisioningJobStatus
+
+
+@dataclass
+class ProvisioningJobRepository:
+    session: AsyncSession
+
+    async def create(self, name: str, id_user: UUID) -> ProvisioningJob:
+        job = ProvisioningJob(name=name, id_user=id_user, status=ProvisioningJobStatus.RUNNING)
+        self.session.add(job)
+        await self.session.flush()
+        return job
+
+    async def update(self, job_id: UUID, expected_status: ProvisioningJobStatus | None = None, **values: Any) -> bool:
+        """Update the job, only while it is in ``expected_status`` if given; returns whether it was updated."""
+        statement = update(ProvisioningJob).where(ProvisioningJob.id == job_id)
+        if expected_status is not None:
+            statement = statement.where(ProvisioningJob.status == expected_status)
+
+        result: Result[tuple[UUID]] = await self.session.execute(
+            statement=statement.values(**values).returning(ProvisioningJob.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def list_in_flight(self, updated_after: datetime) -> list[ProvisioningJob]:
+        """Jobs still running or finished after ``updated_after``, whose upstream projects may lack a row."""
+        result: Result[tuple[ProvisioningJob]] = await self.session.execute(
+            statement=select(ProvisioningJob).where(
+                or_(
+                    ProvisioningJob.status == ProvisioningJobStatus.RUNNING,
+                    ProvisioningJob.updated_at >= updated_after,
+                )
+            )
+        )
+        return list(result.scalars().all())
+
+    async def list_by_upstream(
+        self, gitlab_ids: Collection[int], sonarqube_keys: Collection[str]
+    ) -> list[ProvisioningJob]:
+        """Jobs that created any of these upstream projects, i.e. the ones provisioning owns."""
+        result: Result[tuple[ProvisioningJob]] = await self.session.execute(
+            statement=select(ProvisioningJob).where(
+                or_(
+                    ProvisioningJob.id_project_gitlab.in_(gitlab_ids),
+                    ProvisioningJob.sonarqube_project_key.in_(sonarqube_keys),
+                )
+            )
+        )
+        return list(result.scalars().all())
+
+    async def claim_interrupted(self, stale_before: datetime) -> list[ProvisioningJob]:
+        """Lock jobs to recover; ``RUNNING`` ones only count once stale, since a live replica may own them."""
+        result: Result[tuple[ProvisioningJob]] = await self.session.execute(
+            statement=select(ProvisioningJob)
+            .where(
+                or_(
+                    ProvisioningJob.status == ProvisioningJobStatus.INTERRUPTED,
+                    (ProvisioningJob.status == ProvisioningJobStatus.RUNNING)
+                    & (ProvisioningJob.updated_at < stale_before),
+                )
+            )
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
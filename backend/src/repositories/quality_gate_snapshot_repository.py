@@ -0,0 +1,70 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Result, RowMapping, UnaryExpression, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import Project, QualityGateSnapshot
+from src.enums import TrendBucket
+
+PASSED_STATUS: str = "OK"
+
+
+@dataclass
+class QualityGateSnapshotRepository:
+    session: AsyncSession
+
+    async def record(
+        self,
+        project_id: UUID,
+        analysed_at: datetime,
+        status: str,
+        conditions: dict[str, str],
+        failed_metrics: list[str],
+    ) -> None:
+        """Append a snapshot; a redelivered analysis (same project and timestamp) is ignored."""
+        await self.session.execute(
+            statement=insert(QualityGateSnapshot)
+            .values(
+                id_project=project_id,
+                analysed_at=analysed_at,
+                status=status,
+                conditions=conditions,
+                failed_metrics=failed_metrics,
+            )
+            .on_conflict_do_nothing(index_elements=[QualityGateSnapshot.id_project, QualityGateSnapshot.analysed_at])
+        )
+
+    async def trends(self, since: datetime, bucket: TrendBucket) -> Sequence[RowMapping]:
+        """Per-project and fleet-wide buckets in one pass; fleet rows have a null ``id_project``."""
+        # The unit is inlined so SELECT, GROUP BY and ORDER BY compile to the same expression.
+        period: ColumnElement[datetime] = func.date_trunc(
+            literal_column(f"'{bucket.value}'"), QualityGateSnapshot.analysed_at
+        )
+        newest_first: UnaryExpression[datetime] = QualityGateSnapshot.analysed_at.desc()
+
+        result: Result[Any] = await self.session.execute(
+            statement=select(
+                QualityGateSnapshot.id_project,
+                Project.name,
+                period.label("bucket"),
+                func.count().label("total"),
+                func.count().filter(QualityGateSnapshot.status == PASSED_STATUS).label("passed"),
+                array_agg(aggregate_order_by(QualityGateSnapshot.status, newest_first))[1].label("last_status"),
+                array_agg(aggregate_order_by(QualityGateSnapshot.conditions, newest_first))[1].label("last_conditions"),
+            )
+            .join(Project, Project.id == QualityGateSnapshot.id_project)
+            .where(QualityGateSnapshot.analysed_at >= since, Project.is_active.is_(True))
+            .group_by(
+                func.grouping_sets(
+                    tuple_(QualityGateSnapshot.id_project, Project.name, period),
+                    tuple_(period),
+                )
+            )
+            .order_by(period)
+        )
+        return result.mappings().all()
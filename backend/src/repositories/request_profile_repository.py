@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import Result, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from src.database.models import RequestProfile
+
+
+@dataclass
+class RequestProfileRepository:
+    session: AsyncSession
+
+    async def create(self, profile: RequestProfile, keep: int) -> None:
+        """Store a profile and drop all but the ``keep`` most recent ones."""
+        self.session.add(profile)
+        await self.session.flush()
+
+        await self.session.execute(
+            statement=delete(RequestProfile).where(
+                RequestProfile.id.not_in(
+                    select(RequestProfile.id).order_by(RequestProfile.created_at.desc()).limit(keep)
+                )
+            )
+        )
+
+    async def get(self, profile_id: UUID) -> RequestProfile | None:
+        return await self.session.get(RequestProfile, profile_id)
+
+    async def list_recent(self, limit: int) -> list[RequestProfile]:
+        result: Result[tuple[RequestProfile]] = await self.session.execute(
+            statement=select(RequestProfile)
+            .options(defer(RequestProfile.content))
+            .order_by(RequestProfile.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
@@ -1,5 +1,6 @@
 from .auth_http import auth_router
+from .profile_http import profile_router
 from .project_http import project_router
 from .webhook_http import webhook_router
 
-__all__: list[str] = ["auth_router", "project_router", "webhook_router"]
+__all__: list[str] = ["auth_router", "profile_router", "project_router", "webhook_router"]
@@ -1,16 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from src.enums import SessionMode
 from src.errors import AuthenticationError
 from src.schemas import Token
 from src.services import AuthService
 
-from .dependencies import get_auth_service
+from .dependencies import get_auth_service, session_mode
 
 auth_router: APIRouter = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-@auth_router.post("/login", response_model=Token)
+@auth_router.post("/login", response_model=Token, dependencies=[Depends(session_mode(SessionMode.READ_ONLY))])
 async def login(
     response: Response,
     credentials: OAuth2PasswordRequestForm = Depends(),
@@ -1,15 +1,31 @@
 from .dependencies import (
     get_auth_service,
+    get_container,
     get_current_user,
+    get_fleet_service,
     get_gitlab_client,
+    get_idempotency_service,
     get_project_service,
+    get_quality_history_service,
+    get_request_profile_service,
+    get_session,
+    get_template_upgrade_service,
     get_webhook_service,
+    session_mode,
 )
 
 __all__: list[str] = [
     "get_auth_service",
+    "get_container",
     "get_current_user",
+    "get_fleet_service",
     "get_gitlab_client",
+    "get_idempotency_service",
     "get_project_service",
+    "get_quality_history_service",
+    "get_request_profile_service",
+    "get_session",
+    "get_template_upgrade_service",
     "get_webhook_service",
+    "session_mode",
 ]
@@ -1,24 +1,70 @@
-from pathlib import Path
+from collections.abc import AsyncGenerator, Callable
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.builders import BackendBuilder
+from src.builders import BuilderRegistry
 from src.configurations import configuration
+from src.containers import Container
 from src.database import database
 from src.database.models import User
+from src.enums import SessionMode
 from src.errors import AuthenticationError, AuthorizationError
 from src.integrations import GitLabClient, JiraClient, LogfireClient, SonarQubeClient, TicketAgent
-from src.repositories import AuthRepository, ProjectRepository
-from src.services import AuthService, ProjectService, WebhookService
-from src.utils.template_generator import TemplateGenerator
+from src.repositories import (
+    AuthRepository,
+    ProjectRepository,
+    QualityGateSnapshotRepository,
+    RequestProfileRepository,
+)
+from src.services import (
+    AuthService,
+    FleetService,
+    IdempotencyService,
+    ProjectService,
+    QualityHistoryService,
+    RequestProfileService,
+    TemplateUpgradeService,
+    WebhookService,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+READ_ONLY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def session_mode(mode: SessionMode) -> Callable[[Request], None]:
+    """Route-level dependency declaring the session intent, overriding the HTTP method default."""
+
+    def declare(request: Request) -> None:
+        request.state.session_mode = mode
+
+    return declare
+
+
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """One session per request, shared by the auth chain and services.
+
+    FastAPI keys its dependency cache on security scopes too, so ``Security`` and ``Depends``
+    consumers would otherwise open separate sessions.
+    """
+    shared_session: AsyncSession | None = getattr(request.state, "session", None)
+    if shared_session is not None:
+        yield shared_session
+        return
+
+    mode: SessionMode | None = getattr(request.state, "session_mode", None)
+    if mode is None:
+        mode = SessionMode.READ_ONLY if request.method in READ_ONLY_METHODS else SessionMode.READ_WRITE
+
+    async with database.session_scope(mode=mode) as session:
+        request.state.session = session
+        yield session
+
 
 def get_auth_service(
-    session: AsyncSession = Depends(dependency=database.get_async_session),
+    session: AsyncSession = Depends(dependency=get_session),
 ) -> AuthService:
     return AuthService(repository=AuthRepository(session=session))
 
@@ -47,44 +93,32 @@ async def get_current_user(
         ) from permissions_error
 
 
-def get_gitlab_client() -> GitLabClient:
-    return GitLabClient(
-        base_url=f"{configuration.GITLAB_API_URL}api/v4/",
-        private_token=configuration.GITLAB_PRIVATE_TOKEN,
-        gitlab_namespace_id=configuration.GITLAB_NAMESPACE_ID,
-    )
+def get_container(request: Request) -> Container:
+    return request.app.state.container
 
 
-def get_sonarqube_client() -> SonarQubeClient:
-    return SonarQubeClient(
-        base_url=f"{configuration.SONARQUBE_API_URL}",
-        token=configuration.SONARQUBE_TOKEN,
-    )
+def get_gitlab_client(container: Container = Depends(dependency=get_container)) -> GitLabClient:
+    return container.gitlab
 
 
-def get_logfire_client() -> LogfireClient:
-    return LogfireClient(
-        base_url=f"{configuration.LOGFIRE_API_URL}",
-        token=configuration.LOGFIRE_TOKEN,
-    )
+def get_sonarqube_client(container: Container = Depends(dependency=get_container)) -> SonarQubeClient:
+    return container.sonarqube
 
 
-def get_backend_builder() -> BackendBuilder:
-    templates_directory: Path = Path(__file__).parent.parent.parent / "templates"
-    template_generator = TemplateGenerator(templates_directory=templates_directory)
-    return BackendBuilder(template_generator=template_generator)
+def get_logfire_client(container: Container = Depends(dependency=get_container)) -> LogfireClient:
+    return container.logfire
 
 
-def get_jira_client() -> JiraClient:
-    return JiraClient(
-        base_url=f"{configuration.JIRA_API_URL}",
-        user_email=configuration.JIRA_USER_EMAIL,
-        token=configuration.JIRA_TOKEN,
-    )
+def get_builder_registry(container: Container = Depends(dependency=get_container)) -> BuilderRegistry:
+    return container.builders
+
 
+def get_jira_client(container: Container = Depends(dependency=get_container)) -> JiraClient:
+    return container.jira
 
-def get_ticket_agent() -> TicketAgent:
-    return TicketAgent(api_key=configuration.GEMINI_API_KEY, model_name=configuration.GEMINI_MODEL)
+
+def get_ticket_agent(container: Container = Depends(dependency=get_container)) -> TicketAgent:
+    return container.ticket_agent
 
 
 def get_webhook_service(
@@ -99,18 +133,69 @@ def get_webhook_service(
 
 
 def get_project_service(
-    session: AsyncSession = Depends(dependency=database.get_async_session),
+    session: AsyncSession = Depends(dependency=get_session),
     gitlab_client: GitLabClient = Depends(dependency=get_gitlab_client),
     sonarqube_client: SonarQubeClient = Depends(dependency=get_sonarqube_client),
     logfire_client: LogfireClient = Depends(dependency=get_logfire_client),
-    backend_builder: BackendBuilder = Depends(dependency=get_backend_builder),
+    builders: BuilderRegistry = Depends(dependency=get_builder_registry),
+    container: Container = Depends(dependency=get_container),
 ) -> ProjectService:
     return ProjectService(
         gitlab=gitlab_client,
         sonarqube=sonarqube_client,
         logfire=logfire_client,
         repository=ProjectRepository(session=session),
-        template_builder=backend_builder,
+        builders=builders,
+        channels=container.logfire_channels,
+        limits=container.upstream_limits,
+        user_ids=container.gitlab_user_ids,
         webhook_base_url=str(configuration.WEBHOOK_BASE_URL),
         sonarqube_alm_setting=configuration.SONARQUBE_ALM_SETTING,
     )
+
+
+def get_fleet_service(
+    session: AsyncSession = Depends(dependency=get_session),
+    sonarqube_client: SonarQubeClient = Depends(dependency=get_sonarqube_client),
+    container: Container = Depends(dependency=get_container),
+) -> FleetService:
+    return FleetService(
+        sonarqube=sonarqube_client,
+        repository=ProjectRepository(session=session),
+        measures_cache=container.quality_measures_cache,
+    )
+
+
+def get_quality_history_service(
+    session: AsyncSession = Depends(dependency=get_session),
+    sonarqube_client: SonarQubeClient = Depends(dependency=get_sonarqube_client),
+) -> QualityHistoryService:
+    return QualityHistoryService(
+        sonarqube=sonarqube_client,
+        projects=ProjectRepository(session=session),
+        snapshots=QualityGateSnapshotRepository(session=session),
+    )
+
+
+def get_template_upgrade_service(
+    gitlab_client: GitLabClient = Depends(dependency=get_gitlab_client),
+    builders: BuilderRegistry = Depends(dependency=get_builder_registry),
+) -> TemplateUpgradeService:
+    return TemplateUpgradeService(
+        gitlab=gitlab_client,
+        builders=builders,
+    )
+
+
+def get_request_profile_service(
+    session: AsyncSession = Depends(dependency=get_session),
+) -> RequestProfileService:
+    return RequestProfileService(repository=RequestProfileRepository(session=session))
+
+
+def get_idempotency_service() -> IdempotencyService:
+    return IdempotencyService(
+        ttl_seconds=configuration.IDEMPOTENCY_TTL_SECONDS,
+        wait_timeout_seconds=configuration.IDEMPOTENCY_WAIT_SECONDS,
+        lease_seconds=configuration.IDEMPOTENCY_LEASE_SECONDS,
+    )
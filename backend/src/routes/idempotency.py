@@ -0,0 +1,21 @@
+from fastapi import Header, Response
+
+from src.schemas import StoredResponse
+
+IDEMPOTENCY_KEY_HEADER: str = "Idempotency-Key"
+
+
+def idempotency_key(
+    key: str | None = Header(default=None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
+) -> str | None:
+    return key
+
+
+def to_response(stored: StoredResponse) -> Response:
+    headers: dict[str, str] = {"Idempotent-Replayed": "true"} if stored.replayed else {}
+    return Response(
+        content=stored.content,
+        status_code=stored.status_code,
+        media_type=stored.media_type,
+        headers=headers,
+    )
@@ -0,0 +1,50 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Security, status
+
+from src.database.models import User
+from src.enums import Permission, SessionMode
+from src.errors import ProfileNotFoundError
+from src.schemas import RequestProfileSummary
+from src.services import RequestProfileService
+
+from .dependencies import get_current_user, get_request_profile_service, session_mode
+
+# Profiles are written by the middleware right before their id is returned, so reads skip the lagging replica
+profile_router: APIRouter = APIRouter(
+    prefix="/profiles", tags=["Profiles"], dependencies=[Depends(session_mode(SessionMode.READ_WRITE))]
+)
+
+SPEEDSCOPE_MEDIA_TYPE: str = "application/json"
+
+
+@profile_router.get(path="/", response_model=list[RequestProfileSummary])
+async def list_profiles(
+    limit: int = Query(default=50, ge=1, le=200),
+    _: User = Security(dependency=get_current_user, scopes=[Permission.PROFILE_REQUESTS]),
+    request_profile_service: RequestProfileService = Depends(dependency=get_request_profile_service),
+) -> list[RequestProfileSummary]:
+    return await request_profile_service.list_profiles(limit=limit)
+
+
+@profile_router.get(
+    path="/{profile_id}",
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"content": {SPEEDSCOPE_MEDIA_TYPE: {}}}},
+)
+async def download_profile(
+    profile_id: UUID,
+    _: User = Security(dependency=get_current_user, scopes=[Permission.PROFILE_REQUESTS]),
+    request_profile_service: RequestProfileService = Depends(dependency=get_request_profile_service),
+) -> Response:
+    try:
+        content: bytes = await request_profile_service.get_content(profile_id=profile_id)
+
+    except ProfileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    return Response(
+        content=content,
+        media_type=SPEEDSCOPE_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'},
+    )
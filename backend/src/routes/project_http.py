@@ -1,26 +1,127 @@
+import asyncio
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Security, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
+from src.configurations import configuration
 from src.database.models import User
-from src.enums import Permission
-from src.errors import GitLabError, LogfireError, ProjectNotFoundError, SonarQubeError
-from src.schemas import ProjectCreated, ProjectDetail, ProjectOverview, ProjectSummary
-from src.services import ProjectService
+from src.enums import Permission, TrendBucket
+from src.errors import (
+    DrainingError,
+    GitLabError,
+    IdempotencyInProgressError,
+    IdempotencyKeyMismatchError,
+    LogfireError,
+    ProjectConflictError,
+    ProjectNotFoundError,
+    SonarQubeError,
+    UnsupportedProjectTypeError,
+)
+from src.integrations.sonarqube.schemas import QualityGateStatus
+from src.schemas import (
+    FleetOverview,
+    OverviewEvent,
+    ProjectBatch,
+    ProjectCreated,
+    ProjectDetail,
+    ProjectOverview,
+    ProjectSummary,
+    ProvisioningResult,
+    QualityTrends,
+    StoredResponse,
+    TemplateUpgradeResult,
+)
+from src.services import (
+    FleetService,
+    IdempotencyService,
+    ProjectService,
+    QualityHistoryService,
+    TemplateUpgradeService,
+)
+from src.utils import (
+    DEFAULT_CACHE_CONTROL,
+    NDJSON_MEDIA_TYPE,
+    SSE_MEDIA_TYPE,
+    ZIP_MEDIA_TYPE,
+    CachedResponse,
+    conditional_response,
+    ndjson_stream,
+    provisioning_drain,
+    response_cache,
+    slugify,
+    sse_stream,
+)
 
-from .dependencies import get_current_user, get_project_service
+from .dependencies import (
+    get_current_user,
+    get_fleet_service,
+    get_idempotency_service,
+    get_project_service,
+    get_quality_history_service,
+    get_template_upgrade_service,
+)
+from .idempotency import idempotency_key, to_response
 
 project_router: APIRouter = APIRouter(prefix="/projects", tags=["Projects"])
 
+STREAM_HEADERS: dict[str, str] = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+_project_summaries: TypeAdapter[list[ProjectSummary]] = TypeAdapter(list[ProjectSummary])
+
 
 @project_router.post(path="/", response_model=ProjectCreated, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project: ProjectDetail,
+    key: str | None = Depends(dependency=idempotency_key),
     current_user: User = Security(dependency=get_current_user, scopes=[Permission.CREATE_PROJECT]),
     project_service: ProjectService = Depends(dependency=get_project_service),
-) -> ProjectCreated:
+    idempotency_service: IdempotencyService = Depends(dependency=get_idempotency_service),
+) -> Response:
+    async def provision() -> StoredResponse:
+        created: ProjectCreated = await project_service.create_project(project=project, user_id=current_user.id)
+        return StoredResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=created.model_dump_json(by_alias=True).encode(),
+            media_type="application/json",
+        )
+
+    work: Coroutine[Any, Any, StoredResponse] = (
+        provision()
+        if key is None
+        else idempotency_service.run(
+            scope=f"projects:create:{current_user.id}",
+            key=key,
+            request_hash=IdempotencyService.hash_request(project.model_dump_json().encode()),
+            produce=provision,
+        )
+    )
+
     try:
-        return await project_service.create_project(project=project, user_id=current_user.id)
+        # Provisioning outlives a dropped connection; shutdown drains it instead of cutting it short.
+        return to_response(await asyncio.shield(provisioning_drain.submit(work)))
+
+    except IdempotencyKeyMismatchError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    except DrainingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "30"},
+        ) from e
+
+    except UnsupportedProjectTypeError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    except ProjectConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
     except (GitLabError, LogfireError) as e:
         raise HTTPException(
@@ -29,22 +130,133 @@ async def create_project(
         ) from e
 
 
+@project_router.post(
+    path="/batch",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}, SSE_MEDIA_TYPE: {}}}},
+)
+async def create_projects(
+    batch: ProjectBatch,
+    request: Request,
+    current_user: User = Security(dependency=get_current_user, scopes=[Permission.CREATE_PROJECT]),
+    project_service: ProjectService = Depends(dependency=get_project_service),
+) -> StreamingResponse:
+    if not 0 < len(batch.projects) <= configuration.BATCH_PROVISIONING_MAX_PROJECTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"A batch holds between 1 and {configuration.BATCH_PROVISIONING_MAX_PROJECTS} projects",
+        )
+
+    try:
+        results: AsyncIterator[ProvisioningResult] = project_service.create_projects(
+            projects=batch.projects, user_id=current_user.id
+        )
+
+    except UnsupportedProjectTypeError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    except DrainingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "30"},
+        ) from e
+
+    if SSE_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            content=sse_stream(results, event_name="result"), media_type=SSE_MEDIA_TYPE, headers=STREAM_HEADERS
+        )
+
+    return StreamingResponse(content=ndjson_stream(results), media_type=NDJSON_MEDIA_TYPE, headers=STREAM_HEADERS)
+
+
+@project_router.post(
+    path="/preview",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {ZIP_MEDIA_TYPE: {}}}},
+)
+async def preview_project(
+    project: ProjectDetail,
+    _: User = Security(dependency=get_current_user, scopes=[Permission.CREATE_PROJECT]),
+    project_service: ProjectService = Depends(dependency=get_project_service),
+) -> StreamingResponse:
+    try:
+        content: Iterator[bytes] = project_service.preview_scaffold(project=project)
+
+    except UnsupportedProjectTypeError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    return StreamingResponse(
+        content=content,
+        media_type=ZIP_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{slugify(project.name)}.zip"'},
+    )
+
+
 @project_router.get(path="/", response_model=list[ProjectSummary])
 async def list_projects(
+    request: Request,
     current_user: User = Security(dependency=get_current_user, scopes=[Permission.READ_PROJECTS]),
     project_service: ProjectService = Depends(dependency=get_project_service),
-) -> list[ProjectSummary]:
-    return await project_service.list_projects(user_id=current_user.id)
+) -> Response:
+    async def render() -> bytes:
+        return _project_summaries.dump_json(await project_service.list_projects(user_id=current_user.id), by_alias=True)
+
+    cached: CachedResponse = await response_cache.get_or_set(
+        user_id=current_user.id, route=request.url.path, produce=render
+    )
+
+    return conditional_response(
+        request=request,
+        cached=cached,
+        cache_control=configuration.CACHE_CONTROL.get("list_projects", DEFAULT_CACHE_CONTROL),
+    )
+
+
+@project_router.get(path="/fleet", response_model=FleetOverview)
+async def get_fleet_overview(
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=50, ge=1, le=100),
+    _: User = Security(dependency=get_current_user, scopes=[Permission.READ_FLEET]),
+    fleet_service: FleetService = Depends(dependency=get_fleet_service),
+) -> FleetOverview:
+    try:
+        return await fleet_service.get_fleet_overview(page=page, page_size=page_size)
+
+    except SonarQubeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
+
+
+@project_router.get(path="/fleet/quality-trends", response_model=QualityTrends)
+async def get_quality_trends(
+    days: int = Query(default=30, ge=1, le=configuration.QUALITY_TREND_MAX_DAYS),
+    bucket: TrendBucket = Query(default=TrendBucket.DAY),
+    _: User = Security(dependency=get_current_user, scopes=[Permission.READ_FLEET]),
+    quality_history_service: QualityHistoryService = Depends(dependency=get_quality_history_service),
+) -> QualityTrends:
+    return await quality_history_service.trends(days=days, bucket=bucket)
 
 
 @project_router.get(path="/{project_id}", response_model=ProjectOverview)
 async def get_project(
     project_id: str,
+    request: Request,
     current_user: User = Security(dependency=get_current_user, scopes=[Permission.READ_PROJECTS]),
     project_service: ProjectService = Depends(dependency=get_project_service),
-) -> ProjectOverview:
+) -> Response:
+    async def render() -> bytes:
+        overview: ProjectOverview = await project_service.get_project_overview(
+            user_id=current_user.id, project_id=UUID(project_id)
+        )
+        return overview.model_dump_json(by_alias=True).encode()
+
     try:
-        return await project_service.get_project_overview(user_id=current_user.id, project_id=UUID(project_id))
+        cached: CachedResponse = await response_cache.get_or_set(
+            user_id=current_user.id, route=request.url.path, produce=render
+        )
 
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -54,3 +266,66 @@ async def get_project(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         ) from e
+
+    return conditional_response(
+        request=request,
+        cached=cached,
+        cache_control=configuration.CACHE_CONTROL.get("get_project", DEFAULT_CACHE_CONTROL),
+    )
+
+
+@project_router.get(
+    path="/{project_id}/stream",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}, SSE_MEDIA_TYPE: {}}}},
+)
+async def stream_project(
+    project_id: UUID,
+    request: Request,
+    current_user: User = Security(dependency=get_current_user, scopes=[Permission.READ_PROJECTS]),
+    project_service: ProjectService = Depends(dependency=get_project_service),
+) -> StreamingResponse:
+    try:
+        events: AsyncIterator[OverviewEvent] = await project_service.stream_project_overview(
+            user_id=current_user.id, project_id=project_id
+        )
+
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    if SSE_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(content=sse_stream(events), media_type=SSE_MEDIA_TYPE, headers=STREAM_HEADERS)
+
+    return StreamingResponse(content=ndjson_stream(events), media_type=NDJSON_MEDIA_TYPE, headers=STREAM_HEADERS)
+
+
+@project_router.post(path="/{project_id}/upgrade", response_model=TemplateUpgradeResult)
+async def upgrade_project(
+    project_id: UUID,
+    current_user: User = Security(dependency=get_current_user, scopes=[Permission.CREATE_PROJECT]),
+    template_upgrade_service: TemplateUpgradeService = Depends(dependency=get_template_upgrade_service),
+) -> TemplateUpgradeResult:
+    try:
+        return await template_upgrade_service.upgrade_owned(user_id=current_user.id, project_id=project_id)
+
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
+@project_router.post(path="/{project_id}/quality/refresh", response_model=QualityGateStatus)
+async def refresh_quality_gate(
+    project_id: UUID,
+    current_user: User = Security(dependency=get_current_user, scopes=[Permission.READ_PROJECTS]),
+    quality_history_service: QualityHistoryService = Depends(dependency=get_quality_history_service),
+) -> QualityGateStatus:
+    try:
+        return await quality_history_service.refresh(user_id=current_user.id, project_id=project_id)
+
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    except SonarQubeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
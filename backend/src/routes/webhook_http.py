@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import hmac
 
-from src.errors import GeminiError, JiraError
-from src.schemas import LogfireAlert
-from src.services import WebhookService
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 
-from .dependencies import get_webhook_service
+from src.configurations import configuration
+from src.errors import GeminiError, IdempotencyInProgressError, IdempotencyKeyMismatchError, JiraError
+from src.schemas import LogfireAlert, SonarQubeAnalysis, StoredResponse
+from src.services import IdempotencyService, QualityHistoryService, WebhookService
+
+from .dependencies import get_idempotency_service, get_quality_history_service, get_webhook_service
+from .idempotency import idempotency_key, to_response
 
 webhook_router: APIRouter = APIRouter(prefix="/webhooks", tags=["Webhooks"])
 
@@ -15,13 +20,61 @@ webhook_router: APIRouter = APIRouter(prefix="/webhooks", tags=["Webhooks"])
 )
 async def handle_logfire_alert(
     alert: LogfireAlert,
+    key: str | None = Depends(dependency=idempotency_key),
     webhook_service: WebhookService = Depends(dependency=get_webhook_service),
-) -> None:
-    try:
+    idempotency_service: IdempotencyService = Depends(dependency=get_idempotency_service),
+) -> Response:
+    async def create_ticket() -> StoredResponse:
         await webhook_service.handle_logfire_alert(alert=alert)
+        return StoredResponse(status_code=status.HTTP_204_NO_CONTENT)
+
+    request_hash: str = IdempotencyService.hash_request(alert.model_dump_json().encode())
+
+    try:
+        # Logfire redeliveries repeat the payload verbatim, so its hash stands in for a missing key.
+        stored: StoredResponse = await idempotency_service.run(
+            scope="webhooks:logfire:alerts",
+            key=key or request_hash,
+            request_hash=request_hash,
+            produce=create_ticket,
+        )
+
+    except IdempotencyKeyMismatchError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
     except (JiraError, GeminiError) as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=str(e),
         ) from e
+
+    return to_response(stored)
+
+
+@webhook_router.post(
+    path="/sonarqube/analysis",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def handle_sonarqube_analysis(
+    analysis: SonarQubeAnalysis,
+    request: Request,
+    signature: str | None = Header(default=None, alias="X-Sonar-Webhook-HMAC-SHA256"),
+    quality_history_service: QualityHistoryService = Depends(dependency=get_quality_history_service),
+) -> Response:
+    # Snapshots feed the fleet quality trends, so unsigned deliveries are never accepted
+    if not configuration.SONARQUBE_WEBHOOK_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="SonarQube webhook secret is not configured"
+        )
+
+    expected: str = hmac.new(
+        configuration.SONARQUBE_WEBHOOK_SECRET.encode(), await request.body(), hashlib.sha256
+    ).hexdigest()
+    if signature is None or not hmac.compare_digest(expected.encode(), signature.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature")
+
+    await quality_history_service.record_analysis(analysis=analysis)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,17 +1,47 @@
 from .auth import Token, TokenPayload
 from .builder import BuilderProjectData
-from .project import Member, ProjectCreated, ProjectDetail, ProjectOverview, ProjectSummary, StageStatus
-from .webhook import LogfireAlert
+from .fleet import FleetOverview, FleetProject
+from .idempotency import StoredResponse
+from .profile import RequestProfileSummary
+from .project import (
+    Member,
+    OverviewEvent,
+    ProjectBatch,
+    ProjectCreated,
+    ProjectDetail,
+    ProjectOverview,
+    ProjectSummary,
+    ProvisioningResult,
+    StageStatus,
+)
+from .quality import ProjectQualityTrend, QualityTrendPoint, QualityTrends
+from .reconciliation import DriftRecord, ReconciliationReport
+from .template_upgrade import TemplateUpgradeResult
+from .webhook import LogfireAlert, SonarQubeAnalysis
 
 __all__: list[str] = [
     "BuilderProjectData",
+    "DriftRecord",
+    "FleetOverview",
+    "FleetProject",
     "LogfireAlert",
     "Member",
+    "OverviewEvent",
+    "ProjectBatch",
     "ProjectCreated",
     "ProjectDetail",
     "ProjectOverview",
+    "ProjectQualityTrend",
     "ProjectSummary",
+    "ProvisioningResult",
+    "QualityTrendPoint",
+    "QualityTrends",
+    "ReconciliationReport",
+    "RequestProfileSummary",
+    "SonarQubeAnalysis",
     "Token",
     "TokenPayload",
     "StageStatus",
+    "StoredResponse",
+    "TemplateUpgradeResult",
 ]
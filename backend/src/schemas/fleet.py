@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class FleetProject(BaseModel):
+    id: UUID
+    name: str
+    project_key: str
+    quality_gate: str | None = None
+    measures: dict[str, str]
+
+
+class FleetOverview(BaseModel):
+    page: int
+    page_size: int
+    total: int
+    projects: list[FleetProject]
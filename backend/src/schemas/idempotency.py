@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class StoredResponse(BaseModel):
+    status_code: int
+    content: bytes = b""
+    media_type: str | None = None
+    replayed: bool = False
@@ -0,0 +1,16 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestProfileSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    method: str
+    route: str
+    status_code: int
+    duration_ms: float
+    id_user: UUID | None = None
+    created_at: datetime
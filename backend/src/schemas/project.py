@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
-from src.enums import Environment, Project
+from src.enums import Environment, OverviewSection, Project, ProvisioningResultStatus
 from src.integrations.gitlab.schemas import GitLabMember
 from src.integrations.sonarqube.schemas import QualityGateStatus
 
@@ -25,6 +25,18 @@ class ProjectCreated(BaseModel):
     project_id: UUID
 
 
+class ProjectBatch(BaseModel):
+    projects: list[ProjectDetail]
+
+
+class ProvisioningResult(BaseModel):
+    index: int
+    name: str
+    status: ProvisioningResultStatus
+    project: ProjectCreated | None = None
+    error: str | None = None
+
+
 class ProjectSummary(BaseModel):
     id: UUID
     name: str
@@ -41,3 +53,9 @@ class ProjectOverview(ProjectSummary):
     quality_gate: QualityGateStatus
     members: list[GitLabMember]
     stages: list[StageStatus]
+
+
+class OverviewEvent(BaseModel):
+    section: OverviewSection
+    data: ProjectSummary | QualityGateStatus | list[GitLabMember] | list[StageStatus] | None = None
+    error: str | None = None
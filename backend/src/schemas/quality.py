@@ -0,0 +1,27 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.enums import TrendBucket
+
+
+class QualityTrendPoint(BaseModel):
+    bucket: datetime
+    total: int
+    passed: int
+    last_status: str
+    conditions: dict[str, str] | None = None
+
+
+class ProjectQualityTrend(BaseModel):
+    id_project: UUID
+    name: str
+    points: list[QualityTrendPoint]
+
+
+class QualityTrends(BaseModel):
+    bucket: TrendBucket
+    since: datetime
+    fleet: list[QualityTrendPoint]
+    projects: list[ProjectQualityTrend]
@@ -0,0 +1,23 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.enums import DriftKind
+
+
+class DriftRecord(BaseModel):
+    kind: DriftKind
+    external_id: str
+    id_project: UUID | None = None
+    repaired: bool = False
+
+
+class ReconciliationReport(BaseModel):
+    started_at: datetime
+    duration_seconds: float
+    database_projects: int
+    gitlab_projects: int
+    sonarqube_projects: int
+    logfire_projects: int
+    drifts: list[DriftRecord]
@@ -0,0 +1,13 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.enums import TemplateUpgradeStatus
+
+
+class TemplateUpgradeResult(BaseModel):
+    id_project: UUID
+    status: TemplateUpgradeStatus
+    changed_files: list[str] = []
+    merge_request_url: str | None = None
+    error: str | None = None
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LogfireAlert(BaseModel):
@@ -12,3 +13,33 @@ class LogfireAlert(BaseModel):
     request: dict[str, Any]
     exception_message: str
     stack_trace: str
+
+
+class SonarQubeAnalysisCondition(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    metric: str
+    status: str
+    value: str | None = None
+
+
+class SonarQubeAnalysisQualityGate(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    status: str
+    conditions: list[SonarQubeAnalysisCondition] = []
+
+
+class SonarQubeAnalysisProject(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    key: str
+    name: str
+
+
+class SonarQubeAnalysis(BaseModel):
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    analysed_at: datetime = Field(alias="analysedAt")
+    project: SonarQubeAnalysisProject
+    quality_gate: SonarQubeAnalysisQualityGate | None = Field(default=None, alias="qualityGate")
@@ -0,0 +1,24 @@
+"""Production entrypoint with a configurable worker count and provisioning drain.
+
+Run with ``uv run python -m src.server``.
+"""
+
+import uvicorn
+
+from src.configurations import configuration
+
+
+def main() -> None:
+    # Each worker's lifespan closes the provisioning drain on SIGTERM, before uvicorn stops connections
+    uvicorn.run(
+        "src.main:app",
+        host=configuration.SERVER_HOST,
+        port=configuration.SERVER_PORT,
+        workers=configuration.SERVER_WORKERS,
+        timeout_graceful_shutdown=int(configuration.SHUTDOWN_DRAIN_SECONDS),
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
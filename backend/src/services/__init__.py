@@ -1,5 +1,25 @@
 from .auth_service import AuthService
+from .fleet_service import FleetService
+from .idempotency_service import IdempotencyService
+from .logfire_channel_registry import LogfireChannelRegistry
 from .project_service import ProjectService
+from .provisioning_journal import ProvisioningJournal
+from .quality_history_service import QualityHistoryService
+from .reconciliation_service import ReconciliationService
+from .request_profile_service import RequestProfileService
+from .template_upgrade_service import TemplateUpgradeService
 from .webhook_service import WebhookService
 
-__all__: list[str] = ["AuthService", "ProjectService", "WebhookService"]
+__all__: list[str] = [
+    "AuthService",
+    "FleetService",
+    "IdempotencyService",
+    "LogfireChannelRegistry",
+    "ProjectService",
+    "ProvisioningJournal",
+    "QualityHistoryService",
+    "ReconciliationService",
+    "RequestProfileService",
+    "TemplateUpgradeService",
+    "WebhookService",
+]
@@ -0,0 +1,81 @@
+import asyncio
+from dataclasses import dataclass
+
+from src.database.models import Project
+from src.integrations.sonarqube import MEASURES_SEARCH_MAX_PROJECTS, SonarQubeClient
+from src.integrations.sonarqube.schemas import SonarQubeMeasure
+from src.repositories import ProjectRepository
+from src.schemas import FleetOverview, FleetProject
+from src.utils import TTLCache, slugify
+
+QUALITY_GATE_METRIC: str = "alert_status"
+
+FLEET_METRIC_KEYS: list[str] = [
+    QUALITY_GATE_METRIC,
+    "bugs",
+    "vulnerabilities",
+    "code_smells",
+    "coverage",
+    "duplicated_lines_density",
+]
+
+
+@dataclass
+class FleetService:
+    """Quality overview of every active project, one SonarQube request per batch of project keys."""
+
+    sonarqube: SonarQubeClient
+    repository: ProjectRepository
+    measures_cache: TTLCache[str, dict[str, str]]
+
+    async def get_fleet_overview(self, page: int, page_size: int) -> FleetOverview:
+        projects, total = await self.repository.page_active(offset=(page - 1) * page_size, limit=page_size)
+        project_keys: dict[Project, str] = {project: slugify(project.name) for project in projects}
+        measures: dict[str, dict[str, str]] = await self._measures(project_keys=list(project_keys.values()))
+
+        return FleetOverview(
+            page=page,
+            page_size=page_size,
+            total=total,
+            projects=[
+                FleetProject(
+                    id=project.id,
+                    name=project.name,
+                    project_key=project_key,
+                    quality_gate=measures[project_key].get(QUALITY_GATE_METRIC),
+                    measures={
+                        metric: value
+                        for metric, value in measures[project_key].items()
+                        if metric != QUALITY_GATE_METRIC
+                    },
+                )
+                for project, project_key in project_keys.items()
+            ],
+        )
+
+    async def _measures(self, project_keys: list[str]) -> dict[str, dict[str, str]]:
+        cached: dict[str, dict[str, str]] = self.measures_cache.get_many(project_keys)
+        missing: list[str] = [key for key in dict.fromkeys(project_keys) if key not in cached]
+        if not missing:
+            return cached
+
+        batches: list[list[SonarQubeMeasure]] = await asyncio.gather(
+            *(
+                self.sonarqube.search_measures(
+                    project_keys=missing[start : start + MEASURES_SEARCH_MAX_PROJECTS],
+                    metric_keys=FLEET_METRIC_KEYS,
+                )
+                for start in range(0, len(missing), MEASURES_SEARCH_MAX_PROJECTS)
+            )
+        )
+
+        fetched: dict[str, dict[str, str]] = {key: {} for key in missing}
+        for batch in batches:
+            for measure in batch:
+                if measure.value is not None and measure.component in fetched:
+                    fetched[measure.component][measure.metric] = measure.value
+
+        for key, values in fetched.items():
+            self.measures_cache.set(key, values)
+
+        return cached | fetched
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import logfire
+
+from src.database import database
+from src.database.models import IdempotencyKey
+from src.enums import IdempotencyStatus
+from src.errors import IdempotencyInProgressError, IdempotencyKeyMismatchError
+from src.repositories import IdempotencyRepository
+from src.schemas import StoredResponse
+
+
+@dataclass
+class IdempotencyService:
+    """``Idempotency-Key`` handling: the first request runs, duplicates replay its stored response.
+
+    Every step is its own short transaction, so a claim is visible to concurrent duplicates, which
+    poll until it completes. A failed request releases its key so the client can retry.
+
+    The holder renews its claim every third of ``lease_seconds`` while it runs; a claim left
+    unrenewed for longer (the worker died) can be taken over by a duplicate.
+    """
+
+    ttl_seconds: int = 86400
+    wait_timeout_seconds: float = 60.0
+    lease_seconds: float = 60.0
+    poll_interval_seconds: float = 0.25
+
+    @staticmethod
+    def hash_request(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    async def run(
+        self,
+        scope: str,
+        key: str,
+        request_hash: str,
+        produce: Callable[[], Awaitable[StoredResponse]],
+    ) -> StoredResponse:
+        deadline: float = time.monotonic() + self.wait_timeout_seconds
+
+        while True:
+            claimed, record = await self._claim(scope=scope, key=key, request_hash=request_hash)
+            if claimed:
+                break
+
+            if record is None:
+                continue
+
+            if record.request_hash != request_hash:
+                raise IdempotencyKeyMismatchError()
+
+            if record.status == IdempotencyStatus.COMPLETED:
+                return StoredResponse(
+                    status_code=record.response_status or 200,
+                    content=record.response_body or b"",
+                    media_type=record.media_type,
+                    replayed=True,
+                )
+
+            if time.monotonic() >= deadline:
+                raise IdempotencyInProgressError()
+
+            await asyncio.sleep(self.poll_interval_seconds)
+
+        lease: asyncio.Task[None] = asyncio.create_task(self._keep_lease(scope=scope, key=key))
+        try:
+            response: StoredResponse = await produce()
+
+        except BaseException:
+            await asyncio.shield(self._release(scope=scope, key=key))
+            raise
+
+        finally:
+            lease.cancel()
+
+        async with database.session_scope() as session:
+            await IdempotencyRepository(session=session).complete(
+                scope=scope,
+                key=key,
+                status_code=response.status_code,
+                body=response.content,
+                media_type=response.media_type,
+            )
+
+        return response
+
+    async def _claim(self, scope: str, key: str, request_hash: str) -> tuple[bool, IdempotencyKey | None]:
+        now: datetime = datetime.now(UTC)
+
+        async with database.session_scope() as session:
+            repository = IdempotencyRepository(session=session)
+
+            if await repository.claim(
+                scope=scope,
+                key=key,
+                request_hash=request_hash,
+                expired_before=now - timedelta(seconds=self.ttl_seconds),
+                abandoned_before=now - timedelta(seconds=self.lease_seconds),
+            ):
+                return True, None
+
+            return False, await repository.get(scope=scope, key=key)
+
+    async def _keep_lease(self, scope: str, key: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+
+            try:
+                async with database.session_scope() as session:
+                    await IdempotencyRepository(session=session).renew(scope=scope, key=key)
+
+            except Exception:
+                logfire.exception("Failed to renew idempotency key {scope}:{key}", scope=scope, key=key)
+
+    async def _release(self, scope: str, key: str) -> None:
+        async with database.session_scope() as session:
+            await IdempotencyRepository(session=session).release(scope=scope, key=key)
@@ -0,0 +1,87 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import logfire
+
+from src.database import database
+from src.errors import LogfireAPIError
+from src.integrations.logfire import LogfireChannel, LogfireClient
+from src.repositories import LogfireChannelRepository
+
+CHANNEL_LABEL: str = "carli-alerts"
+
+
+@dataclass
+class LogfireChannelRegistry:
+    """Resolves the single Logfire webhook channel per URL, cached in memory and in ``logfire_channel``.
+
+    Creation is serialised across replicas with an advisory lock; a replica that loses the race
+    waits for the winner to persist the id.
+    """
+
+    logfire: LogfireClient
+    label: str = CHANNEL_LABEL
+    wait_attempts: int = 10
+    wait_interval_seconds: float = 0.5
+    _channels: dict[str, str] = field(default_factory=dict, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    async def channel_id(self, webhook_url: str) -> str:
+        if (channel_id := self._channels.get(webhook_url)) is not None:
+            return channel_id
+
+        async with self._lock:
+            if (channel_id := self._channels.get(webhook_url)) is None:
+                channel_id = await self._resolve(webhook_url=webhook_url)
+                self._channels[webhook_url] = channel_id
+
+            return channel_id
+
+    async def forget(self, webhook_url: str, channel_id: str) -> None:
+        """Drop ``channel_id`` from memory and ``logfire_channel`` after Logfire rejected it, e.g. once deleted.
+
+        The next lookup lists the channels again, so a channel that still exists is found rather than duplicated.
+        """
+        if self._channels.get(webhook_url) == channel_id:
+            del self._channels[webhook_url]
+
+        async with database.session_scope() as session:
+            await LogfireChannelRepository(session=session).deactivate(
+                webhook_url=webhook_url, id_channel_logfire=channel_id
+            )
+
+    async def _resolve(self, webhook_url: str) -> str:
+        for _ in range(self.wait_attempts):
+            if (channel_id := await self._stored(webhook_url=webhook_url)) is not None:
+                return channel_id
+
+            async with database.advisory_lock(name=f"logfire-channel:{webhook_url}") as acquired:
+                if acquired:
+                    return await self._find_or_create(webhook_url=webhook_url)
+
+            await asyncio.sleep(self.wait_interval_seconds)
+
+        raise LogfireAPIError(f"Timed out waiting for the Logfire channel of {webhook_url}")
+
+    async def _find_or_create(self, webhook_url: str) -> str:
+        if (channel_id := await self._stored(webhook_url=webhook_url)) is not None:
+            return channel_id
+
+        channels: list[LogfireChannel] = await self.logfire.list_channels()
+        channel: LogfireChannel | None = next(
+            (c for c in channels if c.active and c.config is not None and c.config.url == webhook_url), None
+        )
+        if channel is None:
+            channel = await self.logfire.create_channel(label=self.label, webhook_url=webhook_url)
+            logfire.info("Created Logfire alert channel {id} for {url}", id=str(channel.id), url=webhook_url)
+
+        async with database.session_scope() as session:
+            await LogfireChannelRepository(session=session).save(
+                webhook_url=webhook_url, id_channel_logfire=str(channel.id)
+            )
+
+        return str(channel.id)
+
+    async def _stored(self, webhook_url: str) -> str | None:
+        async with database.session_scope() as session:
+            return await LogfireChannelRepository(session=session).get_channel_id(webhook_url=webhook_url)
@@ -1,29 +1,53 @@
 import asyncio
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID
 
 import logfire
 from httpx import AsyncClient, Response
 
-from src.builders import TemplateInterfaceBuilder
+from src.builders import BuilderRegistry, TemplateInterfaceBuilder
+from src.database import database
 from src.database.models import Project
-from src.enums import Environment
-from src.errors import GitLabError, LogfireError, ProjectNotFoundError, SonarQubeError
-from src.integrations.gitlab import AccessLevel, GitLabClient, GitLabMember, GitLabProject
-from src.integrations.logfire import ERROR_ALERT_QUERY, LogfireChannel, LogfireClient, LogfireProject
+from src.enums import Environment, OverviewSection, ProvisioningJobStatus, ProvisioningResultStatus
+from src.errors import (
+    GitLabError,
+    GitLabNotFoundError,
+    LogfireError,
+    LogfireRejectedError,
+    ProjectConflictError,
+    ProjectNotFoundError,
+    SonarQubeError,
+)
+from src.integrations.gitlab import AccessLevel, GitLabClient, GitLabMember, GitLabProject, GitLabUser
+from src.integrations.logfire import ERROR_ALERT_QUERY, LogfireClient, LogfireProject
 from src.integrations.sonarqube import SonarQubeClient
 from src.integrations.sonarqube.schemas import QualityGateStatus
 from src.repositories import ProjectRepository
 from src.schemas import (
     BuilderProjectData,
     Member,
+    OverviewEvent,
     ProjectCreated,
     ProjectDetail,
     ProjectOverview,
     ProjectSummary,
+    ProvisioningResult,
     StageStatus,
 )
-from src.utils import slugify
+from src.utils import (
+    TTLCache,
+    UpstreamLimits,
+    current_server_timings,
+    provisioning_drain,
+    server_timing,
+    slugify,
+    zip_stream,
+)
+
+from .logfire_channel_registry import LogfireChannelRegistry
+from .provisioning_journal import ProvisioningJournal
 
 ROLE_TO_ACCESS_LEVEL: dict[str, AccessLevel] = {
     "developer": AccessLevel.DEVELOPER,
@@ -33,6 +57,8 @@ ROLE_TO_ACCESS_LEVEL: dict[str, AccessLevel] = {
 
 HEALTH_CHECK_TIMEOUT: int = 5
 
+PREVIEW_REPOSITORY_URL: str = "git@gitlab.example.com:preview/{project_key}.git"
+
 
 @dataclass
 class ProjectService:
@@ -40,36 +66,129 @@ class ProjectService:
     sonarqube: SonarQubeClient
     logfire: LogfireClient
     repository: ProjectRepository
-    template_builder: TemplateInterfaceBuilder
+    builders: BuilderRegistry
+    channels: LogfireChannelRegistry
+    limits: UpstreamLimits
+    user_ids: TTLCache[str, int]
     webhook_base_url: str
     sonarqube_alm_setting: str | None = None
+    journal: ProvisioningJournal = field(default_factory=ProvisioningJournal)
 
     async def create_project(self, project: ProjectDetail, user_id: UUID) -> ProjectCreated:
-        gitlab_project: GitLabProject = await self._setup_gitlab_project(project)
-        sonarqube_created: bool = False
-        project_key: str = slugify(project.name)
+        self.builders.get(project.project_type)
+
+        # Serialises creation per project key across replicas before any remote call is made.
+        async with (
+            self.limits.provisioning,
+            database.advisory_lock(name=f"project:{slugify(project.name)}") as acquired,
+        ):
+            with server_timing("db.name_check"):
+                name_taken: bool = acquired and await self.journal.name_taken(name=project.name)
+            if not acquired or name_taken:
+                raise ProjectConflictError()
+
+            return await self._create_project(project=project, user_id=user_id)
+
+    def create_projects(self, projects: Sequence[ProjectDetail], user_id: UUID) -> AsyncIterator[ProvisioningResult]:
+        """Submit every provisioning at once and yield the results in completion order.
+
+        The work is submitted to the provisioning drain, so it finishes even if the caller stops reading;
+        the upstream limits, user id cache and Logfire channel are shared with single creations, and
+        ``limits.provisioning`` decides how many items actually run at a time.
+        """
+        for project in projects:
+            self.builders.get(project.project_type)
+
+        tasks: list[asyncio.Task[ProvisioningResult]] = [
+            provisioning_drain.submit(self._create_batch_item(index=index, project=project, user_id=user_id))
+            for index, project in enumerate(projects)
+        ]
+        return self._batch_results(tasks=tasks)
+
+    async def _batch_results(self, tasks: list[asyncio.Task[ProvisioningResult]]) -> AsyncIterator[ProvisioningResult]:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+
+    async def _create_batch_item(self, index: int, project: ProjectDetail, user_id: UUID) -> ProvisioningResult:
+        # Items run concurrently and the header is sent when the stream starts, so they are not timed;
+        # the task runs in a copy of the request context, so this leaves the request's own timings alone.
+        current_server_timings.set(None)
 
         try:
-            await self._setup_sonarqube_project(
-                project_name=project.name,
-                gitlab_project_id=gitlab_project.id,
+            created: ProjectCreated = await self.create_project(project=project, user_id=user_id)
+            return ProvisioningResult(
+                index=index, name=project.name, status=ProvisioningResultStatus.CREATED, project=created
+            )
+
+        except ProjectConflictError as e:
+            return ProvisioningResult(
+                index=index, name=project.name, status=ProvisioningResultStatus.CONFLICT, error=str(e)
             )
-            sonarqube_created = True
 
-            logfire_project: LogfireProject = await self._setup_logfire_project(
-                project_name=project.name,
-                description=project.description or "",
+        except (GitLabError, SonarQubeError, LogfireError) as e:
+            return ProvisioningResult(
+                index=index, name=project.name, status=ProvisioningResultStatus.FAILED, error=str(e)
             )
 
-            db_project: Project = await self.repository.create(
+        except Exception:
+            # One item must not abort the stream of the others, e.g. on a database pool timeout
+            logfire.exception("Batch provisioning of {name} failed", name=project.name)
+            return ProvisioningResult(
+                index=index,
                 name=project.name,
-                description=project.description,
-                id_user=user_id,
-                id_project_gitlab=gitlab_project.id,
-                url_repository=gitlab_project.ssh_url_to_repo,
-                id_project_logfire=str(logfire_project.id),
+                status=ProvisioningResultStatus.FAILED,
+                error="Unexpected provisioning error",
             )
 
+    async def _create_project(self, project: ProjectDetail, user_id: UUID) -> ProjectCreated:
+        job_id: UUID = await self.journal.start(name=project.name, user_id=user_id)
+
+        try:
+            return await self._provision(project=project, user_id=user_id, job_id=job_id)
+
+        # The cancel or error may land after ``journal.complete`` committed, e.g. while its session closes
+        except asyncio.CancelledError:
+            await self.journal.finish(job_id=job_id, status=ProvisioningJobStatus.INTERRUPTED)
+            raise
+
+        except Exception as e:
+            await self.journal.finish(job_id=job_id, status=ProvisioningJobStatus.FAILED, error=str(e)[:500])
+            raise
+
+    async def _provision(self, project: ProjectDetail, user_id: UUID, job_id: UUID) -> ProjectCreated:
+        async with self.limits.gitlab:
+            gitlab_project: GitLabProject = await self._setup_gitlab_project(project, job_id=job_id)
+        sonarqube_created: bool = False
+        project_key: str = slugify(project.name)
+
+        try:
+            await self.journal.record(job_id=job_id, sonarqube_project_key=project_key)
+            async with self.limits.sonarqube:
+                await self._setup_sonarqube_project(
+                    project_name=project.name,
+                    gitlab_project_id=gitlab_project.id,
+                )
+            sonarqube_created = True
+
+            async with self.limits.logfire:
+                logfire_project: LogfireProject = await self._setup_logfire_project(
+                    project_name=project.name,
+                    description=project.description or "",
+                )
+            await self.journal.record(job_id=job_id, id_project_logfire=str(logfire_project.id))
+
+            with server_timing("db.complete"):
+                db_project: Project = await self.journal.complete(
+                    job_id=job_id,
+                    name=project.name,
+                    description=project.description,
+                    id_user=user_id,
+                    id_project_gitlab=gitlab_project.id,
+                    url_repository=gitlab_project.ssh_url_to_repo,
+                    id_project_logfire=str(logfire_project.id),
+                    project_type=project.project_type,
+                )
+
             return ProjectCreated(repo_url=gitlab_project.ssh_url_to_repo, project_id=db_project.id)
 
         except (SonarQubeError, LogfireError) as e:
@@ -96,82 +215,130 @@ class ProjectService:
             except SonarQubeError:
                 logfire.error("Failed to rollback SonarQube project {key}", key=project_key)
 
-    async def _setup_gitlab_project(self, project: ProjectDetail) -> GitLabProject:
-        gitlab_project: GitLabProject = await self.gitlab.create_project(
-            name=project.name,
-            visibility="private",
-            initialize_with_readme=False,
-        )
+    def preview_scaffold(self, project: ProjectDetail) -> Iterator[bytes]:
+        """Zip the scaffold ``create_project`` would push.
 
-        files: dict[str, str] = self.template_builder.build(
-            data=BuilderProjectData(
-                project_name=project.name,
-                url_repository=gitlab_project.ssh_url_to_repo,
-                codeowners=project.members,
-            ),
-        )
+        The scaffold is rendered in one go when the first chunk is requested; only the compression is
+        incremental, one entry per chunk.
+        """
+        project_key: str = slugify(project.name)
+        builder: TemplateInterfaceBuilder = self.builders.get(project.project_type)
+
+        def files() -> Iterator[tuple[str, str]]:
+            yield from builder.build(
+                data=BuilderProjectData(
+                    project_name=project.name,
+                    url_repository=PREVIEW_REPOSITORY_URL.format(project_key=project_key),
+                    codeowners=project.members,
+                ),
+            ).items()
+
+        return zip_stream(files=files(), root=project_key)
+
+    async def _setup_gitlab_project(self, project: ProjectDetail, job_id: UUID) -> GitLabProject:
+        with server_timing("gitlab.create_project"):
+            gitlab_project: GitLabProject = await self.gitlab.create_project(
+                name=project.name,
+                visibility="private",
+                initialize_with_readme=False,
+            )
+        await self.journal.record(job_id=job_id, id_project_gitlab=gitlab_project.id)
+
+        with server_timing("template.render"):
+            files: dict[str, str] = await self.builders.render(
+                project_type=project.project_type,
+                data=BuilderProjectData(
+                    project_name=project.name,
+                    url_repository=gitlab_project.ssh_url_to_repo,
+                    codeowners=project.members,
+                ),
+            )
 
-        await self.gitlab.initialize_repository(
-            project_id=gitlab_project.id,
-            files=files,
-            commit_message="chore: Initial project setup [skip ci]",
-        )
+        with server_timing("gitlab.commit"):
+            await self.gitlab.initialize_repository(
+                project_id=gitlab_project.id,
+                files=files,
+                commit_message="chore: Initial project setup [skip ci]",
+            )
 
-        await self.gitlab.create_branch(
-            project_id=gitlab_project.id,
-            branch_name="develop",
-            from_branch="main",
-        )
+        with server_timing("gitlab.branch"):
+            await self.gitlab.create_branch(
+                project_id=gitlab_project.id,
+                branch_name="develop",
+                from_branch="main",
+            )
 
-        await self._protect_branches(project_id=gitlab_project.id)
+        with server_timing("gitlab.protect"):
+            await self._protect_branches(project_id=gitlab_project.id)
 
-        await self._add_members(project_id=gitlab_project.id, members=project.members)
+        with server_timing("gitlab.members"):
+            await self._add_members(project_id=gitlab_project.id, members=project.members)
 
         return gitlab_project
 
     async def _setup_sonarqube_project(self, project_name: str, gitlab_project_id: int) -> None:
         project_key: str = slugify(project_name)
 
-        await self.sonarqube.create_project(
-            project_name=project_name,
-            project_key=project_key,
-        )
-
-        await self.sonarqube.generate_project_token(
-            project_key=project_key,
-            token_name=f"{project_key}-token",
-        )
+        with server_timing("sonarqube.create_project"):
+            await self.sonarqube.create_project(
+                project_name=project_name,
+                project_key=project_key,
+            )
 
-        if self.sonarqube_alm_setting:
-            await self.sonarqube.set_gitlab_binding(
+        with server_timing("sonarqube.token"):
+            await self.sonarqube.generate_project_token(
                 project_key=project_key,
-                alm_setting=self.sonarqube_alm_setting,
-                gitlab_project_id=gitlab_project_id,
+                token_name=f"{project_key}-token",
             )
 
+        if self.sonarqube_alm_setting:
+            with server_timing("sonarqube.binding"):
+                await self.sonarqube.set_gitlab_binding(
+                    project_key=project_key,
+                    alm_setting=self.sonarqube_alm_setting,
+                    gitlab_project_id=gitlab_project_id,
+                )
+
     async def _setup_logfire_project(self, project_name: str, description: str = "") -> LogfireProject:
-        logfire_project: LogfireProject = await self.logfire.create_project(
-            project_name=slugify(project_name),
-            description=description,
-        )
-        await self.logfire.create_write_token(project_id=str(logfire_project.id))
+        with server_timing("logfire.create_project"):
+            logfire_project: LogfireProject = await self.logfire.create_project(
+                project_name=slugify(project_name),
+                description=description,
+            )
+
+        with server_timing("logfire.token"):
+            await self.logfire.create_write_token(project_id=str(logfire_project.id))
 
         webhook_url: str = f"{self.webhook_base_url}webhooks/logfire/alerts"
-        channel: LogfireChannel = await self.logfire.create_channel(
-            label=f"{project_name}-alerts",
-            webhook_url=webhook_url,
-        )
+        with server_timing("logfire.channel"):
+            channel_id: str = await self.channels.channel_id(webhook_url=webhook_url)
+
+        with server_timing("logfire.alert"):
+            try:
+                await self._create_error_alert(
+                    project_id=str(logfire_project.id), project_name=project_name, channel_id=channel_id
+                )
+
+            except LogfireRejectedError:
+                # The shared channel may have been deleted in Logfire; resolve it again and retry once
+                await self.channels.forget(webhook_url=webhook_url, channel_id=channel_id)
+                await self._create_error_alert(
+                    project_id=str(logfire_project.id),
+                    project_name=project_name,
+                    channel_id=await self.channels.channel_id(webhook_url=webhook_url),
+                )
 
+        return logfire_project
+
+    async def _create_error_alert(self, project_id: str, project_name: str, channel_id: str) -> None:
         await self.logfire.create_alert(
-            project_id=str(logfire_project.id),
+            project_id=project_id,
             name=f"{project_name} error alert",
             description=f"Alert on error-level logs for {project_name}",
             query=ERROR_ALERT_QUERY,
-            channel_ids=[str(channel.id)],
+            channel_ids=[channel_id],
         )
 
-        return logfire_project
-
     async def _check_environment_status(self, environment: Environment, domain: str) -> StageStatus:
         url: str = f"https://{environment.value}.{domain}"
         try:
@@ -189,16 +356,25 @@ class ProjectService:
         )
         return list(results)
 
-    async def get_project_overview(self, user_id: UUID, project_id: UUID) -> ProjectOverview:
+    async def _get_owned_project(self, user_id: UUID, project_id: UUID) -> Project:
         project: Project | None = await self.repository.get_by_id(project_id)
 
         if not project or project.id_user != user_id:
             raise ProjectNotFoundError()
 
-        project_key: str = project.name.lower().replace(" ", "-")
-        quality_gate: QualityGateStatus = await self.sonarqube.get_quality_gate_status(project_key=project_key)
-        members: list[GitLabMember] = await self.gitlab.list_project_members(project_id=project.id_project_gitlab)
-        stages: list[StageStatus] = await self._get_stages(domain=project.web_domain)
+        return project
+
+    async def get_project_overview(self, user_id: UUID, project_id: UUID) -> ProjectOverview:
+        with server_timing("db.project"):
+            project: Project = await self._get_owned_project(user_id=user_id, project_id=project_id)
+
+        project_key: str = slugify(project.name)
+        with server_timing("sonarqube.quality_gate"):
+            quality_gate: QualityGateStatus = await self.sonarqube.get_quality_gate_status(project_key=project_key)
+        with server_timing("gitlab.members"):
+            members: list[GitLabMember] = await self.gitlab.list_project_members(project_id=project.id_project_gitlab)
+        with server_timing("stages"):
+            stages: list[StageStatus] = await self._get_stages(domain=project.web_domain)
 
         return ProjectOverview(
             id=project.id,
@@ -210,6 +386,46 @@ class ProjectService:
             stages=stages,
         )
 
+    async def stream_project_overview(self, user_id: UUID, project_id: UUID) -> AsyncIterator[OverviewEvent]:
+        """Check ownership up front, then return the sections as an iterator yielding each one as it resolves."""
+        project: Project = await self._get_owned_project(user_id=user_id, project_id=project_id)
+        return self._overview_events(project=project)
+
+    async def _overview_events(self, project: Project) -> AsyncIterator[OverviewEvent]:
+        yield OverviewEvent(
+            section=OverviewSection.METADATA,
+            data=ProjectSummary(
+                id=project.id,
+                name=project.name,
+                url_repository=project.url_repository,
+                created_at=project.created_at,
+            ),
+        )
+
+        sections: dict[asyncio.Task[Any], OverviewSection] = {
+            asyncio.create_task(
+                self.sonarqube.get_quality_gate_status(project_key=slugify(project.name))
+            ): OverviewSection.QUALITY_GATE,
+            asyncio.create_task(
+                self.gitlab.list_project_members(project_id=project.id_project_gitlab)
+            ): OverviewSection.MEMBERS,
+            asyncio.create_task(self._get_stages(domain=project.web_domain)): OverviewSection.STAGES,
+        }
+
+        try:
+            pending: set[asyncio.Task[Any]] = set(sections)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        event = OverviewEvent(section=sections[task], data=task.result())
+                    except (GitLabError, SonarQubeError) as e:
+                        event = OverviewEvent(section=sections[task], error=str(e))
+                    yield event
+        finally:
+            for task in sections:
+                task.cancel()
+
     async def list_projects(self, user_id: UUID) -> list[ProjectSummary]:
         projects: list[Project] = await self.repository.list_by_user(user_id)
         return [
@@ -262,6 +478,18 @@ class ProjectService:
             access_level: AccessLevel = ROLE_TO_ACCESS_LEVEL.get(member.role.lower(), AccessLevel.DEVELOPER)
             await self.gitlab.add_member_to_project(
                 project_id=project_id,
-                user_name=member.gitlab_user_name,
+                user_id=await self._gitlab_user_id(user_name=member.gitlab_user_name),
                 access_level=access_level,
             )
+
+    async def _gitlab_user_id(self, user_name: str) -> int:
+        if (user_id := self.user_ids.get(user_name.lower())) is not None:
+            return user_id
+
+        users: list[GitLabUser] = await self.gitlab.search_users(search=user_name)
+        user: GitLabUser | None = next((u for u in users if u.username.lower() == user_name.lower()), None)
+        if user is None:
+            raise GitLabNotFoundError(f"GitLab user not found: {user_name}")
+
+        self.user_ids.set(user_name.lower(), user.id)
+        return user.id
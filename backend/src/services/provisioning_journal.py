@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from src.database import database
+from src.database.models import Project, ProvisioningJob
+from src.enums import ProvisioningJobStatus
+from src.repositories import ProjectRepository, ProvisioningJobRepository
+
+
+@dataclass
+class ProvisioningJournal:
+    """Checkpoints of ``create_project``, each in its own short transaction so they outlive the request."""
+
+    async def name_taken(self, name: str) -> bool:
+        async with database.session_scope() as session:
+            return await ProjectRepository(session=session).exists_by_name(name=name)
+
+    async def start(self, name: str, user_id: UUID) -> UUID:
+        async with database.session_scope() as session:
+            job: ProvisioningJob = await ProvisioningJobRepository(session=session).create(name=name, id_user=user_id)
+            return job.id
+
+    async def record(self, job_id: UUID, **values: Any) -> None:
+        async with database.session_scope() as session:
+            await ProvisioningJobRepository(session=session).update(job_id=job_id, **values)
+
+    async def finish(self, job_id: UUID, status: ProvisioningJobStatus, **values: Any) -> None:
+        """Close a job that is still running; one that already completed keeps its status."""
+        async with database.session_scope() as session:
+            await ProvisioningJobRepository(session=session).update(
+                job_id=job_id, expected_status=ProvisioningJobStatus.RUNNING, status=status, **values
+            )
+
+    async def complete(self, job_id: UUID, **project: Any) -> Project:
+        """Insert the project row and close the job atomically."""
+        async with database.session_scope() as session:
+            db_project: Project = await ProjectRepository(session=session).create(**project)
+            await ProvisioningJobRepository(session=session).update(
+                job_id=job_id, status=ProvisioningJobStatus.COMPLETED
+            )
+            return db_project
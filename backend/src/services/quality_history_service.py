@@ -0,0 +1,105 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import logfire
+from sqlalchemy import RowMapping
+
+from src.database.models import Project
+from src.enums import TrendBucket
+from src.errors import ProjectNotFoundError
+from src.integrations.sonarqube import SonarQubeClient
+from src.integrations.sonarqube.schemas import QualityGateStatus
+from src.repositories import ProjectRepository, QualityGateSnapshotRepository
+from src.schemas import ProjectQualityTrend, QualityTrendPoint, QualityTrends, SonarQubeAnalysis
+from src.utils import slugify
+
+FAILED_CONDITION_STATUS: str = "ERROR"
+
+
+@dataclass
+class QualityHistoryService:
+    """Quality gate snapshots recorded from analysis webhooks and refreshes, so trends need no SonarQube calls."""
+
+    sonarqube: SonarQubeClient
+    projects: ProjectRepository
+    snapshots: QualityGateSnapshotRepository
+
+    async def record_analysis(self, analysis: SonarQubeAnalysis) -> bool:
+        """Store the gate result of a finished analysis; returns whether it belonged to a known project."""
+        if analysis.quality_gate is None:
+            return False
+
+        project: Project | None = await self.projects.get_by_name(name=analysis.project.name)
+        if project is None:
+            logfire.info("Ignoring analysis of unknown SonarQube project {key}", key=analysis.project.key)
+            return False
+
+        await self.snapshots.record(
+            project_id=project.id,
+            analysed_at=analysis.analysed_at,
+            status=analysis.quality_gate.status,
+            conditions={
+                condition.metric: condition.value
+                for condition in analysis.quality_gate.conditions
+                if condition.value is not None
+            },
+            failed_metrics=[
+                condition.metric
+                for condition in analysis.quality_gate.conditions
+                if condition.status == FAILED_CONDITION_STATUS
+            ],
+        )
+        return True
+
+    async def refresh(self, user_id: UUID, project_id: UUID) -> QualityGateStatus:
+        project: Project | None = await self.projects.get_by_id(project_id)
+        if not project or project.id_user != user_id:
+            raise ProjectNotFoundError()
+
+        quality_gate: QualityGateStatus = await self.sonarqube.get_quality_gate_status(
+            project_key=slugify(project.name)
+        )
+        await self.snapshots.record(
+            project_id=project.id,
+            analysed_at=datetime.now(UTC),
+            status=quality_gate.status,
+            conditions={condition.metric_key: condition.actual_value for condition in quality_gate.conditions},
+            failed_metrics=[
+                condition.metric_key
+                for condition in quality_gate.conditions
+                if condition.status == FAILED_CONDITION_STATUS
+            ],
+        )
+        return quality_gate
+
+    async def trends(self, days: int, bucket: TrendBucket) -> QualityTrends:
+        since: datetime = datetime.now(UTC) - timedelta(days=days)
+        rows: Sequence[RowMapping] = await self.snapshots.trends(since=since, bucket=bucket)
+
+        fleet: list[QualityTrendPoint] = []
+        projects: dict[UUID, ProjectQualityTrend] = {}
+        for row in rows:
+            if row["id_project"] is None:
+                fleet.append(
+                    QualityTrendPoint(
+                        bucket=row["bucket"], total=row["total"], passed=row["passed"], last_status=row["last_status"]
+                    )
+                )
+                continue
+
+            trend: ProjectQualityTrend = projects.setdefault(
+                row["id_project"], ProjectQualityTrend(id_project=row["id_project"], name=row["name"], points=[])
+            )
+            trend.points.append(
+                QualityTrendPoint(
+                    bucket=row["bucket"],
+                    total=row["total"],
+                    passed=row["passed"],
+                    last_status=row["last_status"],
+                    conditions=row["last_conditions"],
+                )
+            )
+
+        return QualityTrends(bucket=bucket, since=since, fleet=fleet, projects=list(projects.values()))
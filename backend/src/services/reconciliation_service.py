@@ -0,0 +1,280 @@
+import asyncio
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TypeVar
+from uuid import UUID
+
+import logfire
+
+from src.database import database
+from src.database.models import Project, ProjectDrift, ProvisioningJob
+from src.enums import DriftKind
+from src.errors import GitLabError, SonarQubeError
+from src.integrations.gitlab import GitLabClient
+from src.integrations.gitlab.schemas import GitLabProjectsPage
+from src.integrations.logfire import LogfireClient
+from src.integrations.sonarqube import SonarQubeClient
+from src.integrations.sonarqube.schemas import SonarQubeProjectsPage
+from src.repositories import DriftRepository, ProjectRepository, ProvisioningJobRepository
+from src.schemas import DriftRecord, ReconciliationReport
+from src.utils import slugify
+
+T = TypeVar("T")
+
+GITLAB_PAGE_SIZE: int = 100
+SONARQUBE_PAGE_SIZE: int = 500
+
+DELETABLE_ORPHANS: frozenset[DriftKind] = frozenset({DriftKind.ORPHANED_IN_GITLAB, DriftKind.ORPHANED_IN_SONARQUBE})
+
+
+@dataclass
+class ReconciliationService:
+    """Diff the project table against the GitLab namespace, SonarQube and Logfire.
+
+    Only safe repairs are automatic: rows whose GitLab project is gone are deactivated, and upstream
+    orphans are deleted only when ``delete_orphans`` is enabled and a provisioning job created them;
+    the SonarQube instance is shared with other teams. Everything else is recorded.
+
+    Provisioning creates upstream projects before their row, so rows are read before the upstream
+    listings, and anything younger than ``grace_seconds`` or owned by a recent provisioning job is
+    left out of the diff. Each database step runs in its own short transaction, none spans the listings.
+    """
+
+    gitlab: GitLabClient
+    sonarqube: SonarQubeClient
+    logfire: LogfireClient
+    concurrency: int = 8
+    delete_orphans: bool = False
+    grace_seconds: int = 900
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def reconcile(self) -> ReconciliationReport:
+        started_at: datetime = datetime.now(UTC)
+        started: float = time.perf_counter()
+        settled_before: datetime = started_at - timedelta(seconds=self.grace_seconds)
+
+        async with database.session_scope() as session:
+            projects: list[Project] = await ProjectRepository(session=session).list_active()
+
+        gitlab_ids, sonarqube_keys, logfire_ids = await asyncio.gather(
+            self._gitlab_project_ids(settled_before=settled_before),
+            self._sonarqube_project_keys(),
+            self._logfire_project_ids(settled_before=settled_before),
+        )
+        async with database.session_scope() as session:
+            jobs: list[ProvisioningJob] = await ProvisioningJobRepository(session=session).list_in_flight(
+                updated_after=settled_before
+            )
+
+        drifts: list[DriftRecord] = [
+            *self._missing_upstream(
+                [project for project in projects if project.created_at < settled_before],
+                gitlab_ids,
+                sonarqube_keys,
+                logfire_ids,
+            ),
+            *self._orphaned_upstream(projects, jobs, gitlab_ids, sonarqube_keys, logfire_ids),
+        ]
+        if self.delete_orphans:
+            await self._delete_owned_orphans([drift for drift in drifts if drift.kind in DELETABLE_ORPHANS])
+
+        deactivated: list[UUID] = []
+        for drift in drifts:
+            if drift.kind == DriftKind.MISSING_IN_GITLAB and drift.id_project:
+                deactivated.append(drift.id_project)
+                drift.repaired = True
+
+        async with database.session_scope() as session:
+            await ProjectRepository(session=session).deactivate(deactivated)
+            await DriftRepository(session=session).record(
+                [
+                    ProjectDrift(
+                        id_project=drift.id_project,
+                        kind=drift.kind,
+                        external_id=drift.external_id,
+                        repaired=drift.repaired,
+                    )
+                    for drift in drifts
+                ]
+            )
+
+        return ReconciliationReport(
+            started_at=started_at,
+            duration_seconds=time.perf_counter() - started,
+            database_projects=len(projects),
+            gitlab_projects=len(gitlab_ids),
+            sonarqube_projects=len(sonarqube_keys),
+            logfire_projects=len(logfire_ids),
+            drifts=drifts,
+        )
+
+    @staticmethod
+    def _missing_upstream(
+        projects: list[Project],
+        gitlab_ids: set[int],
+        sonarqube_keys: set[str],
+        logfire_ids: set[str],
+    ) -> list[DriftRecord]:
+        drifts: list[DriftRecord] = []
+
+        for project in projects:
+            if project.id_project_gitlab not in gitlab_ids:
+                drifts.append(
+                    DriftRecord(
+                        kind=DriftKind.MISSING_IN_GITLAB,
+                        external_id=str(project.id_project_gitlab),
+                        id_project=project.id,
+                    )
+                )
+
+            if slugify(project.name) not in sonarqube_keys:
+                drifts.append(
+                    DriftRecord(
+                        kind=DriftKind.MISSING_IN_SONARQUBE,
+                        external_id=slugify(project.name),
+                        id_project=project.id,
+                    )
+                )
+
+            if project.id_project_logfire and project.id_project_logfire not in logfire_ids:
+                drifts.append(
+                    DriftRecord(
+                        kind=DriftKind.MISSING_IN_LOGFIRE,
+                        external_id=project.id_project_logfire,
+                        id_project=project.id,
+                    )
+                )
+
+        return drifts
+
+    @staticmethod
+    def _orphaned_upstream(
+        projects: list[Project],
+        jobs: list[ProvisioningJob],
+        gitlab_ids: set[int],
+        sonarqube_keys: set[str],
+        logfire_ids: set[str],
+    ) -> list[DriftRecord]:
+        known_gitlab_ids: set[int] = {project.id_project_gitlab for project in projects} | {
+            job.id_project_gitlab for job in jobs if job.id_project_gitlab is not None
+        }
+        known_sonarqube_keys: set[str] = {slugify(project.name) for project in projects} | {
+            slugify(job.name) for job in jobs
+        }
+        known_logfire_ids: set[str] = {
+            project.id_project_logfire for project in projects if project.id_project_logfire
+        } | {job.id_project_logfire for job in jobs if job.id_project_logfire}
+
+        return [
+            *(
+                DriftRecord(kind=DriftKind.ORPHANED_IN_GITLAB, external_id=str(gitlab_id))
+                for gitlab_id in sorted(gitlab_ids - known_gitlab_ids)
+            ),
+            *(
+                DriftRecord(kind=DriftKind.ORPHANED_IN_SONARQUBE, external_id=key)
+                for key in sorted(sonarqube_keys - known_sonarqube_keys)
+            ),
+            *(
+                DriftRecord(kind=DriftKind.ORPHANED_IN_LOGFIRE, external_id=logfire_id)
+                for logfire_id in sorted(logfire_ids - known_logfire_ids)
+            ),
+        ]
+
+    async def _delete_owned_orphans(self, orphans: list[DriftRecord]) -> None:
+        """Delete the orphans a provisioning job created; any other project is left to whoever owns it."""
+        gitlab_ids: set[int] = {
+            int(drift.external_id) for drift in orphans if drift.kind == DriftKind.ORPHANED_IN_GITLAB
+        }
+        sonarqube_keys: set[str] = {
+            drift.external_id for drift in orphans if drift.kind == DriftKind.ORPHANED_IN_SONARQUBE
+        }
+
+        async with database.session_scope() as session:
+            jobs: list[ProvisioningJob] = await ProvisioningJobRepository(session=session).list_by_upstream(
+                gitlab_ids=gitlab_ids, sonarqube_keys=sonarqube_keys
+            )
+
+        owned: set[tuple[DriftKind, str]] = {
+            (DriftKind.ORPHANED_IN_GITLAB, str(job.id_project_gitlab)) for job in jobs if job.id_project_gitlab
+        } | {(DriftKind.ORPHANED_IN_SONARQUBE, job.sonarqube_project_key) for job in jobs if job.sonarqube_project_key}
+
+        await asyncio.gather(
+            *(self._delete_orphan(drift) for drift in orphans if (drift.kind, drift.external_id) in owned)
+        )
+
+    async def _delete_orphan(self, drift: DriftRecord) -> None:
+        try:
+            if drift.kind == DriftKind.ORPHANED_IN_GITLAB:
+                await self._bounded(self.gitlab.delete_project(project_id=int(drift.external_id)))
+            else:
+                await self._bounded(self.sonarqube.delete_project(project_key=drift.external_id))
+            drift.repaired = True
+
+        except (GitLabError, SonarQubeError) as e:
+            logfire.error(
+                "Failed to delete orphan {kind} {id}: {error}",
+                kind=drift.kind,
+                id=drift.external_id,
+                error=str(e),
+            )
+
+    async def _gitlab_project_ids(self, settled_before: datetime) -> set[int]:
+        """IDs of namespace projects created before ``settled_before``."""
+        first: GitLabProjectsPage = await self.gitlab.list_namespace_projects(page=1, per_page=GITLAB_PAGE_SIZE)
+        pages: list[GitLabProjectsPage] = [first]
+
+        if first.total_pages is not None:
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        self._bounded(self.gitlab.list_namespace_projects(page=page, per_page=GITLAB_PAGE_SIZE))
+                        for page in range(2, first.total_pages + 1)
+                    )
+                )
+            )
+        else:
+            # GitLab omits the totals above 10k rows; follow the next-page header instead
+            next_page: int | None = first.next_page
+            while next_page is not None:
+                page_result: GitLabProjectsPage = await self.gitlab.list_namespace_projects(
+                    page=next_page, per_page=GITLAB_PAGE_SIZE
+                )
+                pages.append(page_result)
+                next_page = page_result.next_page
+
+        return {
+            project.id
+            for page in pages
+            for project in page.projects
+            if project.created_at is None or project.created_at < settled_before
+        }
+
+    async def _sonarqube_project_keys(self) -> set[str]:
+        first: SonarQubeProjectsPage = await self.sonarqube.search_projects(page=1, page_size=SONARQUBE_PAGE_SIZE)
+        total_pages: int = -(-first.paging.total // SONARQUBE_PAGE_SIZE)
+
+        pages: list[SonarQubeProjectsPage] = [
+            first,
+            *await asyncio.gather(
+                *(
+                    self._bounded(self.sonarqube.search_projects(page=page, page_size=SONARQUBE_PAGE_SIZE))
+                    for page in range(2, total_pages + 1)
+                )
+            ),
+        ]
+
+        return {component.key for page in pages for component in page.components}
+
+    async def _logfire_project_ids(self, settled_before: datetime) -> set[str]:
+        return {
+            str(project.id) for project in await self.logfire.list_projects() if project.created_at < settled_before
+        }
+
+    async def _bounded(self, awaitable: Awaitable[T]) -> T:
+        async with self._semaphore:
+            return await awaitable
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.database.models import RequestProfile
+from src.errors import ProfileNotFoundError
+from src.repositories import RequestProfileRepository
+from src.schemas import RequestProfileSummary
+
+
+@dataclass
+class RequestProfileService:
+    repository: RequestProfileRepository
+
+    async def list_profiles(self, limit: int) -> list[RequestProfileSummary]:
+        profiles: list[RequestProfile] = await self.repository.list_recent(limit=limit)
+        return [RequestProfileSummary.model_validate(profile) for profile in profiles]
+
+    async def get_content(self, profile_id: UUID) -> bytes:
+        profile: RequestProfile | None = await self.repository.get(profile_id=profile_id)
+        if profile is None:
+            raise ProfileNotFoundError()
+
+        return profile.content
@@ -0,0 +1,169 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import logfire
+
+from src.builders import BuilderRegistry
+from src.database import database
+from src.database.models import Project
+from src.enums import Project as ProjectType
+from src.enums import SessionMode, TemplateUpgradeStatus
+from src.errors import GitLabError, ProjectNotFoundError, UnsupportedProjectTypeError
+from src.integrations.gitlab import GitLabClient, GitLabMergeRequest, git_blob_sha
+from src.repositories import ProjectRepository
+from src.schemas import BuilderProjectData, TemplateUpgradeResult
+
+MANAGED_PATHS: frozenset[str] = frozenset(
+    {
+        ".gitignore",
+        ".gitlab-ci.yml",
+        ".pre-commit-config.yaml",
+        ".vscode/launch.json",
+        "Dockerfile",
+        "docker-compose.yml",
+    }
+)
+
+UPGRADE_TARGET_BRANCH: str = "develop"
+UPGRADE_BRANCH_PREFIX: str = "carli/template-upgrade-"
+UPGRADE_COMMIT_MESSAGE: str = "chore: Upgrade project templates"
+
+
+def upgrade_branch(changed: dict[str, str | bytes]) -> str:
+    """Branch name derived from the changed paths and their blob SHAs."""
+    digest = hashlib.sha256()
+    for path in sorted(changed):
+        digest.update(f"{path}\0{git_blob_sha(changed[path])}\n".encode())
+
+    return f"{UPGRADE_BRANCH_PREFIX}{digest.hexdigest()[:12]}"
+
+
+@dataclass
+class TemplateUpgradeService:
+    """Re-render the managed template files of stored projects and open a merge request with what changed.
+
+    Only blob SHAs are fetched from GitLab; rendered files are hashed locally and compared against them.
+    The upgrade branch is named after the changed content, so a rerun finds its own branch and merge
+    request instead of pushing again, and an upgrade with newer content supersedes older open ones.
+    Projects are loaded in a short session of their own; none stays open while GitLab is called.
+    """
+
+    gitlab: GitLabClient
+    builders: BuilderRegistry
+    concurrency: int = 8
+    managed_paths: frozenset[str] = MANAGED_PATHS
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def upgrade_all(self) -> list[TemplateUpgradeResult]:
+        async with database.session_scope(mode=SessionMode.READ_ONLY) as session:
+            projects: list[Project] = await ProjectRepository(session=session).list_active()
+
+        return list(await asyncio.gather(*(self._bounded_upgrade(project=project) for project in projects)))
+
+    async def upgrade_owned(self, user_id: UUID, project_id: UUID) -> TemplateUpgradeResult:
+        async with database.session_scope() as session:
+            project: Project | None = await ProjectRepository(session=session).get_by_id(project_id)
+
+        if not project or not project.is_active or project.id_user != user_id:
+            raise ProjectNotFoundError()
+
+        return await self.upgrade_project(project=project)
+
+    async def _bounded_upgrade(self, project: Project) -> TemplateUpgradeResult:
+        async with self._semaphore:
+            return await self.upgrade_project(project=project)
+
+    async def upgrade_project(self, project: Project) -> TemplateUpgradeResult:
+        try:
+            return await self._upgrade(project=project)
+
+        except (GitLabError, UnsupportedProjectTypeError) as e:
+            logfire.exception("Template upgrade failed for project {project_id}", project_id=project.id)
+            return TemplateUpgradeResult(id_project=project.id, status=TemplateUpgradeStatus.FAILED, error=str(e))
+
+    async def _upgrade(self, project: Project) -> TemplateUpgradeResult:
+        rendered: dict[str, str] = {
+            path: content
+            for path, content in (
+                await self.builders.render(
+                    project_type=ProjectType(project.project_type),
+                    data=BuilderProjectData(
+                        project_name=project.name,
+                        url_repository=project.url_repository,
+                        codeowners=[],
+                    ),
+                )
+            ).items()
+            if path in self.managed_paths
+        }
+
+        blob_ids: list[str | None] = await asyncio.gather(
+            *(
+                self.gitlab.get_file_blob_id(
+                    project_id=project.id_project_gitlab, file_path=path, ref=UPGRADE_TARGET_BRANCH
+                )
+                for path in rendered
+            )
+        )
+        current: dict[str, str | None] = dict(zip(rendered, blob_ids, strict=True))
+
+        changed: dict[str, str | bytes] = {
+            path: content for path, content in rendered.items() if current[path] != git_blob_sha(content)
+        }
+        if not changed:
+            return TemplateUpgradeResult(id_project=project.id, status=TemplateUpgradeStatus.UP_TO_DATE)
+
+        branch: str = upgrade_branch(changed)
+        open_upgrades: list[GitLabMergeRequest] = [
+            request
+            for request in await self.gitlab.list_open_merge_requests(
+                project_id=project.id_project_gitlab, target_branch=UPGRADE_TARGET_BRANCH
+            )
+            if request.source_branch.startswith(UPGRADE_BRANCH_PREFIX)
+        ]
+
+        for pending in open_upgrades:
+            if pending.source_branch == branch:
+                return TemplateUpgradeResult(
+                    id_project=project.id,
+                    status=TemplateUpgradeStatus.MERGE_REQUEST_PENDING,
+                    changed_files=sorted(changed),
+                    merge_request_url=pending.web_url,
+                )
+
+        # A previous run may have pushed the branch and failed before opening the merge request
+        if not await self.gitlab.branch_exists(project_id=project.id_project_gitlab, branch_name=branch):
+            await self.gitlab.commit_files(
+                project_id=project.id_project_gitlab,
+                branch=branch,
+                start_branch=UPGRADE_TARGET_BRANCH,
+                files=changed,
+                existing_paths=frozenset(path for path in changed if current[path] is not None),
+                commit_message=UPGRADE_COMMIT_MESSAGE,
+            )
+
+        merge_request: GitLabMergeRequest = await self.gitlab.create_merge_request(
+            project_id=project.id_project_gitlab,
+            source_branch=branch,
+            target_branch=UPGRADE_TARGET_BRANCH,
+            title=UPGRADE_COMMIT_MESSAGE,
+            description="Files re-rendered from the current platform templates:\n\n"
+            + "\n".join(f"- `{path}`" for path in sorted(changed)),
+        )
+
+        for superseded in open_upgrades:
+            await self.gitlab.close_merge_request(
+                project_id=project.id_project_gitlab, merge_request_iid=superseded.iid
+            )
+
+        return TemplateUpgradeResult(
+            id_project=project.id,
+            status=TemplateUpgradeStatus.MERGE_REQUEST_OPENED,
+            changed_files=sorted(changed),
+            merge_request_url=merge_request.web_url,
+        )
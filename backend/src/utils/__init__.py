@@ -1,15 +1,48 @@
+from .archive import ZIP_MEDIA_TYPE, zip_stream
+from .drain import TaskDrain, provisioning_drain
+from .http_cache import (
+    DEFAULT_CACHE_CONTROL,
+    CachedResponse,
+    ResponseCache,
+    compute_etag,
+    conditional_response,
+    response_cache,
+)
 from .security import (
     create_access_token,
     decode_access_token,
     hash_password,
     verify_password,
 )
+from .server_timing import ServerTimings, current_server_timings, server_timing
+from .streaming import NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, ndjson_stream, sse_stream
 from .text import slugify
+from .ttl_cache import TTLCache
+from .upstream_limits import UpstreamLimits
 
 __all__: list[str] = [
+    "DEFAULT_CACHE_CONTROL",
+    "NDJSON_MEDIA_TYPE",
+    "SSE_MEDIA_TYPE",
+    "ZIP_MEDIA_TYPE",
+    "CachedResponse",
+    "ResponseCache",
+    "ServerTimings",
+    "TaskDrain",
+    "TTLCache",
+    "UpstreamLimits",
+    "compute_etag",
+    "conditional_response",
+    "current_server_timings",
+    "provisioning_drain",
+    "response_cache",
+    "server_timing",
     "hash_password",
     "verify_password",
     "decode_access_token",
     "create_access_token",
+    "ndjson_stream",
+    "sse_stream",
+    "zip_stream",
     "slugify",
 ]
@@ -0,0 +1,41 @@
+from collections.abc import Iterable, Iterator
+from zipfile import ZIP_DEFLATED, ZipFile
+
+ZIP_MEDIA_TYPE: str = "application/zip"
+
+
+class _ChunkBuffer:
+    """Write-only, unseekable sink so ``ZipFile`` streams entries with data descriptors."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data: bytes = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def zip_stream(files: Iterable[tuple[str, str]], root: str = "") -> Iterator[bytes]:
+    """Yield a zip archive chunk by chunk; only the entry being compressed is held in memory."""
+    buffer = _ChunkBuffer()
+    prefix: str = f"{root}/" if root else ""
+
+    with ZipFile(buffer, mode="w", compression=ZIP_DEFLATED) as archive:
+        for path, content in files:
+            archive.writestr(f"{prefix}{path}", content)
+            if chunk := buffer.drain():
+                yield chunk
+
+    if chunk := buffer.drain():
+        yield chunk
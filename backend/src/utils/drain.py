@@ -0,0 +1,95 @@
+import asyncio
+import signal
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any, TypeVar
+
+from src.errors import DrainingError
+
+T = TypeVar("T")
+
+
+@dataclass
+class TaskDrain:
+    """Tracks work that must outlive the request that started it, so shutdown can wait for it.
+
+    Once closed, ``submit`` refuses new work; ``drain`` waits for the rest until the deadline
+    measured from ``close`` and cancels whatever is still running.
+    """
+
+    _tasks: set[asyncio.Task[Any]] = field(default_factory=set, init=False, repr=False)
+    _closed_at: float | None = field(default=None, init=False, repr=False)
+
+    @property
+    def accepting(self) -> bool:
+        return self._closed_at is None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def close(self) -> None:
+        if self._closed_at is None:
+            self._closed_at = time.monotonic()
+
+    def close_on(self, *signals: signal.Signals) -> None:
+        """Close as soon as one of ``signals`` arrives, then defer to the handler already installed.
+
+        Under uvicorn that is the server's own exit handler, so closing happens before connections
+        stop. Signal handlers can only be installed from the main thread; elsewhere this is a no-op.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        for sig in signals:
+            signal.signal(sig, self._closing_handler(previous=signal.getsignal(sig)))
+
+    def _closing_handler(self, previous: Any) -> Callable[[int, FrameType | None], None]:
+        def handler(signum: int, frame: FrameType | None) -> None:
+            self.close()
+
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(signum, signal.SIG_DFL)
+                signal.raise_signal(signum)
+
+        return handler
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+        if not self.accepting:
+            coroutine.close()
+            raise DrainingError()
+
+        task: asyncio.Task[T] = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._forget)
+        return task
+
+    def _forget(self, task: asyncio.Task[Any]) -> None:
+        self._tasks.discard(task)
+        # The submitter may have stopped awaiting (client disconnect); mark the outcome as retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    async def drain(self, deadline_seconds: float) -> int:
+        """Wait for in-flight work, returning how many tasks had to be cancelled."""
+        self.close()
+        closed_at: float = self._closed_at or time.monotonic()
+
+        remaining: float = max(0.0, closed_at + deadline_seconds - time.monotonic())
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=remaining)
+
+        pending: list[asyncio.Task[Any]] = list(self._tasks)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        return len(pending)
+
+
+provisioning_drain: TaskDrain = TaskDrain()
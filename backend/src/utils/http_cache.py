@@ -0,0 +1,109 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from hashlib import sha256
+from uuid import UUID
+
+from fastapi import Request, Response, status
+
+from src.configurations import configuration
+
+DEFAULT_CACHE_CONTROL: str = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    content: bytes
+    etag: str
+    expires_at: float
+    media_type: str = "application/json"
+
+
+def compute_etag(content: bytes) -> str:
+    return f'"{sha256(content).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match: str | None = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2)
+    candidates: set[str] = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag in candidates
+
+
+def conditional_response(request: Request, cached: CachedResponse, cache_control: str) -> Response:
+    headers: dict[str, str] = {"ETag": cached.etag, "Cache-Control": cache_control}
+
+    if is_not_modified(request=request, etag=cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=cached.content, media_type=cached.media_type, headers=headers)
+
+
+@dataclass
+class ResponseCache:
+    """Per-process cache of rendered bodies; ``invalidate_user`` does not reach the other server workers."""
+
+    ttl_seconds: float
+    max_entries: int
+    _entries: OrderedDict[tuple[UUID, str], CachedResponse] = field(default_factory=OrderedDict, init=False)
+
+    def get(self, user_id: UUID, route: str) -> CachedResponse | None:
+        key: tuple[UUID, str] = (user_id, route)
+        cached: CachedResponse | None = self._entries.get(key)
+
+        if cached is None:
+            return None
+
+        if cached.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return cached
+
+    def set(self, user_id: UUID, route: str, content: bytes) -> CachedResponse:
+        cached = CachedResponse(
+            content=content,
+            etag=compute_etag(content),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+        self._entries[(user_id, route)] = cached
+        self._entries.move_to_end((user_id, route))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return cached
+
+    async def get_or_set(
+        self,
+        user_id: UUID,
+        route: str,
+        produce: Callable[[], Awaitable[bytes]],
+    ) -> CachedResponse:
+        cached: CachedResponse | None = self.get(user_id=user_id, route=route)
+        if cached is not None:
+            return cached
+
+        return self.set(user_id=user_id, route=route, content=await produce())
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache: ResponseCache = ResponseCache(
+    ttl_seconds=configuration.RESPONSE_CACHE_TTL,
+    max_entries=configuration.RESPONSE_CACHE_MAX_ENTRIES,
+)
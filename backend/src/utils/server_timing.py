@@ -0,0 +1,46 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+SERVER_TIMING_ATTRIBUTE_PREFIX: str = "server_timing."
+
+
+@dataclass
+class ServerTimings:
+    """Milliseconds per named step of one request, summed when a step repeats (e.g. commit batches)."""
+
+    durations: dict[str, float] = field(default_factory=dict)
+
+    def record(self, name: str, milliseconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + milliseconds
+
+    def header(self) -> str:
+        return ", ".join(f"{name};dur={milliseconds:.1f}" for name, milliseconds in self.durations.items())
+
+    def attributes(self) -> dict[str, float]:
+        return {
+            f"{SERVER_TIMING_ATTRIBUTE_PREFIX}{name}": round(milliseconds, 1)
+            for name, milliseconds in self.durations.items()
+        }
+
+
+# Tasks copy the context, so work submitted from the request (e.g. the provisioning drain) records into it too;
+# concurrent tasks of one request (batch items) clear it in their own copy instead of summing into one header.
+current_server_timings: ContextVar[ServerTimings | None] = ContextVar("current_server_timings", default=None)
+
+
+@contextmanager
+def server_timing(name: str) -> Iterator[None]:
+    """Time the block as ``name`` in the current request's ``Server-Timing``; a no-op outside a request."""
+    timings: ServerTimings | None = current_server_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(name, (time.perf_counter() - started) * 1000)
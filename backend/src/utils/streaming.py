@@ -0,0 +1,18 @@
+from collections.abc import AsyncIterator
+
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+SSE_MEDIA_TYPE: str = "text/event-stream"
+
+
+async def ndjson_stream(events: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    async for event in events:
+        yield event.model_dump_json(by_alias=True).encode() + b"\n"
+
+
+async def sse_stream(events: AsyncIterator[BaseModel], event_name: str | None = None) -> AsyncIterator[bytes]:
+    async for event in events:
+        name: str | None = event_name or getattr(event, "section", None)
+        prefix: bytes = f"event: {name}\n".encode() if name else b""
+        yield prefix + b"data: " + event.model_dump_json(by_alias=True).encode() + b"\n\n"
@@ -24,12 +24,18 @@ class TemplateGenerator:
     ) -> str:
         template: Template = self.environment.get_template(template_path.as_posix())
 
-        rendered_content: str = template.render(
-            template_data.model_dump() if template_data else {}
-        )
+        rendered_content: str = template.render(template_data.model_dump() if template_data else {})
 
         return rendered_content
 
+    def precompile(self, prefixes: tuple[str, ...]) -> int:
+        """Compile every template whose file name starts with one of ``prefixes`` into the environment cache."""
+        names: list[str] = [name for name in self.environment.list_templates() if Path(name).name.startswith(prefixes)]
+        for name in names:
+            self.environment.get_template(name)
+
+        return len(names)
+
     def template_exists(self, template_path: Path) -> bool:
         full_path: Path = self.templates_directory / template_path
         return full_path.exists()
@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TTLCache[K: Hashable, V]:
+    """Bounded LRU cache whose entries expire ``ttl_seconds`` after being set."""
+
+    ttl_seconds: float
+    max_entries: int = 4096
+    _entries: OrderedDict[K, tuple[float, V]] = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def get(self, key: K) -> V | None:
+        entry: tuple[float, V] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        found: dict[K, V] = {}
+        for key in keys:
+            value: V | None = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
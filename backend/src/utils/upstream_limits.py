@@ -0,0 +1,27 @@
+import asyncio
+from dataclasses import dataclass
+
+
+@dataclass
+class UpstreamLimits:
+    """Process-wide concurrency budget per upstream, shared by every provisioning run.
+
+    Each provisioning stage holds only its own upstream's slot, so a batch pipelines through
+    GitLab, SonarQube and Logfire instead of hitting any of them with the whole batch at once.
+    ``provisioning`` caps whole runs, taken before the per-name advisory lock: every run holds a
+    dedicated connection for that lock plus one for its journal, so it must stay well below the pool.
+    """
+
+    gitlab: asyncio.Semaphore
+    sonarqube: asyncio.Semaphore
+    logfire: asyncio.Semaphore
+    provisioning: asyncio.Semaphore
+
+    @classmethod
+    def create(cls, gitlab: int, sonarqube: int, logfire: int, provisioning: int) -> "UpstreamLimits":
+        return cls(
+            gitlab=asyncio.Semaphore(gitlab),
+            sonarqube=asyncio.Semaphore(sonarqube),
+            logfire=asyncio.Semaphore(logfire),
+            provisioning=asyncio.Semaphore(provisioning),
+        )
@@ -0,0 +1,11 @@
+from .provisioning_recovery import provisioning_recovery, recover_interrupted_provisioning
+from .reconciliation import reconciliation_loop, run_reconciliation
+from .template_upgrade import run_template_upgrade
+
+__all__: list[str] = [
+    "provisioning_recovery",
+    "reconciliation_loop",
+    "recover_interrupted_provisioning",
+    "run_reconciliation",
+    "run_template_upgrade",
+]
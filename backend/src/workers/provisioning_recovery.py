@@ -0,0 +1,91 @@
+"""Roll back provisioning chains that a shutdown or crash interrupted.
+
+Run with ``uv run python -m src.workers.provisioning_recovery``.
+"""
+
+import asyncio
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+
+import logfire
+
+from src.configurations import configuration
+from src.containers import Container
+from src.database import database
+from src.database.models import ProvisioningJob
+from src.enums import ProvisioningJobStatus
+from src.errors import GitLabError, GitLabNotFoundError, SonarQubeError, SonarQubeNotFoundError
+from src.repositories import ProjectRepository, ProvisioningJobRepository
+
+
+async def _roll_back(container: Container, job: ProvisioningJob) -> None:
+    if job.id_project_gitlab is not None:
+        with suppress(GitLabNotFoundError):
+            await container.gitlab.delete_project(project_id=job.id_project_gitlab)
+
+    if job.sonarqube_project_key:
+        with suppress(SonarQubeNotFoundError):
+            await container.sonarqube.delete_project(project_key=job.sonarqube_project_key)
+
+    if job.id_project_logfire:
+        logfire.warn(
+            "Logfire project {id} of interrupted job {job_id} is left for reconciliation",
+            id=job.id_project_logfire,
+            job_id=job.id,
+        )
+
+
+async def recover_interrupted_provisioning(container: Container) -> int:
+    stale_before: datetime = datetime.now(UTC) - timedelta(seconds=configuration.PROVISIONING_STALE_SECONDS)
+    recovered: int = 0
+
+    async with database.session_scope() as session:
+        repository = ProvisioningJobRepository(session=session)
+        project_repository = ProjectRepository(session=session)
+
+        for job in await repository.claim_interrupted(stale_before=stale_before):
+            # A row means the chain committed; its upstream projects are live, whatever the job says
+            if await project_repository.exists_by_name(name=job.name) or (
+                job.id_project_gitlab is not None
+                and await project_repository.exists_by_gitlab_id(gitlab_project_id=job.id_project_gitlab)
+            ):
+                await repository.update(job_id=job.id, status=ProvisioningJobStatus.COMPLETED)
+                continue
+
+            try:
+                await _roll_back(container=container, job=job)
+
+            except (GitLabError, SonarQubeError) as e:
+                logfire.error("Failed to roll back provisioning job {job_id}: {error}", job_id=job.id, error=str(e))
+                continue
+
+            await repository.update(job_id=job.id, status=ProvisioningJobStatus.ROLLED_BACK)
+            recovered += 1
+
+    if recovered:
+        logfire.info("Rolled back {count} interrupted provisioning jobs", count=recovered)
+    return recovered
+
+
+async def provisioning_recovery(container: Container) -> None:
+    try:
+        await recover_interrupted_provisioning(container)
+
+    except Exception:
+        logfire.exception("Provisioning recovery failed")
+
+
+async def main() -> None:
+    container: Container = Container.create()
+
+    try:
+        await recover_interrupted_provisioning(container)
+
+    finally:
+        await container.aclose()
+        await database.dispose()
+
+
+if __name__ == "__main__":
+    logfire.configure()
+    asyncio.run(main())
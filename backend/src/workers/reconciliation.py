@@ -0,0 +1,72 @@
+"""Periodic project reconciliation; also runnable once, e.g. from cron.
+
+Run with ``uv run python -m src.workers.reconciliation``.
+"""
+
+import asyncio
+
+import logfire
+
+from src.configurations import configuration
+from src.containers import Container
+from src.database import database
+from src.schemas import ReconciliationReport
+from src.services import ReconciliationService
+
+
+async def run_reconciliation(container: Container) -> ReconciliationReport | None:
+    """Reconcile once; every worker runs the loop, so a run already under way elsewhere is skipped."""
+    async with database.advisory_lock(name="reconciliation") as acquired:
+        if not acquired:
+            logfire.info("Project reconciliation already running elsewhere, skipping")
+            return None
+
+        service = ReconciliationService(
+            gitlab=container.gitlab,
+            sonarqube=container.sonarqube,
+            logfire=container.logfire,
+            concurrency=configuration.RECONCILIATION_CONCURRENCY,
+            delete_orphans=configuration.RECONCILIATION_DELETE_ORPHANS,
+            grace_seconds=configuration.RECONCILIATION_GRACE_SECONDS,
+        )
+
+        with logfire.span("project reconciliation"):
+            report: ReconciliationReport = await service.reconcile()
+
+    logfire.info(
+        "Project reconciliation finished in {duration:.1f}s with {drifts} drifts",
+        duration=report.duration_seconds,
+        drifts=len(report.drifts),
+        database_projects=report.database_projects,
+        gitlab_projects=report.gitlab_projects,
+        sonarqube_projects=report.sonarqube_projects,
+        logfire_projects=report.logfire_projects,
+    )
+    return report
+
+
+async def reconciliation_loop(container: Container, interval_seconds: float) -> None:
+    while True:
+        try:
+            await run_reconciliation(container)
+
+        except Exception:
+            logfire.exception("Project reconciliation failed")
+
+        await asyncio.sleep(interval_seconds)
+
+
+async def main() -> None:
+    container: Container = Container.create()
+
+    try:
+        await run_reconciliation(container)
+
+    finally:
+        await container.aclose()
+        await database.dispose()
+
+
+if __name__ == "__main__":
+    logfire.configure()
+    asyncio.run(main())
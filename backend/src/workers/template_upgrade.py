@@ -0,0 +1,46 @@
+"""Open template upgrade merge requests for every active project.
+
+Run with ``uv run python -m src.workers.template_upgrade``.
+"""
+
+import asyncio
+from collections import Counter
+
+import logfire
+
+from src.configurations import configuration
+from src.containers import Container
+from src.database import database
+from src.schemas import TemplateUpgradeResult
+from src.services import TemplateUpgradeService
+
+
+async def run_template_upgrade(container: Container) -> list[TemplateUpgradeResult]:
+    service = TemplateUpgradeService(
+        gitlab=container.gitlab,
+        builders=container.builders,
+        concurrency=configuration.TEMPLATE_UPGRADE_CONCURRENCY,
+    )
+
+    with logfire.span("template upgrade"):
+        results: list[TemplateUpgradeResult] = await service.upgrade_all()
+
+    statuses: Counter[str] = Counter(result.status for result in results)
+    logfire.info("Template upgrade finished for {projects} projects", projects=len(results), statuses=dict(statuses))
+    return results
+
+
+async def main() -> None:
+    container: Container = Container.create()
+
+    try:
+        await run_template_upgrade(container)
+
+    finally:
+        await container.aclose()
+        await database.dispose()
+
+
+if __name__ == "__main__":
+    logfire.configure()
+    asyncio.run(main())